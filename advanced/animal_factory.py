@@ -0,0 +1,73 @@
+# Import the required libraries
+from itertools import islice
+
+from employee_loader import read_rows
+from inheritance import animal_classes
+from report_writer import write_report
+
+
+def build_animals(rows, *, batch_size: int = 10000):
+    """
+    Turn a stream of tagged rows into lists of at most batch_size animals of the right classes
+
+    The rows of each batch are grouped by class, and each class builds all of its animals in one call.
+    No messages are displayed.
+
+    :param rows: (iterable) dictionaries with type, name, age, and any fields the class adds, such as breed
+    :param batch_size: (int) the largest number of animals built at once
+
+    :return: a generator of lists of animals, in the same order as the rows
+    """
+    rows = iter(rows)
+
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+
+        # The positions and rows of every class in this batch
+        groups = {}
+        for position, row in enumerate(batch):
+            tag = row.get("type") or "Animal"
+            if tag not in animal_classes:
+                raise Exception(f"Unable to build a {tag}, it is not a registered Animal class.")
+            positions, class_rows = groups.setdefault(tag, ([], []))
+            positions.append(position)
+            class_rows.append(row)
+
+        animals = [None] * len(batch)
+        for tag, (positions, class_rows) in groups.items():
+            for position, animal in zip(positions, animal_classes[tag].from_rows(class_rows)):
+                animals[position] = animal
+        yield animals
+
+
+def load_animals(path: str, *, batch_size: int = 10000) -> list:
+    """
+    Read every animal in a file
+
+    :param path: (str) a .csv file with a header row, or a .jsonl file with one tagged row per line
+    :param batch_size: (int) the largest number of animals built at once
+
+    :return: the list of animals, in the same order as the file
+    """
+    animals = []
+    for batch in build_animals(read_rows(path), batch_size=batch_size):
+        animals.extend(batch)
+    return animals
+
+
+def save_animals(animals, path: str) -> int:
+    """
+    Write animals as tagged rows that load_animals can read back
+
+    :param animals: (iterable) Animal, Dog, or other registered Animal subclass objects
+    :param path: (str) a .csv or .jsonl file
+
+    :return: the number of animals written
+    """
+    if path.endswith(".csv"):
+        return write_report(animals, path, format="csv")
+    if path.endswith(".jsonl"):
+        return write_report(animals, path, format="jsonl")
+    raise Exception(f"Unable to write {path}, only .csv and .jsonl files are supported.")
@@ -0,0 +1,74 @@
+# Import the required libraries
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Allow the files in the advanced folder to be imported
+sys.path.append(sys.path[0] + '/..')
+from animal_factory import build_animals, save_animals
+from employee_loader import read_rows
+from events import NULL_SINK
+from inheritance import Animal, Dog
+
+
+# To run the benchmark, execute the following code in the terminal :
+#   python3 advanced/benchmarks/animal_factory_benchmark.py 1000000
+
+
+def build_one_at_a_time(rows: list) -> list:
+    """ Build every animal with an if/else on its type and one __init__ call per row """
+    animals = []
+    for row in rows:
+        if row["type"] == "Dog":
+            animals.append(Dog(name=row["name"], age=int(row["age"]), breed=row["breed"], sink=NULL_SINK))
+        else:
+            animals.append(Animal(name=row["name"], age=int(row["age"]), sink=NULL_SINK))
+    return animals
+
+
+def main():
+    # args is a list of the command line arguments, the first one is the number of rows
+    args = sys.argv[1:]
+    count = int(args[0]) if args else 1000000
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "animals.jsonl")
+        with open(path, "w") as file:
+            for number in range(count):
+                row = {"type": "Dog", "name": f"dog{number}", "breed": "German Shepard", "age": number % 15}
+                if number % 2:
+                    row = {"type": "Animal", "name": f"animal{number}", "age": number % 15}
+                file.write(json.dumps(row) + "\n")
+
+        # Reading the file takes the same time either way, so it is timed on its own
+        start = time.perf_counter()
+        rows = list(read_rows(path))
+        read_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        one_at_a_time = build_one_at_a_time(rows)
+        one_at_a_time_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batched = [animal for batch in build_animals(rows) for animal in batch]
+        batched_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        save_animals(batched, os.path.join(folder, "saved.jsonl"))
+        save_seconds = time.perf_counter() - start
+
+    print(f"<---------- {count} Mixed Rows ---------->")
+    for label, seconds in (
+        ("Reading the rows:", read_seconds),
+        ("if/else and __init__ per row:", one_at_a_time_seconds),
+        ("Batched per class factory:", batched_seconds),
+        ("Saved back to rows:", save_seconds),
+    ):
+        print(f"{label:<31}{seconds:>7.2f} seconds ({count / seconds:.0f} rows/sec)")
+    print(f"Same animals: {one_at_a_time == batched}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# Import the required libraries
+import sys
+import time
+import tracemalloc
+
+# Allow the files in the advanced folder to be imported
+sys.path.append(sys.path[0] + '/..')
+from breeds import breed_registry
+from events import NULL_SINK, use_sink
+from inheritance import Dog
+
+
+# To run the benchmark, execute the following code in the terminal :
+#   python3 advanced/benchmarks/breed_memory_benchmark.py 1000000
+
+
+class DogWithBreedDetails:
+    """ A dog that keeps its own copy of every breed detail in its __dict__, the way a dog loaded from rows would """
+
+    def __init__(self, *, name: str, age: int, breed):
+        self.name = name.capitalize()
+        self.age = age
+        self.breed = breed.name
+
+        # Values read from a file are new objects for every row, which float() recreates here
+        self.min_weight = float(breed.min_weight)
+        self.max_weight = float(breed.max_weight)
+        self.min_life_expectancy = float(breed.min_life_expectancy)
+        self.max_life_expectancy = float(breed.max_life_expectancy)
+        self.energy = breed.energy
+
+
+def measure(create, count: int) -> tuple:
+    """
+    Create count dogs and measure them
+
+    :param create: (function) called with a number, returning a new dog
+    :param count: (int) how many dogs to create
+
+    :return: the megabytes used by the dogs and the seconds taken to create them
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    dogs = [create(number) for number in range(count)]
+    seconds = time.perf_counter() - start
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del dogs
+    return used / 1024 / 1024, seconds
+
+
+def main():
+    # args is a list of the command line arguments, the first one is the number of dogs
+    args = sys.argv[1:]
+    count = int(args[0]) if args else 1000000
+
+    breeds = [
+        breed_registry.register("German Shepard"),
+        breed_registry.register(
+            "Beagle", min_weight=20, max_weight=30, min_life_expectancy=10, max_life_expectancy=15, energy=4
+        ),
+        breed_registry.register(
+            "Bulldog", min_weight=40, max_weight=50, min_life_expectancy=8, max_life_expectancy=10, energy=2
+        ),
+    ]
+    names = [breed.name for breed in breeds]
+
+    with use_sink(NULL_SINK):
+        before_mb, before_seconds = measure(
+            lambda number: DogWithBreedDetails(name="bobbers", age=number % 15, breed=breeds[number % 3]), count
+        )
+        after_mb, after_seconds = measure(
+            lambda number: Dog(name="bobbers", age=number % 15, breed=names[number % 3]), count
+        )
+
+    print(f"<---------- {count} Dogs ---------->")
+    print(f"Breed details on every dog:  {before_mb:>8.1f} MB, {before_seconds:.2f} seconds")
+    print(f"Shared breeds by id:         {after_mb:>8.1f} MB, {after_seconds:.2f} seconds")
+    print(f"{before_mb / after_mb:.1f}x less memory")
+
+
+if __name__ == "__main__":
+    main()
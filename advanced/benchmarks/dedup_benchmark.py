@@ -0,0 +1,52 @@
+# Import the required libraries
+import random
+import string
+import sys
+import time
+
+# Allow the files in the advanced folder to be imported
+sys.path.append(sys.path[0] + '/..')
+from employee_dedup import find_duplicates
+from employee_table import EmployeeTable
+
+
+# To run the benchmark, execute the following code in the terminal :
+#   python3 advanced/benchmarks/dedup_benchmark.py 100000 1000000
+
+def make_roster(count: int) -> EmployeeTable:
+    """ Build a roster where roughly one employee in ten is a re-cased or re-tagged copy of another """
+    table = EmployeeTable()
+    random.seed(count)
+    names = []
+    for number in range(count):
+        original = random.randrange(number) if number and random.random() < 0.1 else number
+        if original == number:
+            names.append(" ".join("".join(random.choices(string.ascii_lowercase, k=7)) for _ in range(2)))
+        else:
+            names.append(names[original])
+        name = names[original]
+        email = f"employee{original}@company.com"
+        if original != number:
+            name = name.upper()
+            email = email.replace("@", "+merged@")
+        table.append_fields(full_name=name, age=20 + original % 45, salary=1000, email=email)
+    return table
+
+
+def main():
+    # args is a list of the command line arguments, every one is a roster size
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10000, 100000]
+
+    for size in sizes:
+        roster = make_roster(size)
+        start = time.perf_counter()
+        clusters = find_duplicates(roster)
+        seconds = time.perf_counter() - start
+        print(
+            f"{size:>10} rows: {len(clusters):>8} clusters in {seconds:.2f} seconds "
+            f"({size / seconds:,.0f} rows/sec)"
+        )
+
+
+if __name__ == "__main__":
+    main()
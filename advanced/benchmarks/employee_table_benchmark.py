@@ -0,0 +1,100 @@
+# Import the required libraries
+import sys
+import time
+import tracemalloc
+
+# Allow the files in the advanced folder to be imported
+sys.path.append(sys.path[0] + '/..')
+from custom_object import Employee
+from events import NULL_SINK, use_sink
+from employee_table import EmployeeTable
+
+
+# To run the benchmark, execute the following code in the terminal :
+#   python3 advanced/benchmarks/employee_table_benchmark.py 1000000
+
+def build_employees(count: int) -> list:
+    """
+    Create a list of employees with varied ages and salaries
+
+    :param count: (int) the number of employees to create
+
+    :return: the list of employees
+    """
+    # Hide the message displayed for every new employee
+    with use_sink(NULL_SINK):
+        return [
+            Employee(
+                first_name=f"first{number}",
+                last_name=f"last{number}",
+                age=18 + number % 50,
+                salary=30000 + number % 90000,
+                email=f"employee{number}@company.com"
+            )
+            for number in range(count)
+        ]
+
+
+def measure_memory(build) -> tuple:
+    """
+    Measure how many bytes are still allocated after calling build
+
+    :param build: (function) creates and returns the object being measured
+
+    :return: the object that was built and the number of bytes it uses
+    """
+    tracemalloc.start()
+    result = build()
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, used
+
+
+def time_it(function, repeat: int = 5) -> float:
+    """ Return the best time in seconds of calling the function several times """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def list_aggregates(employees: list) -> tuple:
+    """ Compute the same aggregates as the table, one Employee at a time """
+    total = sum(employee.salary for employee in employees)
+    histogram = {}
+    for employee in employees:
+        group = employee.age // 10 * 10
+        histogram[group] = histogram.get(group, 0) + 1
+    return total, total / len(employees), histogram
+
+
+def table_aggregates(table: EmployeeTable) -> tuple:
+    """ Compute the aggregates using the table's columns """
+    return table.total_salary(), table.mean_salary(), table.age_histogram()
+
+
+def main():
+    # args is a list of the command line arguments, the first one is the number of employees
+    args = sys.argv[1:]
+    count = int(args[0]) if args else 100000
+
+    # The source employees are built before measuring so only the containers are compared
+    source = build_employees(count)
+
+    employees, list_bytes = measure_memory(lambda: build_employees(count))
+    table, table_bytes = measure_memory(lambda: EmployeeTable(source))
+
+    list_seconds = time_it(lambda: list_aggregates(employees))
+    table_seconds = time_it(lambda: table_aggregates(table))
+
+    print(f"<---------- {count} Employees ---------->")
+    print(f"list[Employee] memory per row: {list_bytes / count:.1f} bytes")
+    print(f"EmployeeTable memory per row:  {table_bytes / count:.1f} bytes")
+    print(f"list[Employee] aggregates:     {list_seconds * 1000:.2f} ms")
+    print(f"EmployeeTable aggregates:      {table_seconds * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
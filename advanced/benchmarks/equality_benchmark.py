@@ -0,0 +1,68 @@
+# Import the required libraries
+import sys
+import timeit
+
+# Allow the files in the advanced folder to be imported
+sys.path.append(sys.path[0] + '/..')
+from custom_object import Employee, employee_fields, equal_as_string
+from events import NULL_SINK, use_sink
+from inheritance import Dog
+
+
+# To run the benchmark, execute the following code in the terminal :
+#   python3 advanced/benchmarks/equality_benchmark.py
+
+def time_per_call(statement, number: int) -> float:
+    """ Return the best time in microseconds of running the statement once """
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1000000
+
+
+def compare(label: str, first, second, number: int) -> None:
+    """
+    Display how long == takes with field equality and with the original str equality
+
+    :param label: (str) the name displayed for the class
+    :param first: the object on the left of ==
+    :param second: the object on the right of ==
+    :param number: (int) how many comparisons to time
+    """
+    string_time = time_per_call(lambda: equal_as_string(first, second), number)
+    field_time = time_per_call(lambda: first == second, number)
+
+    print(
+        f"{label} ==: {string_time:.3f} us as strings, {field_time:.3f} us as fields "
+        f"({string_time / field_time:.1f}x faster)"
+    )
+
+
+def main():
+    # Hide the message displayed for every new object
+    with use_sink(NULL_SINK):
+        first = Employee(first_name="Lizzie", last_name="Altena", age=25, salary=1000)
+        second = Employee.from_fields(
+            full_name=first.full_name,
+            age=first.age,
+            salary=first.salary,
+            created_datetime=first.created_datetime
+        )
+        first_dog = Dog(name="Bobbers", age=5)
+        second_dog = Dog(name="Bobbers", age=5)
+        roster = [
+            Employee(first_name=f"first{number % 1000}", last_name="last", age=30, salary=number % 1000)
+            for number in range(100000)
+        ]
+
+    compare("Employee", first, second, 100000)
+    compare("Dog", first_dog, second_dog, 100000)
+
+    # Deduplicating a roster hashes a key for every employee once and compares keys on collisions
+    string_time = min(timeit.repeat(lambda: set(map(str, roster)), number=1, repeat=3))
+    field_time = min(timeit.repeat(lambda: set(map(employee_fields, roster)), number=1, repeat=3))
+    print(
+        f"set() of {len(roster)} employees: {string_time * 1000:.1f} ms as strings, "
+        f"{field_time * 1000:.1f} ms as fields ({string_time / field_time:.1f}x faster)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# Import the required libraries
+import math
+import sys
+import time
+
+# Allow the files in the advanced folder to be imported
+sys.path.append(sys.path[0] + '/..')
+from custom_object import Employee
+from employee_table import EmployeeTable
+from events import NULL_SINK, use_sink
+from payroll import Payroll
+
+
+# To run the benchmark, execute the following code in the terminal :
+#   python3 advanced/benchmarks/payroll_benchmark.py 1000000
+
+# (youngest age, percent) raise bands used by both approaches
+BANDS = [(18, 4.0), (30, 3.0), (45, 2.5), (60, 1.5)]
+
+
+def loop_payroll(employees: list) -> float:
+    """ Work out the raises one employee at a time and return the new total """
+    total = 0
+    for employee in employees:
+        percent = 0.0
+        for start, band_percent in BANDS:
+            if employee.age >= start:
+                percent = band_percent
+        salary = min(employee.salary * (1 + percent / 100), 150000)
+        # Halves round up, the same as Payroll.round
+        total += math.floor(salary / 100 + 0.5) * 100
+    return total
+
+
+def vectorized_payroll(payroll: Payroll) -> float:
+    """ Work out the same raises for every employee at once and return the new total """
+    return payroll.raise_by_age_band(BANDS).cap(150000).round(to=100).total()
+
+
+def main():
+    # args is a list of the command line arguments, the first one is the number of employees
+    args = sys.argv[1:]
+    count = int(args[0]) if args else 1000000
+
+    with use_sink(NULL_SINK):
+        employees = [
+            Employee(first_name="first", last_name="last", age=18 + number % 50, salary=30000 + number % 120000)
+            for number in range(count)
+        ]
+    table = EmployeeTable(employees)
+
+    start = time.perf_counter()
+    loop_total = loop_payroll(employees)
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized_total = vectorized_payroll(Payroll.from_employees(employees))
+    from_employees_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized_payroll(Payroll.from_table(table))
+    from_table_seconds = time.perf_counter() - start
+
+    print(f"<---------- {count} Employees ---------->")
+    print(f"Per-object loop:               {loop_seconds * 1000:>10.1f} ms")
+    print(f"Vectorized, copied from list:  {from_employees_seconds * 1000:>10.1f} ms")
+    print(f"Vectorized, copied from table: {from_table_seconds * 1000:>10.1f} ms")
+    print(f"Totals match: {loop_total == vectorized_total}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# Import the required libraries
+import sys
+import threading
+import time
+
+# Allow the files in the advanced folder to be imported
+sys.path.append(sys.path[0] + '/..')
+from custom_object import Employee
+from employee_registry import EmployeeRegistry
+from events import NULL_SINK, use_sink
+
+
+# To run the benchmark, execute the following code in the terminal :
+#   python3 advanced/benchmarks/registry_benchmark.py 200000
+
+# Note that Python threads share one interpreter lock, so more threads mostly measure how much time is
+# lost waiting on the registry's locks rather than gaining speed from running on more cores
+
+
+def run_workers(registry: EmployeeRegistry, threads: int, operations: int, employees: int) -> float:
+    """
+    Split the operations across threads that each add, update, and read employees
+
+    :return: the operations completed per second
+    """
+    per_thread = operations // threads
+
+    def work(thread: int):
+        for step in range(per_thread):
+            employee_id = (thread * per_thread + step) % employees
+            if step % 10 == 0:
+                registry.get(employee_id)
+            else:
+                registry.update_with(employee_id, lambda employee: {"salary": employee.salary + 1})
+
+    workers = [threading.Thread(target=work, args=(thread,)) for thread in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return per_thread * threads / (time.perf_counter() - start)
+
+
+def main():
+    # args is a list of the command line arguments, the first one is the number of operations
+    args = sys.argv[1:]
+    operations = int(args[0]) if args else 200000
+    employees = 10000
+
+    print(f"<---------- {operations} Operations on {employees} Employees ---------->")
+    print(f"{'Threads':<10}{'1 lock (ops/sec)':>20}{'16 locks (ops/sec)':>22}")
+    with use_sink(NULL_SINK):
+        for threads in (1, 2, 4, 8):
+            rates = []
+            for partitions in (1, 16):
+                registry = EmployeeRegistry(partitions=partitions)
+                for number in range(employees):
+                    registry.add(number, Employee(first_name="first", last_name="last", age=30, salary=1000))
+                rates.append(run_workers(registry, threads, operations, employees))
+            print(f"{threads:<10}{rates[0]:>20.0f}{rates[1]:>22.0f}")
+
+
+if __name__ == "__main__":
+    main()
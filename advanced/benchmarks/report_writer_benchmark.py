@@ -0,0 +1,50 @@
+# Import the required libraries
+import os
+import sys
+import time
+
+# Allow the files in the advanced folder to be imported
+sys.path.append(sys.path[0] + '/..')
+from custom_object import Employee
+from events import NULL_SINK, use_sink
+from inheritance import Animal, Dog
+from report_writer import ReportWriter
+
+
+# To run the benchmark, execute the following code in the terminal :
+#   python3 advanced/benchmarks/report_writer_benchmark.py 1000000
+
+def main():
+    # args is a list of the command line arguments, the first one is the number of records
+    args = sys.argv[1:]
+    count = int(args[0]) if args else 300000
+
+    # Build a mix of records, a third of each class
+    with use_sink(NULL_SINK):
+        records = [
+            Employee(first_name=f"first{number}", last_name="last", age=30, salary=number, email="a@b.com")
+            if number % 3 == 0 else
+            Dog(name=f"dog{number}", age=number % 15) if number % 3 == 1 else
+            Animal(name=f"animal{number}", age=number % 15)
+            for number in range(count)
+        ]
+
+    with open(os.devnull, "w") as devnull:
+        # The original approach, one print per record
+        start = time.perf_counter()
+        for record in records:
+            print(record, file=devnull)
+        print_seconds = time.perf_counter() - start
+
+        for report_format in ("text", "csv", "jsonl"):
+            start = time.perf_counter()
+            with ReportWriter(devnull, format=report_format) as writer:
+                writer.write_all(records)
+            seconds = time.perf_counter() - start
+            print(f"ReportWriter {report_format:<6} {count / seconds * 60:>14,.0f} records/min")
+
+    print(f"print() loop        {count / print_seconds * 60:>14,.0f} records/min")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+# Import the required libraries
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import timeit
+
+from datetime import datetime
+
+# Allow the files in the advanced folder to be imported
+sys.path.append(sys.path[0] + '/..')
+from custom_object import Employee, employee_fields
+from employee_table import EmployeeTable
+from events import NULL_SINK, use_sink
+from inheritance import Animal, Dog
+from report_writer import ReportWriter
+from sharded_ingest import aggregate_shards
+
+
+# To run the benchmarks and compare them to the baseline, execute the following code in the terminal :
+#   make bench
+
+# To record the current results as the new baseline, execute the following code in the terminal :
+#   python3 advanced/benchmarks/run_benchmarks.py --update-baseline
+
+# The folder this file is in, where the baseline and results are kept
+BENCHMARK_FOLDER = os.path.dirname(os.path.abspath(__file__))
+
+# The benchmark every other one is scaled by, so a slower or busier machine is not counted as a regression
+CONTROL = "control"
+
+
+def time_per_call(function, *, number: int, repeat: int = 9) -> tuple:
+    """
+    Time a function several times, keeping the median run and how much the runs varied
+
+    :param function: (function) the code being timed, called with no arguments
+    :param number: (int) how many times the function is called in each run
+    :param repeat: (int) how many runs are timed
+
+    :return: the microseconds taken by a single call, and the spread of the runs as a fraction of that time
+    """
+    runs = sorted(seconds / number * 1000000 for seconds in timeit.repeat(function, number=number, repeat=repeat))
+    median = statistics.median(runs)
+
+    # The distance between the middle half of the runs, which ignores the odd run slowed by another program
+    lower, _, upper = statistics.quantiles(runs, n=4)
+    return median, (upper - lower) / median
+
+
+def control() -> int:
+    """ A fixed amount of plain Python work, timed to tell how fast the machine is running right now """
+    total = 0
+    for number in range(1000):
+        total += number * number % 7
+    return total
+
+
+def make_employees(count: int) -> list:
+    """ Create employees with varied fields, some of which are duplicates """
+    return [
+        Employee(
+            first_name=f"first{number % (count // 2 or 1)}",
+            last_name="last",
+            age=18 + number % 50,
+            salary=30000 + number % 1000,
+            sink=NULL_SINK
+        )
+        for number in range(count)
+    ]
+
+
+def single_object_benchmarks() -> dict:
+    """ Time the operations on a single Employee, Animal, and Dog """
+    employee = Employee(first_name="Lizzie", last_name="Altena", age=25, salary=1000, sink=NULL_SINK)
+    employee.update(email="lizzie@test.com")
+    same_employee = Employee.from_fields(
+        full_name=employee.full_name,
+        age=employee.age,
+        salary=employee.salary,
+        email=employee.email,
+        created_datetime=employee.created_datetime,
+        updated_datetime=employee.updated_datetime
+    )
+    animal = Animal(name="Bobbers", age=5, sink=NULL_SINK)
+    dog = Dog(name="Bobbers", age=5, sink=NULL_SINK)
+    same_dog = Dog(name="Bobbers", age=5, sink=NULL_SINK)
+
+    def dispatch():
+        # Every call goes through the class of each object to find the right method
+        for pet in (animal, dog):
+            pet.speak()
+            pet.move()
+            pet.eat()
+
+    return {
+        CONTROL: time_per_call(control, number=20000),
+        "employee_construct": time_per_call(
+            lambda: Employee(first_name="Lizzie", last_name="Altena", age=25, salary=1000, sink=NULL_SINK),
+            number=20000
+        ),
+        "employee_str": time_per_call(lambda: str(employee), number=20000),
+        "employee_repr": time_per_call(lambda: repr(employee), number=20000),
+        "employee_eq": time_per_call(lambda: employee == same_employee, number=100000),
+        "employee_fields_hash": time_per_call(lambda: hash(employee_fields(employee)), number=100000),
+        "dog_construct": time_per_call(lambda: Dog(name="Bobbers", age=5, sink=NULL_SINK), number=20000),
+        "dog_eq": time_per_call(lambda: dog == same_dog, number=100000),
+        "animal_dog_dispatch": time_per_call(dispatch, number=20000),
+    }
+
+
+def bulk_benchmarks(size: int) -> dict:
+    """
+    Time workloads over many employees
+
+    :param size: (int) the number of employees in each workload
+
+    :return: the microseconds taken by each workload and the spread of its runs, named with the size
+    """
+    employees = make_employees(size)
+    table = EmployeeTable(employees)
+    number = max(1, 100000 // size)
+
+    def report():
+        with ReportWriter(io.StringIO()) as writer:
+            writer.write_all(employees)
+
+    return {
+        f"bulk_construct_{size}": time_per_call(lambda: make_employees(size), number=number, repeat=5),
+        f"bulk_dedup_{size}": time_per_call(
+            lambda: set(map(employee_fields, employees)), number=number, repeat=5
+        ),
+        f"bulk_sort_{size}": time_per_call(
+            lambda: sorted(employees, key=lambda employee: employee.salary), number=number, repeat=5
+        ),
+        f"bulk_table_build_{size}": time_per_call(lambda: EmployeeTable(employees), number=number, repeat=5),
+        f"bulk_table_aggregate_{size}": time_per_call(
+            lambda: (table.mean_salary(), table.age_histogram()), number=number, repeat=5
+        ),
+        f"bulk_report_text_{size}": time_per_call(report, number=number, repeat=5),
+    }
+
+
+def sharded_benchmarks(*, shards: int = 4, rows: int = 20000) -> dict:
+    """
+    Time totalling the same shard files with one worker process and with one worker per shard
+
+    :param shards: (int) the number of shard files, and the most workers used
+    :param rows: (int) the number of employees in each shard
+
+    :return: the microseconds taken with each number of workers
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        paths = []
+        for shard in range(shards):
+            paths.append(os.path.join(folder, f"shard{shard}.csv"))
+            with open(paths[-1], "w") as file:
+                file.write("first_name,last_name,age,salary\n")
+                file.writelines(f"first{number},last,{18 + number % 50},{30000 + number}\n" for number in range(rows))
+
+        return {
+            "sharded_ingest_1_worker": time_per_call(lambda: aggregate_shards(paths, workers=1), number=1, repeat=5),
+            f"sharded_ingest_{shards}_workers": time_per_call(
+                lambda: aggregate_shards(paths, workers=shards), number=1, repeat=5
+            ),
+        }
+
+
+def run(sizes: list) -> dict:
+    """ Run every benchmark and return the microseconds taken by each one and the spread of its runs """
+    # Hide the messages printed while objects are created and methods are called
+    with use_sink(NULL_SINK):
+        timings = single_object_benchmarks()
+        for size in sizes:
+            timings.update(bulk_benchmarks(size))
+    timings.update(sharded_benchmarks())
+    return timings
+
+
+def find_regressions(metrics: dict, baseline: dict, threshold: float, *, spread: dict = None) -> list:
+    """
+    Compare the metrics to the baseline, allowing for how fast the machine is running and how noisy each metric is
+
+    Every metric is first scaled by how much slower or faster the control ran than in the baseline,
+    so a busy machine does not make every metric look slower.
+    A metric then regresses when it is slower than the threshold plus twice the spread of its baseline runs.
+    The spread never adds more than the threshold again, so even the noisiest metric fails at twice the threshold.
+
+    :param metrics: (dict) the microseconds taken by each benchmark now
+    :param baseline: (dict) the microseconds taken by each benchmark in the baseline
+    :param threshold: (float) how much slower a metric may get, 0.25 allows 25% slower
+    :param spread: (dict) how much the baseline runs of each metric varied as a fraction of its time,
+        the current runs are not used since a regression can make them noisy too
+
+    :return: a message for every metric slower than the threshold allows
+    """
+    spread = spread or {}
+    scale = metrics[CONTROL] / baseline[CONTROL] if CONTROL in metrics and CONTROL in baseline else 1.0
+
+    regressions = []
+    for name, value in metrics.items():
+        if name == CONTROL or name not in baseline:
+            continue
+        expected = baseline[name] * scale
+        allowed = threshold + min(2 * spread.get(name, 0.0), threshold)
+        if value > expected * (1 + allowed):
+            regressions.append(
+                f"{name}: {value:.3f} us is {value / expected - 1:.0%} slower than the baseline "
+                f"{expected:.3f} us, more than the {allowed:.0%} allowed"
+            )
+    return regressions
+
+
+def main():
+    # Read the options from the command line
+    parser = argparse.ArgumentParser(description="Time the advanced objects and compare them to a baseline.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="bulk workload sizes")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=float(os.environ.get("BENCH_THRESHOLD", 0.25)),
+        help="fail when a metric is slower than the baseline by more than this fraction"
+    )
+    parser.add_argument("--baseline", default=os.path.join(BENCHMARK_FOLDER, "baseline.json"))
+    parser.add_argument("--output", default=os.path.join(BENCHMARK_FOLDER, "results.json"))
+    parser.add_argument("--update-baseline", action="store_true", help="save these results as the new baseline")
+    args = parser.parse_args()
+
+    timings = run(args.sizes)
+    metrics = {name: median for name, (median, _) in timings.items()}
+    results = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "metrics_us": metrics,
+        "spread": {name: spread for name, (_, spread) in timings.items()},
+    }
+
+    # Record the results, and the baseline if asked
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(results, file, indent=2)
+
+    for name, (value, spread) in timings.items():
+        print(f"{name:<32}{value:>14.3f} us  +/- {spread / 2:.0%}")
+
+    # Sharded ingest can only scale with the workers when there are CPUs to run them on
+    speedup = metrics["sharded_ingest_1_worker"] / metrics["sharded_ingest_4_workers"]
+    print(f"\nSharded ingest with 4 workers is {speedup:.2f}x as fast as with 1 worker on {os.cpu_count()} CPUs")
+
+    if args.update_baseline or not os.path.exists(args.baseline):
+        print(f"\nNo comparison made, the baseline is {args.baseline}")
+        return
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+
+    regressions = find_regressions(metrics, baseline["metrics_us"], args.threshold, spread=baseline.get("spread"))
+    if regressions:
+        print(f"\n{len(regressions)} metrics regressed by more than {args.threshold:.0%} plus their noise:")
+        print("\n".join(regressions))
+        sys.exit(1)
+
+    print(f"\nNo metric regressed by more than {args.threshold:.0%} plus their noise.")
+
+
+if __name__ == "__main__":
+    main()
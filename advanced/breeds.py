@@ -0,0 +1,123 @@
+# Import the required libraries
+from operator import attrgetter
+
+
+class Breed:
+    """ The details shared by every dog of a breed, created once and never changed """
+
+    # Only these attributes can be set, which removes the per-breed __dict__
+    __slots__ = (
+        # The breed's number in its registry
+        "id",
+
+        # The breed's name, such as German Shepard
+        "name",
+
+        # The lightest and heaviest weight in pounds
+        "min_weight",
+        "max_weight",
+
+        # The shortest and longest life expectancy in years
+        "min_life_expectancy",
+        "max_life_expectancy",
+
+        # How energetic the breed is, from 1 to 5
+        "energy",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: int,
+        name: str,
+        min_weight: float = 0,
+        max_weight: float = 0,
+        min_life_expectancy: float = 0,
+        max_life_expectancy: float = 0,
+        energy: int = 0
+    ):
+        # Set through object.__setattr__ since assigning to a breed is not allowed
+        for field, value in (
+            ("id", id),
+            ("name", name),
+            ("min_weight", min_weight),
+            ("max_weight", max_weight),
+            ("min_life_expectancy", min_life_expectancy),
+            ("max_life_expectancy", max_life_expectancy),
+            ("energy", energy),
+        ):
+            object.__setattr__(self, field, value)
+
+    def __setattr__(self, field: str, value) -> None:
+        """ Refuse every change, since every dog of the breed shares this object """
+        raise Exception(f"Breeds can not be changed, {self.name} is shared by every dog of the breed.")
+
+    def __delattr__(self, field: str) -> None:
+        raise Exception(f"Breeds can not be changed, {self.name} is shared by every dog of the breed.")
+
+    def __repr__(self) -> str:
+        return f"Breed({self.id}, {self.name!r})"
+
+
+# Return every detail of a breed except its id, used to check a breed is registered the same way twice
+breed_details = attrgetter(
+    "name", "min_weight", "max_weight", "min_life_expectancy", "max_life_expectancy", "energy"
+)
+
+
+class BreedRegistry:
+    """ Creates one Breed per name so every dog of a breed shares it, and finds breeds by their id or name """
+
+    def __init__(self):
+        # Every breed by its id, which is its position
+        self.breeds = []
+
+        # Every breed id by its name in lowercase
+        self.ids = {}
+
+    def __len__(self) -> int:
+        return len(self.breeds)
+
+    def __iter__(self):
+        return iter(self.breeds)
+
+    def register(self, name: str, **details) -> Breed:
+        """
+        Return the breed with a name, creating it if it is new
+
+        :param name: (str) the breed's name
+        :param details: the breed's details, such as min_weight=50 or energy=4
+
+        :return: the shared Breed, registering the same name with different details fails
+        """
+        breed_id = self.ids.get(name.lower())
+        if breed_id is not None:
+            breed = self.breeds[breed_id]
+            if details and breed_details(breed) != breed_details(Breed(id=breed_id, name=breed.name, **details)):
+                raise Exception(f"The breed {name} is already registered with different details.")
+            return breed
+
+        breed = Breed(id=len(self.breeds), name=name, **details)
+        self.breeds.append(breed)
+        self.ids[name.lower()] = breed.id
+        return breed
+
+    def get(self, breed_id: int) -> Breed:
+        """ Return the breed with an id """
+        return self.breeds[breed_id]
+
+    def find(self, name: str) -> Breed:
+        """ Return the breed with a name, ignoring casing, failing if it has not been registered """
+        breed_id = self.ids.get(name.lower())
+        if breed_id is None:
+            raise Exception(f"The breed {name} is not registered, please register it first.")
+        return self.breeds[breed_id]
+
+
+# The registry every Dog finds its breed in
+breed_registry = BreedRegistry()
+
+# Every Dog was a German Shepard before breeds could be chosen, so it is always the first breed
+breed_registry.register(
+    "German Shepard", min_weight=50, max_weight=90, min_life_expectancy=9, max_life_expectancy=13, energy=4
+)
@@ -0,0 +1,343 @@
+# Import the required libraries
+import mmap
+import os
+import struct
+import threading
+
+from collections import namedtuple
+
+import custom_object
+from clocks import from_epoch_ns, to_epoch_ns
+from custom_object import Employee
+from employee_index import identity
+from events import emit
+from employee_store import HEADER as STORE_HEADER, ROW, EmployeeStore, write_employees
+
+# The first bytes of every journal file
+MAGIC = b"EMPJ"
+
+# Increase this whenever the encoding below changes
+SCHEMA_VERSION = 1
+
+# Magic and schema version
+HEADER = struct.Struct("<4sH")
+
+# Snapshot row, field code, and when the change was made in nanoseconds since the epoch
+ENTRY = struct.Struct("<IBq")
+
+# Every field a journal records, by the code stored for it
+FIELDS = ("full_name", "age", "salary", "email")
+FIELD_CODES = {field: code for code, field in enumerate(FIELDS)}
+
+# The tag stored before each value, followed by nothing, a 64 bit integer, or a length and UTF-8 text
+NONE_TAG, INT_TAG, STR_TAG = 0, 1, 2
+
+# The fields apply_changes can write straight into a snapshot row, since their values take a fixed number of bytes
+NUMBER_FIELDS = ("age", "salary")
+
+# A single change to one field of the employee in a snapshot row
+Change = namedtuple("Change", ("row", "field", "old_value", "new_value", "timestamp_ns"))
+
+
+def encode_value(value) -> bytes:
+    """ Encode a field value with a tag saying what kind of value it is """
+    if value is None:
+        return bytes((NONE_TAG,))
+    if isinstance(value, int):
+        return struct.pack("<Bq", INT_TAG, value)
+    encoded = value.encode()
+    return struct.pack("<BI", STR_TAG, len(encoded)) + encoded
+
+
+def decode_value(data, offset: int) -> tuple:
+    """ Decode a field value, returning it and the offset just after it """
+    tag = data[offset]
+    if tag == NONE_TAG:
+        return None, offset + 1
+    if tag == INT_TAG:
+        return struct.unpack_from("<q", data, offset + 1)[0], offset + 9
+    length = struct.unpack_from("<I", data, offset + 1)[0]
+    start = offset + 5
+    if start + length > len(data):
+        raise struct.error("The text value runs past the end of the data.")
+    return bytes(data[start:start + length]).decode(), start + length
+
+
+def encode_change(change: Change) -> bytes:
+    """ Encode a single change """
+    return (
+            ENTRY.pack(change.row, FIELD_CODES[change.field], change.timestamp_ns) +
+            encode_value(change.old_value) +
+            encode_value(change.new_value)
+    )
+
+
+def encode_changes(changes) -> bytes:
+    """ Encode changes into the bytes of a journal file, which can be sent to a replica """
+    return HEADER.pack(MAGIC, SCHEMA_VERSION) + b"".join(encode_change(change) for change in changes)
+
+
+def decode_complete_changes(data) -> tuple:
+    """
+    Decode the bytes of a journal file up to the last change that was completely written
+
+    A crash while a change is appended leaves only part of it at the end of the file, which is not decoded.
+
+    :param data: (bytes) bytes created by encode_changes or saved by a ChangeJournal
+
+    :return: the list of changes, oldest first, and the number of bytes they and the header take
+    """
+    magic, version = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise Exception("The data is not an employee change journal.")
+    if version != SCHEMA_VERSION:
+        raise Exception(f"The journal uses schema version {version}, only version {SCHEMA_VERSION} can be read.")
+
+    changes = []
+    end = HEADER.size
+    while end < len(data):
+        try:
+            row, code, timestamp_ns = ENTRY.unpack_from(data, end)
+            old_value, offset = decode_value(data, end + ENTRY.size)
+            new_value, offset = decode_value(data, offset)
+        except struct.error:
+            break
+        changes.append(Change(row, FIELDS[code], old_value, new_value, timestamp_ns))
+        end = offset
+    return changes, end
+
+
+def decode_changes(data) -> list:
+    """
+    Decode the bytes of a journal file
+
+    :param data: (bytes) bytes created by encode_changes or saved by a ChangeJournal
+
+    :return: the list of changes, oldest first
+    """
+    changes, end = decode_complete_changes(data)
+    if end != len(data):
+        raise Exception(f"The journal ends part way through a change, after {len(changes)} complete changes.")
+    return changes
+
+
+def compact_changes(changes) -> list:
+    """
+    Combine every change to the same field of the same row into one change
+
+    The combined change keeps the first old value and the last new value and time.
+    Changes that end where they started are dropped.
+
+    :param changes: (iterable) changes, oldest first
+
+    :return: the combined changes, in the order each field was first changed
+    """
+    combined = {}
+    for change in changes:
+        key = (change.row, change.field)
+        first = combined.get(key)
+        combined[key] = change if first is None else change._replace(old_value=first.old_value)
+    return [change for change in combined.values() if change.old_value != change.new_value]
+
+
+class ChangeJournal:
+    """ Records every update to the employees of a snapshot, appending each change to a journal file """
+
+    def __init__(self, employees=(), *, path: str = None, compact_every: int = 10000, sink=None):
+        """
+        :param employees: (iterable) the employees in the snapshot, in the same order they were written
+        :param path: (str) a journal file that changes are appended to as they happen, if any
+            A change left part way written at the end of the file by a crash is dropped and reported to the sink
+        :param compact_every: (int) compact the journal after this many changes since it was last compacted
+        :param sink: where a dropped change is reported, defaults to the current sink
+        """
+        # Held while changes are recorded or read, since employees may be updated by several threads at once
+        self.lock = threading.RLock()
+
+        # The snapshot row of every tracked employee by its identity
+        self.rows = {}
+        self.employees = {}
+        for row, employee in enumerate(employees):
+            self.track(employee, row)
+
+        self.changes = []
+        self.path = path
+        self.compact_every = compact_every
+        self.since_compaction = 0
+
+        # Start the file, or keep adding to the one already there
+        self.file = None
+        if path:
+            if os.path.exists(path):
+                with open(path, "rb") as file:
+                    data = file.read()
+                self.changes, end = decode_complete_changes(data)
+
+                # Cut the file back to the last complete change, so new changes are not appended after a torn one
+                if end < len(data):
+                    os.truncate(path, end)
+                    emit(
+                        "journal_truncated",
+                        "Dropped %s bytes of a change left part way written at the end of %s, kept %s changes.",
+                        len(data) - end,
+                        path,
+                        len(self.changes),
+                        sink=sink
+                    )
+            else:
+                with open(path, "wb") as file:
+                    file.write(HEADER.pack(MAGIC, SCHEMA_VERSION))
+            self.file = open(path, "ab")
+
+        # Record updates until close, or until the journal is no longer used
+        self.listener = custom_object.add_listener(custom_object.update_listeners, self.on_update)
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    def __enter__(self) -> "ChangeJournal":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """ Stop recording updates and close the journal file """
+        custom_object.remove_listener(custom_object.update_listeners, self.listener)
+        with self.lock:
+            if self.file:
+                self.file.close()
+
+    def flush(self) -> None:
+        """ Make sure every recorded change has been written to the journal file """
+        with self.lock:
+            if self.file:
+                self.file.flush()
+
+    def track(self, employee: Employee, row: int) -> None:
+        """
+        Record updates to an employee as changes to a snapshot row
+
+        :param employee: (Employee) the employee or table row to follow
+        :param row: (int) the employee's row in the snapshot
+        """
+        with self.lock:
+            self.rows[identity(employee)] = row
+            self.employees[identity(employee)] = employee
+
+    def on_update(self, employee: Employee, field: str, old_value, new_value) -> None:
+        """ Record a change to a tracked employee """
+        row = self.rows.get(identity(employee))
+
+        # The updated time is stored with every change instead of as a change of its own
+        if row is None or field not in FIELD_CODES:
+            return
+        self.record(Change(row, field, old_value, new_value, to_epoch_ns(employee.updated_datetime)))
+
+    def record(self, change: Change) -> None:
+        """ Add a change to the end of the journal """
+        with self.lock:
+            self.changes.append(change)
+            if self.file:
+                self.file.write(encode_change(change))
+
+            self.since_compaction += 1
+            if self.since_compaction >= self.compact_every:
+                self.compact()
+
+    def compact(self) -> None:
+        """ Combine repeated changes to the same field, rewriting the journal file if there is one """
+        with self.lock:
+            self.changes = compact_changes(self.changes)
+            self.since_compaction = 0
+            if self.file:
+                self.rewrite(encode_changes(self.changes))
+
+    def encode(self) -> bytes:
+        """ Return the journal as bytes, ready to send to a replica """
+        with self.lock:
+            return encode_changes(self.changes)
+
+    def clear(self) -> None:
+        """ Forget every change, such as after they have been applied to the snapshot """
+        with self.lock:
+            self.changes = []
+            self.since_compaction = 0
+            if self.file:
+                self.rewrite(HEADER.pack(MAGIC, SCHEMA_VERSION))
+
+    def rewrite(self, data: bytes) -> None:
+        """ Replace the journal file, writing a new file and swapping it in so a crash never leaves half a journal """
+        self.file.close()
+        with open(self.path + ".tmp", "wb") as file:
+            file.write(data)
+        os.replace(self.path + ".tmp", self.path)
+        self.file = open(self.path, "ab")
+
+
+def apply_changes(snapshot_path: str, changes, output_path: str = None) -> int:
+    """
+    Apply changes to a snapshot written by write_employees
+
+    When only ages and salaries changed and the snapshot itself is updated, only the changed rows are written,
+    which costs O(changes). Any other change writes a whole new snapshot, which costs O(rows) on every call,
+    so name and email changes are best applied in large batches.
+
+    :param snapshot_path: (str) the snapshot to start from
+    :param changes: (iterable) changes, oldest first, such as decode_changes of a journal file
+    :param output_path: (str) where the updated snapshot is written, defaults to replacing the snapshot
+
+    :return: the number of rows that changed
+    """
+    # The final value and update time of every changed field, by row
+    latest = {}
+    for change in compact_changes(changes):
+        latest.setdefault(change.row, {})[change.field] = (change.new_value, change.timestamp_ns)
+
+    output_path = output_path or snapshot_path
+    if output_path == snapshot_path and all(field in NUMBER_FIELDS for fields in latest.values() for field in fields):
+        patch_rows(snapshot_path, latest)
+        return len(latest)
+
+    def updated_rows(store):
+        for row, employee in enumerate(store):
+            for field, (value, timestamp_ns) in latest.get(row, {}).items():
+                setattr(employee, field, value)
+                updated = from_epoch_ns(timestamp_ns)
+                if employee.updated_datetime is None or updated > employee.updated_datetime:
+                    employee.updated_datetime = updated
+            yield employee
+
+    # Write a new file and swap it in, since the snapshot is still being read
+    with EmployeeStore(snapshot_path) as store:
+        write_employees(output_path + ".tmp", updated_rows(store))
+    os.replace(output_path + ".tmp", output_path)
+
+    return len(latest)
+
+
+def patch_rows(snapshot_path: str, latest: dict) -> None:
+    """
+    Write new ages, salaries, and update times straight into the changed rows of a snapshot
+
+    A crash part way leaves only some rows changed, applying the same changes again finishes the job.
+
+    :param snapshot_path: (str) a snapshot written by write_employees
+    :param latest: (dict) the new (value, timestamp_ns) of every changed age or salary, by row
+    """
+    # Opening the snapshot as a store checks it is one this version can read
+    with EmployeeStore(snapshot_path) as store:
+        row_count = len(store)
+
+    with open(snapshot_path, "r+b") as file, mmap.mmap(file.fileno(), 0) as buffer:
+        for row, fields in latest.items():
+            if not 0 <= row < row_count:
+                raise Exception(f"The change to row {row} does not fit the snapshot of {row_count} employees.")
+
+            offset = STORE_HEADER.size + row * ROW.size
+            name_id, email_id, age, salary, created, updated = ROW.unpack_from(buffer, offset)
+            values = {"age": age, "salary": salary}
+            for field, (value, timestamp_ns) in fields.items():
+                values[field] = value
+                updated = max(updated, timestamp_ns)
+            ROW.pack_into(buffer, offset, name_id, email_id, values["age"], values["salary"], created, updated)
@@ -0,0 +1,117 @@
+# Import the required libraries
+import time
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+# Timestamps stored as integers are whole nanoseconds since this (naive) moment
+EPOCH = datetime(1970, 1, 1)
+
+
+def to_epoch_ns(value: datetime) -> int:
+    """
+    Convert a naive datetime into an integer number of nanoseconds since EPOCH
+
+    :param value: (datetime) the datetime to convert
+
+    :return: the nanoseconds since EPOCH, exact to the microsecond
+    """
+    return (value - EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def from_epoch_ns(value: int) -> datetime:
+    """
+    Convert an integer number of nanoseconds since EPOCH back into a naive datetime
+
+    :param value: (int) the nanoseconds since EPOCH
+
+    :return: the matching datetime
+    """
+    return EPOCH + timedelta(microseconds=value // 1000)
+
+
+class SystemClock:
+    """ Reads the system clock on every call, the same as datetime.now """
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+    def now_ns(self) -> int:
+        return to_epoch_ns(datetime.now())
+
+
+class CachedClock:
+    """ Reads the system clock at most once per tick and hands out the same datetime until then """
+
+    def __init__(self, *, resolution: float = 0.01):
+        """
+        :param resolution: (float) the seconds a reading is reused for before the clock is read again
+        """
+        self.resolution_ns = int(resolution * 1000000000)
+        self.tick()
+
+    def tick(self) -> None:
+        """ Read the system clock now, whether or not the current reading is stale """
+        self.value = datetime.now()
+        self.value_ns = to_epoch_ns(self.value)
+        self.expires = time.monotonic_ns() + self.resolution_ns
+
+    def now(self) -> datetime:
+        # Reading the monotonic clock is much cheaper than building a new datetime
+        if time.monotonic_ns() >= self.expires:
+            self.tick()
+        return self.value
+
+    def now_ns(self) -> int:
+        if time.monotonic_ns() >= self.expires:
+            self.tick()
+        return self.value_ns
+
+
+class BatchClock:
+    """ Always returns the same moment, so everything in a bulk load shares one timestamp """
+
+    def __init__(self, value: datetime = None):
+        """
+        :param value: (datetime) the moment to return, defaults to when the clock is created
+        """
+        self.value = value or datetime.now()
+        self.value_ns = to_epoch_ns(self.value)
+
+    def now(self) -> datetime:
+        return self.value
+
+    def now_ns(self) -> int:
+        return self.value_ns
+
+
+# The clock read by custom_object.get_datetime
+current_clock = SystemClock()
+
+
+def set_clock(clock) -> object:
+    """
+    Change the clock used to stamp employees
+
+    :param clock: the new clock, such as a CachedClock or BatchClock
+
+    :return: the previous clock, so it can be put back
+    """
+    global current_clock
+    previous = current_clock
+    current_clock = clock
+    return previous
+
+
+@contextmanager
+def use_clock(clock):
+    """
+    Use a clock for everything inside a with block, then put the previous clock back
+
+    :param clock: the clock used inside the with block
+    """
+    previous = set_clock(clock)
+    try:
+        yield clock
+    finally:
+        set_clock(previous)
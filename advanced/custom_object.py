@@ -1,27 +1,38 @@
 # Import the required libraries
+import re
 import sys
+import weakref
 
 from datetime import datetime
+from functools import total_ordering
+from operator import attrgetter
 
+import clocks
+from events import emit
 
+
+@total_ordering
 class Employee:
-    # An employee's full name
-    full_name = ""
+    # Only these attributes can be set, which removes the per-employee __dict__
+    __slots__ = (
+        # An employee's full name
+        "full_name",
 
-    # An employee's age
-    age = 0
+        # An employee's age
+        "age",
 
-    # An employee's salary
-    salary = 0
+        # An employee's salary
+        "salary",
 
-    # An employee's email
-    email = ""
+        # An employee's email
+        "email",
 
-    # The date time the employee was created
-    created_datetime = None
+        # The date time the employee was created
+        "created_datetime",
 
-    # The date time the employee was updated
-    updated_datetime = None
+        # The date time the employee was updated
+        "updated_datetime",
+    )
 
     def __init__(
         self,
@@ -30,11 +41,12 @@ class Employee:
         last_name: str,
         age: int,
         salary: int,
-        email: str = ""
+        email: str = "",
+        sink=None
     ):
 
-        # Display a message to track code progress
-        print("Creating a new employee!")
+        # Display a message to track code progress, sink can replace where the message goes for this call
+        emit("employee_created", "Creating a new employee!", sink=sink)
 
         # Set up the object variables using the information given
         self.full_name = first_name.capitalize() + " " + last_name.capitalize()
@@ -45,6 +57,46 @@ class Employee:
         # Store the current date in created_date
         self.created_datetime = get_datetime()
 
+        # The employee has not been updated yet
+        self.updated_datetime = None
+
+        # Tell every creation listener about the new employee, a copy is used in case one stops listening meanwhile
+        for listener in tuple(created_listeners):
+            listener(self)
+
+    @classmethod
+    def from_fields(
+        cls,
+        *,
+        full_name: str,
+        age: int,
+        salary: int,
+        email: str = "",
+        created_datetime: datetime,
+        updated_datetime: datetime = None
+    ) -> "Employee":
+        """
+        Rebuild an employee from already stored values without running __init__
+
+        :param full_name: (str) the already formatted full name
+        :param age: (int) the employee's age
+        :param salary: (int) the employee's salary
+        :param email: (str) the employee's email
+        :param created_datetime: (datetime) when the employee was originally created
+        :param updated_datetime: (datetime) when the employee was last updated, if ever
+
+        :return: an Employee with exactly the values given
+        """
+        # Skip __init__ so the name is not re-capitalized and no message is displayed
+        employee = cls.__new__(cls)
+        employee.full_name = full_name
+        employee.age = age
+        employee.salary = salary
+        employee.email = email
+        employee.created_datetime = created_datetime
+        employee.updated_datetime = updated_datetime
+        return employee
+
     def __str__(self) -> str:
         """ Override the string function to format it appropriately """
         return (
@@ -63,51 +115,188 @@ class Employee:
         return str(self)
 
     def __eq__(self, target) -> bool:
-        """ Override the equal to compare our overriden str message """
-        return str(self) == str(target)
+        """ Override the equal to compare every field, the same fields __lt__ orders by """
+        # Anything without the employee fields can not be equal
+        try:
+            return employee_fields(self) == employee_fields(target)
+        except AttributeError:
+            return NotImplemented
+
+    # Every field can change after an employee is stored in a set or dict, so employees can not be hashed
+    # Use employee_fields(employee) as the set member or dict key instead
+    __hash__ = None
+
+    def __lt__(self, target) -> bool:
+        """ Order employees by name, then age, salary, email, created_datetime, and updated_datetime """
+        try:
+            return employee_order(self) < employee_order(target)
+        except AttributeError:
+            return NotImplemented
 
     @staticmethod
-    def display_company_message() -> None:
+    def display_company_message(*, sink=None) -> None:
         """ This function is generic for every employee.
         Therefore, it can be static because it does not require employee information. """
-        print("Welcome to our company, just where you belong!\n")
+        emit("company_message", "Welcome to our company, just where you belong!\n", sink=sink)
 
-    def greet_employee(self) -> None:
+    def greet_employee(self, *, sink=None) -> None:
         """ This function displays a nice message for the employee """
-        print(f"Hello {self.full_name}! I see you are {self.age}, great to meet you!\n")
+        emit(
+            "employee_greeted",
+            "Hello %s! I see you are %s, great to meet you!\n",
+            self.full_name,
+            self.age,
+            sink=sink
+        )
 
-    def retrieve_email(self) -> None:
+    def retrieve_email(self, *, sink=None) -> None:
         """ This function asks the employee for their email """
 
-        # Ask the employee for their email until valid input is received
-        while True:
-            # Gather their input
-            email_response = input("What is your email? ")
+        # Imported here since email_intake imports this module
+        from email_intake import intake_email
+
+        # Ask the employee for their email until valid input is received, the intake checks and applies it,
+        # which also updates the updated_datetime variable
+        intake_email(self, iter(lambda: input("What is your email? "), None), sink=sink)
+
+    def update(self, *, updated_datetime: datetime = None, **changes) -> None:
+        """
+        Change one or more fields, set updated_datetime, and tell every update listener what changed
+
+        :param updated_datetime: (datetime) when the change happened, defaults to now, such as to give a batch of
+            changes the same timestamp
+        :param changes: the new value for each field, such as email="new@test.com"
+        """
+        # Only the fields that describe the employee can be changed
+        for field in changes:
+            if field not in ("full_name", "age", "salary", "email"):
+                raise Exception(f"The field {field} can not be updated.")
+
+        # Remember every old value so listeners can find what was there before
+        changes["updated_datetime"] = updated_datetime or get_datetime()
+        old_values = {field: getattr(self, field) for field in changes}
+
+        for field, value in changes.items():
+            setattr(self, field, value)
+
+        for listener in tuple(update_listeners):
+            for field, value in changes.items():
+                listener(self, field, old_values[field], value)
+
+
+# A valid email has text, an @, and a domain with a dot in it, without spaces
+EMAIL_PATTERN = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+def is_valid_email(email: str) -> bool:
+    """ Return True if the email looks valid, otherwise, False """
+    return EMAIL_PATTERN.fullmatch(email) is not None
+
+
+# Functions called as listener(employee) for every employee created with __init__
+created_listeners = []
+
+# Functions called as listener(employee, field, old_value, new_value) for every field changed by Employee.update
+# Setting a field directly, such as employee.salary = 10, does not call them, update is the only way listeners see
+# Both kinds of listener may be called by several threads at once, such as through EmployeeRegistry, so a listener
+# that keeps state locks it itself, the way EmployeeIndex, EmployeeStats, and ChangeJournal do
+update_listeners = []
+
+
+def add_listener(listeners: list, method):
+    """
+    Add a bound method to a list of listeners without keeping its object alive
+
+    Once nothing else uses the object, such as an index that was never closed, it is removed from the list.
+
+    :param listeners: (list) created_listeners or update_listeners
+    :param method: (method) the bound method to call, such as index.on_update
+
+    :return: the listener added to the list, which remove_listener takes to stop listening
+    """
+    def forget(_):
+        remove_listener(listeners, listener)
+
+    reference = weakref.WeakMethod(method, forget)
+
+    def listener(*args):
+        target = reference()
+        if target is not None:
+            target(*args)
+
+    listeners.append(listener)
+    return listener
+
 
-            # Check if the input is valid
-            if "@" in email_response and "." in email_response:
-                # Since the email provided was valid, break out of the while loop
-                break
-            else:
-                # Since the email provided was invalid, ask the employee again
-                print(f"The email given, {email_response}, is not valid. Please provide a valid email.\n")
+def remove_listener(listeners: list, listener) -> None:
+    """ Remove a listener added by add_listener, doing nothing if it was already removed """
+    if listener in listeners:
+        listeners.remove(listener)
 
-        # The email must be valid to get here
-        self.email = email_response
+# Return every field of an employee as a tuple, used to compare employees and as a hashable key for sets and dicts
+employee_fields = attrgetter("full_name", "age", "salary", "email", "created_datetime", "updated_datetime")
 
-        # Update the updated_datetime variable
-        self.updated_datetime = get_datetime()
+
+def equal_as_string(employee, target) -> bool:
+    """ Compare two employees using their formatted str message, like the original __eq__ """
+    return str(employee) == str(target)
+
+
+def updated_key(employee) -> datetime:
+    """ Return when an employee was updated, with never updated employees ordered before every update """
+    return employee.updated_datetime or datetime.min
+
+
+# The function returning the value employees are ordered by, for every field they can be sorted by
+SORT_KEYS = {
+    "full_name": attrgetter("full_name"),
+    "age": attrgetter("age"),
+    "salary": attrgetter("salary"),
+    "email": attrgetter("email"),
+    "created_datetime": attrgetter("created_datetime"),
+    "updated_datetime": updated_key,
+}
+
+
+def sort_key(field: str):
+    """
+    Return a key function for sorted, min, max, or heapq that orders employees by one field
+
+    :param field: (str) full_name, age, salary, email, created_datetime, or updated_datetime
+
+    :return: a function called with an employee that returns the value to order it by
+    """
+    if field not in SORT_KEYS:
+        raise Exception(f"Employees can not be sorted by {field}, please use one of {', '.join(SORT_KEYS)}.")
+    return SORT_KEYS[field]
+
+
+def employee_order(employee) -> tuple:
+    """ Return every field of an employee as a tuple that can always be compared, used to order employees """
+    return employee_fields(employee)[:5] + (updated_key(employee),)
 
 
 def main():
     # args is a list of the command line arguments, starts at index 1 because index 0 is the file name
     args = sys.argv[1:]
 
+    # Show the employees of a file in order instead of creating one, the options can come in any order
+    if any(arg in ("--top-k", "--bottom-k", "--sort-by") for arg in args):
+        show_in_order(args)
+        return
+
+    # Load many employees from a file instead of creating one
+    if args and args[0] == "--from-file":
+        load_from_file(args[1:])
+        return
+
     # We expect 4 arguments, raise an exception if not provided
     if len(args) != 4:
         raise Exception(
             "This program expects 4 arguments.\n"
-            "Please try re-running the program and provide first name, last name, age, and salary."
+            "Please try re-running the program and provide first name, last name, age, and salary.\n"
+            "Or use --from-file followed by a .csv or .jsonl file of employees.\n"
+            "Or use --top-k N, --bottom-k N, or --sort-by FIELD with --from-file to list employees in order."
         )
 
     # Create a variable using the custom object, Employee
@@ -129,11 +318,74 @@ def main():
     print(employee)
 
 
+def load_from_file(args: list) -> None:
+    """
+    Stream every employee in a file and display how quickly they were loaded
+
+    :param args: (list) the file path, optionally followed by the batch size
+    """
+    # Imported here since the loader builds on the Employee class in this file
+    from employee_loader import ingest
+
+    # We expect a file path and optionally a batch size
+    if len(args) not in (1, 2):
+        raise Exception(
+            "The --from-file option expects 1 or 2 arguments.\n"
+            "Please provide a .csv or .jsonl file and optionally a batch size."
+        )
+
+    report = ingest(args[0], batch_size=int(args[1]) if len(args) == 2 else 1000)
+
+    print(
+        f"Loaded {report['rows']} employees in {report['seconds']:.2f} seconds "
+        f"({report['rows_per_second']:.0f} rows/sec)"
+    )
+
+
+def show_in_order(args: list) -> None:
+    """
+    Display the highest, lowest, or every employee in a file ordered by one field
+
+    :param args: (list) the command line arguments, such as ["--top-k", "20", "--by", "salary", "--from-file", "a.csv"]
+    """
+    # Imported here since these modules build on the Employee class in this file
+    import argparse
+    from itertools import chain
+    from employee_loader import build_employees, read_rows
+    from employee_sorting import bottom_k, external_sort, top_k
+
+    parser = argparse.ArgumentParser(description="List the employees in a file in order.")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--top-k", type=int, metavar="N", help="show the N employees with the highest values")
+    group.add_argument("--bottom-k", type=int, metavar="N", help="show the N employees with the lowest values")
+    group.add_argument("--sort-by", metavar="FIELD", help="show every employee, sorted by this field")
+    parser.add_argument("--by", default="salary", help="the field --top-k and --bottom-k order by")
+    parser.add_argument("--from-file", required=True, help="a .csv or .jsonl file of employees")
+    parser.add_argument("--descending", action="store_true", help="sort highest first with --sort-by")
+    parser.add_argument("--chunk-size", type=int, default=100000, help="employees --sort-by sorts in memory at once")
+    options = parser.parse_args(args)
+
+    # Employees are read one batch at a time, so the file never has to fit in memory
+    employees = chain.from_iterable(build_employees(read_rows(options.from_file)))
+
+    if options.top_k is not None:
+        ordered = top_k(employees, options.top_k, by=options.by)
+    elif options.bottom_k is not None:
+        ordered = bottom_k(employees, options.bottom_k, by=options.by)
+    else:
+        ordered = external_sort(
+            employees, by=options.sort_by, reverse=options.descending, chunk_size=options.chunk_size
+        )
+
+    for employee in ordered:
+        print(employee)
+
+
 def get_datetime() -> datetime:
     """ 
-    Return the current datetime
+    Return the current datetime from the current clock, which is datetime.now unless clocks.set_clock was used
     """
-    return datetime.now()
+    return clocks.current_clock.now()
 
 
 if __name__ == "__main__":
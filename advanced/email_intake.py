@@ -0,0 +1,191 @@
+# Import the required libraries
+import asyncio
+import json
+
+import custom_object
+from custom_object import Employee, is_valid_email
+from events import emit
+
+
+def parse_message(line: str) -> tuple:
+    """
+    Read an employee id and email from one line of input
+
+    :param line: (str) either "id,email" or a JSON object such as {"id": "7", "email": "a@b.com"}
+
+    :return: the employee id and email as strings
+    """
+    line = line.strip()
+    if line.startswith("{"):
+        message = json.loads(line)
+        return str(message["id"]), str(message["email"]).strip()
+    employee_id, _, email = line.partition(",")
+    return employee_id.strip(), email.strip()
+
+
+class EmailIntake:
+    """ Collects employee emails from a stream of messages and applies the valid ones in batches """
+
+    def __init__(self, employees: dict, *, batch_size: int = 500):
+        """
+        :param employees: (dict) every employee that can receive an email, by their id as a string
+        :param batch_size: (int) how many valid emails are collected before they are applied together
+        """
+        self.employees = employees
+        self.batch_size = batch_size
+        self.pending = []
+        self.accepted = 0
+
+        # Every rejected message as (employee id, email, reason)
+        self.rejects = []
+
+    def submit(self, employee_id: str, email: str) -> str:
+        """
+        Check one email and queue it to be applied
+
+        :param employee_id: (str) the id of the employee the email belongs to
+        :param email: (str) the email given
+
+        :return: None if the email was accepted, otherwise the reason it was rejected
+        """
+        if employee_id not in self.employees:
+            reason = "unknown employee"
+        elif not is_valid_email(email):
+            reason = "invalid email"
+        else:
+            self.pending.append((self.employees[employee_id], email))
+            if len(self.pending) >= self.batch_size:
+                self.flush()
+            return None
+
+        self.rejects.append((employee_id, email, reason))
+        return reason
+
+    def submit_line(self, line: str) -> str:
+        """ Check one line of input, returning None if it was accepted, otherwise the reason it was rejected """
+        try:
+            employee_id, email = parse_message(line)
+        except (ValueError, KeyError, TypeError):
+            self.rejects.append((None, line.strip(), "unreadable message"))
+            return "unreadable message"
+        return self.submit(employee_id, email)
+
+    def flush(self) -> int:
+        """
+        Apply every queued email, giving the whole batch the same updated_datetime
+
+        :return: the number of emails applied
+        """
+        batch = self.pending
+        self.pending = []
+
+        # The timestamp is passed to every update instead of swapping the shared clock, which other threads also read
+        updated = custom_object.get_datetime()
+        for employee, email in batch:
+            employee.update(email=email, updated_datetime=updated)
+
+        self.accepted += len(batch)
+        return len(batch)
+
+    def report(self) -> dict:
+        """ Return the number of emails applied and every rejected message """
+        return {"accepted": self.accepted, "pending": len(self.pending), "rejected": list(self.rejects)}
+
+    async def consume(self, lines) -> dict:
+        """
+        Check and apply every line from an async iterable, such as a file or socket reader
+
+        :param lines: an async iterable of lines
+
+        :return: the report once every line was handled
+        """
+        async for line in lines:
+            if line.strip():
+                self.submit_line(line)
+        self.flush()
+        return self.report()
+
+    async def consume_file(self, path: str, *, chunk_size: int = 1 << 16) -> dict:
+        """
+        Check and apply every line of a file, reading it in chunks off the event loop
+
+        :param path: (str) a file with one message per line
+        :param chunk_size: (int) roughly how many bytes are read at a time
+
+        :return: the report once every line was handled
+        """
+        async def read_lines():
+            with open(path, encoding="utf-8") as file:
+                while True:
+                    lines = await asyncio.to_thread(file.readlines, chunk_size)
+                    if not lines:
+                        return
+                    for line in lines:
+                        yield line
+
+        return await self.consume(read_lines())
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """ Check every line sent over a connection, answering each one with OK or REJECTED and the reason """
+        while True:
+            data = await reader.readline()
+            if not data:
+                break
+            line = data.decode()
+            if not line.strip():
+                continue
+            reason = self.submit_line(line)
+            writer.write(b"OK\n" if reason is None else f"REJECTED {reason}\n".encode())
+            await writer.drain()
+
+        # Apply whatever the connection sent before it closed
+        self.flush()
+        writer.close()
+        await writer.wait_closed()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765, *, flush_interval: float = 1.0):
+        """
+        Accept messages over TCP, applying queued emails at least every flush_interval seconds
+
+        :param host: (str) the address to listen on
+        :param port: (int) the port to listen on, 0 picks a free port
+        :param flush_interval: (float) the most seconds a valid email waits before it is applied
+
+        :return: the started server, close it to stop accepting connections
+        """
+        server = await asyncio.start_server(self.handle_connection, host, port)
+
+        async def flush_regularly():
+            while server.is_serving():
+                await asyncio.sleep(flush_interval)
+                if self.pending:
+                    self.flush()
+
+        # Keep a reference to the task so it is not garbage collected while the server runs
+        self.flush_task = asyncio.create_task(flush_regularly())
+        return server
+
+
+def intake_email(employee: Employee, responses, *, sink=None) -> str:
+    """
+    Give an employee the first valid email from a series of responses, such as answers typed at a prompt
+
+    Every response goes through the same check as EmailIntake.submit, and each invalid one is reported.
+
+    :param employee: (Employee) the employee the email belongs to
+    :param responses: (iterable) the emails given, only read until a valid one is found
+    :param sink: where invalid emails are reported, defaults to the current sink
+
+    :return: the email applied
+    """
+    intake = EmailIntake({"employee": employee}, batch_size=1)
+    for email in responses:
+        if intake.submit("employee", email) is None:
+            return email
+        emit(
+            "invalid_email",
+            "The email given, %s, is not valid. Please provide a valid email.\n",
+            email,
+            sink=sink
+        )
+    raise Exception("No valid email was given.")
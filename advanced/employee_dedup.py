@@ -0,0 +1,202 @@
+# Import the required libraries
+import os
+import re
+import tempfile
+import unicodedata
+import zlib
+
+from array import array
+from difflib import SequenceMatcher
+
+# Anything that is not a letter, number, or space is dropped from names
+NAME_PUNCTUATION = re.compile(r"[^\w\s]|_")
+
+
+def normalize_name(name: str) -> str:
+    """
+    Reduce a name to a form that ignores casing, accents, punctuation, and extra spaces
+
+    :param name: (str) a full name, such as "  Amélie  O'Dupont"
+
+    :return: the normalized name, such as "amelie odupont"
+    """
+    # Split accented letters into the letter and the accent, then drop the accent
+    decomposed = unicodedata.normalize("NFKD", name)
+    without_accents = "".join(character for character in decomposed if not unicodedata.combining(character))
+    return " ".join(NAME_PUNCTUATION.sub("", without_accents).casefold().split())
+
+
+def normalize_email(email: str) -> str:
+    """
+    Reduce an email to a form that ignores casing, extra spaces, and +tags
+
+    :param email: (str) an email, such as " Lizzie+HR@Test.com "
+
+    :return: the normalized email, such as "lizzie@test.com", or "" if there was no email
+    """
+    email = "".join(email.split()).lower()
+    local, at, domain = email.partition("@")
+    return local.split("+", 1)[0] + at + domain
+
+
+def blocking_key(name: str, age: int) -> str:
+    """
+    Return a key shared by records that could be near duplicates, such as typos in a first name
+
+    :param name: (str) a normalized name
+    :param age: (int) the employee's age
+
+    :return: the last name, first initial, and age
+    """
+    parts = name.split()
+    return f"{parts[-1]}|{parts[0][:1]}|{age}" if parts else f"|{age}"
+
+
+class DisjointSet:
+    """ Groups record numbers together, where grouping a with b and b with c puts a, b, and c together """
+
+    def __init__(self, size: int):
+        # Every record starts in its own group, and is the representative of that group
+        self.parents = array("q", range(size))
+
+    def find(self, item: int) -> int:
+        """ Return the representative of the item's group """
+        parents = self.parents
+        root = item
+        while parents[root] != root:
+            root = parents[root]
+
+        # Point everything on the way directly at the representative so later finds are quicker
+        while parents[item] != root:
+            parents[item], item = root, parents[item]
+        return root
+
+    def union(self, first: int, second: int) -> None:
+        """ Put two items in the same group """
+        first_root = self.find(first)
+        second_root = self.find(second)
+        if first_root != second_root:
+            # Keep the smallest record number as the representative so results are repeatable
+            low, high = sorted((first_root, second_root))
+            self.parents[high] = low
+
+
+class DuplicateFinder:
+    """ Finds clusters of duplicate employees in rosters too large to compare every pair """
+
+    def __init__(
+        self,
+        *,
+        partitions: int = 64,
+        similarity: float = 0.85,
+        max_block_size: int = 50,
+        folder: str = None
+    ):
+        """
+        :param partitions: (int) how many files candidates are spread across, more means less memory per pass
+        :param similarity: (float) how alike two names in the same block must be, from 0 to 1
+        :param max_block_size: (int) the most records compared pairwise within one block
+        :param folder: (str) where the partition files are written, defaults to the system temporary folder
+        """
+        self.partitions = partitions
+        self.similarity = similarity
+        self.max_block_size = max_block_size
+        self.folder = folder
+
+    def spill(self, records, folder: str) -> int:
+        """
+        Write every record's keys to the partition file picked by the key's hash
+
+        :param records: (iterable) objects with full_name, email, and age
+        :param folder: (str) where the partition files are written
+
+        :return: the number of records read
+        """
+        files = [
+            open(os.path.join(folder, f"partition{number}.tsv"), "w", encoding="utf-8")
+            for number in range(self.partitions)
+        ]
+        count = 0
+        try:
+            for number, record in enumerate(records):
+                name = normalize_name(record.full_name)
+                email = normalize_email(record.email)
+
+                # The same email, or the same name and age, is an exact duplicate
+                # The same block is a possible duplicate, which is decided by comparing the names
+                keys = [f"n|{name}|{record.age}", f"b|{blocking_key(name, record.age)}"]
+                if email:
+                    keys.append(f"e|{email}")
+
+                for key in keys:
+                    partition = zlib.crc32(key.encode()) % self.partitions
+                    files[partition].write(f"{key}\t{number}\t{name}\n")
+                count = number + 1
+        finally:
+            for file in files:
+                file.close()
+        return count
+
+    def merge_partition(self, path: str, groups: DisjointSet) -> None:
+        """ Read one partition file and group the records that share a key """
+        buckets = {}
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                key, number, name = line.rstrip("\n").split("\t")
+                buckets.setdefault(key, []).append((int(number), name))
+
+        for key, members in buckets.items():
+            if key.startswith("b|"):
+                self.merge_similar(members, groups)
+            else:
+                first = members[0][0]
+                for number, _ in members[1:]:
+                    groups.union(first, number)
+
+    def merge_similar(self, members: list, groups: DisjointSet) -> None:
+        """ Group the records in a block whose names are similar enough """
+        members = members[:self.max_block_size]
+        for position, (number, name) in enumerate(members):
+            matcher = SequenceMatcher(None, name)
+            for other_number, other_name in members[position + 1:]:
+                if groups.find(number) == groups.find(other_number):
+                    continue
+                matcher.set_seq2(other_name)
+                if matcher.quick_ratio() >= self.similarity and matcher.ratio() >= self.similarity:
+                    groups.union(number, other_number)
+
+    def find(self, records) -> list:
+        """
+        Find every cluster of duplicate records
+
+        :param records: (iterable) objects with full_name, email, and age, such as employees or table rows
+
+        :return: a list of clusters, each a sorted list of record positions, ordered by their first position
+        """
+        with tempfile.TemporaryDirectory(dir=self.folder) as folder:
+            count = self.spill(records, folder)
+            groups = DisjointSet(count)
+
+            # Only one partition is held in memory at a time
+            for number in range(self.partitions):
+                self.merge_partition(os.path.join(folder, f"partition{number}.tsv"), groups)
+
+        # Only records grouped with an earlier record are collected, everything else has no duplicates
+        clusters = {}
+        for number in range(count):
+            root = groups.find(number)
+            if root != number:
+                clusters.setdefault(root, [root]).append(number)
+        return [clusters[root] for root in sorted(clusters)]
+
+
+def find_duplicates(records, **options) -> list:
+    """
+    Find every cluster of duplicate records
+
+    :param records: (iterable) objects with full_name, email, and age, such as employees or table rows
+    :param options: any of the DuplicateFinder options, such as partitions or similarity
+
+    :return: a list of clusters, each a sorted list of record positions, ordered by their first position
+    """
+    return DuplicateFinder(**options).find(records)
@@ -0,0 +1,252 @@
+# Import the required libraries
+import threading
+
+from bisect import bisect_left, insort
+
+import custom_object
+from custom_object import Employee
+
+
+class SortedPairs:
+    """
+    (value, key) pairs kept in order as a list of short sorted lists
+
+    Finding where a pair goes is a bisect over the buckets and then within one bucket, O(log n),
+    and adding or removing it only shifts the pairs in that one bucket instead of every later pair.
+    """
+
+    # A bucket is split in two once it holds more pairs than this
+    bucket_size = 1000
+
+    def __init__(self):
+        self.buckets = []
+
+        # The largest pair in every bucket, searched to find the bucket a pair belongs in
+        self.maxes = []
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self):
+        for bucket in self.buckets:
+            yield from bucket
+
+    def add(self, pair: tuple) -> None:
+        """ Add a (value, key) pair in its sorted place """
+        self.size += 1
+        if not self.buckets:
+            self.buckets.append([pair])
+            self.maxes.append(pair)
+            return
+
+        # A pair larger than every other pair goes at the end of the last bucket
+        number = bisect_left(self.maxes, pair)
+        if number == len(self.buckets):
+            number -= 1
+            self.buckets[number].append(pair)
+            self.maxes[number] = pair
+        else:
+            insort(self.buckets[number], pair)
+
+        bucket = self.buckets[number]
+        if len(bucket) > self.bucket_size:
+            half = len(bucket) // 2
+            self.buckets[number:number + 1] = [bucket[:half], bucket[half:]]
+            self.maxes[number:number + 1] = [bucket[half - 1], bucket[-1]]
+
+    def remove(self, pair: tuple) -> None:
+        """ Remove a (value, key) pair that was added, raising if it is not there """
+        # A pair that was never added, or whose value changed since, must not remove a neighbouring pair instead
+        number = bisect_left(self.maxes, pair)
+        bucket = self.buckets[number] if number < len(self.buckets) else []
+        position = bisect_left(bucket, pair)
+        if position == len(bucket) or bucket[position] != pair:
+            raise Exception(f"The pair {pair} is not in the sorted pairs.")
+        del bucket[position]
+        self.size -= 1
+
+        if not bucket:
+            del self.buckets[number]
+            del self.maxes[number]
+        elif position == len(bucket):
+            self.maxes[number] = bucket[-1]
+
+    def between(self, low, high):
+        """ Yield every pair whose value is between low and high, both included, in order """
+        # (low,) sorts before every (low, key) pair
+        number = bisect_left(self.maxes, (low,))
+        if number == len(self.buckets):
+            return
+        position = bisect_left(self.buckets[number], (low,))
+
+        for bucket in self.buckets[number:]:
+            for pair in bucket[position:]:
+                if pair[0] > high:
+                    return
+                yield pair
+            position = 0
+
+    def largest(self, k: int):
+        """ Yield the k largest pairs, largest first """
+        for bucket in reversed(self.buckets):
+            for pair in reversed(bucket):
+                if k <= 0:
+                    return
+                k -= 1
+                yield pair
+
+
+def identity(employee) -> tuple:
+    """
+    Return what stays the same about an employee for as long as it exists, used as its key in the index
+
+    A row of an EmployeeTable is a new view every time it is read, so it is known by its table and position instead
+    """
+    if hasattr(employee, "table"):
+        return id(employee.table), employee.index
+    return id(employee),
+
+
+class EmployeeIndex:
+    """ Finds employees by email, name, age range, and salary range without scanning every employee """
+
+    def __init__(self, employees=()):
+        # Every indexed employee by its identity, the other indexes only store these identities
+        self.employees = {}
+
+        # Hash indexes of a value to the identities of the employees with that value, in the order they were added
+        self.by_email = {}
+        self.by_name = {}
+
+        # (value, identity) pairs in order for range queries
+        self.by_age = SortedPairs()
+        self.by_salary = SortedPairs()
+
+        # Held while the indexes are read or changed, since employees may be updated by several threads at once
+        self.lock = threading.RLock()
+
+        # Keep the indexes up to date whenever an employee is updated, until close or the index is no longer used
+        self.listener = custom_object.add_listener(custom_object.update_listeners, self.on_update)
+
+        for employee in employees:
+            self.add(employee)
+
+    def __len__(self) -> int:
+        return len(self.employees)
+
+    def __contains__(self, employee: Employee) -> bool:
+        return identity(employee) in self.employees
+
+    def __enter__(self) -> "EmployeeIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """ Stop listening for employee updates, the index will no longer follow changes """
+        custom_object.remove_listener(custom_object.update_listeners, self.listener)
+
+    def add(self, employee: Employee) -> None:
+        """
+        Add an employee to every index
+
+        :param employee: (Employee) the employee or table row to add, adding it again does nothing
+        """
+        key = identity(employee)
+        with self.lock:
+            if key in self.employees:
+                return
+
+            self.employees[key] = employee
+            self.by_email.setdefault(employee.email, {})[key] = employee
+            self.by_name.setdefault(employee.full_name, {})[key] = employee
+            self.by_age.add((employee.age, key))
+            self.by_salary.add((employee.salary, key))
+
+    def remove(self, employee: Employee) -> None:
+        """
+        Remove an employee from every index
+
+        :param employee: (Employee) the employee or table row to remove
+        """
+        key = identity(employee)
+        with self.lock:
+            if key not in self.employees:
+                raise Exception(f"The employee {employee.full_name} is not in the index.")
+
+            del self.employees[key]
+            remove_from_hash(self.by_email, employee.email, key)
+            remove_from_hash(self.by_name, employee.full_name, key)
+            self.by_age.remove((employee.age, key))
+            self.by_salary.remove((employee.salary, key))
+
+    def on_update(self, employee: Employee, field: str, old_value, new_value) -> None:
+        """ Move an updated employee to its new place in the index that covers the field """
+        key = identity(employee)
+        with self.lock:
+            if key not in self.employees:
+                return
+
+            # The stored employee is kept, a table row read again is the same employee
+            employee = self.employees[key]
+            if field == "email":
+                remove_from_hash(self.by_email, old_value, key)
+                self.by_email.setdefault(new_value, {})[key] = employee
+            elif field == "full_name":
+                remove_from_hash(self.by_name, old_value, key)
+                self.by_name.setdefault(new_value, {})[key] = employee
+            elif field == "age":
+                self.by_age.remove((old_value, key))
+                self.by_age.add((new_value, key))
+            elif field == "salary":
+                self.by_salary.remove((old_value, key))
+                self.by_salary.add((new_value, key))
+
+    def find_by_email(self, email: str) -> list:
+        """ Return every employee with exactly this email """
+        with self.lock:
+            return list(self.by_email.get(email, {}).values())
+
+    def find_by_name(self, full_name: str) -> list:
+        """ Return every employee with exactly this full name """
+        with self.lock:
+            return list(self.by_name.get(full_name, {}).values())
+
+    def age_range(self, low: int, high: int) -> list:
+        """
+        Return every employee whose age is between low and high, youngest first
+
+        :param low: (int) the smallest age included
+        :param high: (int) the largest age included
+
+        :return: the matching employees
+        """
+        with self.lock:
+            return [self.employees[key] for _, key in self.by_age.between(low, high)]
+
+    def salary_range(self, low: int, high: int) -> list:
+        """
+        Return every employee whose salary is between low and high, lowest paid first
+
+        :param low: (int) the smallest salary included
+        :param high: (int) the largest salary included
+
+        :return: the matching employees
+        """
+        with self.lock:
+            return [self.employees[key] for _, key in self.by_salary.between(low, high)]
+
+    def top_salaries(self, k: int) -> list:
+        """ Return the k highest paid employees, highest paid first """
+        with self.lock:
+            return [self.employees[key] for _, key in self.by_salary.largest(k)]
+
+
+def remove_from_hash(index: dict, value, key: tuple) -> None:
+    """ Remove an identity from a hash index, dropping the value once no employee has it """
+    keys = index[value]
+    del keys[key]
+    if not keys:
+        del index[value]
@@ -0,0 +1,93 @@
+# Import the required libraries
+import csv
+import json
+import time
+
+from contextlib import nullcontext
+from itertools import islice
+
+from clocks import use_clock
+from custom_object import Employee
+from events import NULL_SINK
+
+
+def read_rows(path: str):
+    """
+    Stream the rows of a CSV or JSON Lines file one at a time
+
+    :param path: (str) a .csv file with a header row, a .jsonl file with one object per line,
+        or a .json file with a list of objects, which is read into memory all at once
+
+    :return: a generator of dictionaries with first_name, last_name, age, salary, and optionally email
+    """
+    # Check the format before opening the file, so a missing file of the wrong format still names the format
+    if not path.endswith((".csv", ".jsonl", ".json")):
+        raise Exception(f"Unable to read {path}, only .csv, .jsonl, and .json files are supported.")
+
+    with open(path, newline="", encoding="utf-8") as file:
+        if path.endswith(".csv"):
+            yield from csv.DictReader(file)
+        elif path.endswith(".jsonl"):
+            for line in file:
+                # Skip blank lines, such as a trailing new line
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            rows = json.load(file)
+            if not isinstance(rows, list):
+                raise Exception(f"Unable to read {path}, a .json file must hold a list of employees.")
+            yield from rows
+
+
+def build_employees(rows, *, batch_size: int = 1000):
+    """
+    Turn a stream of rows into lists of at most batch_size employees
+
+    :param rows: (iterable) dictionaries like the ones returned by read_rows
+    :param batch_size: (int) the largest number of employees built at once
+
+    :return: a generator of lists of employees
+    """
+    rows = iter(rows)
+
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+
+        # The null sink hides the message displayed for every new employee
+        yield [
+            Employee(
+                first_name=row["first_name"],
+                last_name=row["last_name"],
+                age=int(row["age"]),
+                salary=int(row["salary"]),
+                email=row.get("email") or "",
+                sink=NULL_SINK
+            )
+            for row in batch
+        ]
+
+
+def ingest(path: str, *, batch_size: int = 1000, handle_batch=None, clock=None) -> dict:
+    """
+    Stream every employee in a file through handle_batch, keeping only one batch in memory at a time
+
+    :param path: (str) a .csv or .jsonl file of employees
+    :param batch_size: (int) the number of employees built and handled at once
+    :param handle_batch: (function) called with every list of employees, such as EmployeeTable.extend
+    :param clock: a clock used to stamp the employees, such as a BatchClock to give them all one timestamp
+
+    :return: a dictionary with the number of rows, the seconds taken, and the rows per second
+    """
+    start = time.perf_counter()
+    rows = 0
+
+    with use_clock(clock) if clock else nullcontext():
+        for employees in build_employees(read_rows(path), batch_size=batch_size):
+            rows += len(employees)
+            if handle_batch:
+                handle_batch(employees)
+
+    seconds = time.perf_counter() - start
+    return {"rows": rows, "seconds": seconds, "rows_per_second": rows / seconds if seconds else 0.0}
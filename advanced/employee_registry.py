@@ -0,0 +1,122 @@
+# Import the required libraries
+import threading
+
+from custom_object import Employee
+
+
+class EmployeeRegistry:
+    """ Employees by id, split into partitions that each have their own lock so threads rarely wait on each other """
+
+    def __init__(self, *, partitions: int = 16):
+        """
+        :param partitions: (int) how many independently locked partitions the employees are spread across
+        """
+        if partitions < 1:
+            raise Exception("A registry needs at least 1 partition.")
+
+        # Each partition is a lock and the employees it guards, by their id
+        self.locks = [threading.Lock() for _ in range(partitions)]
+        self.partitions = [{} for _ in range(partitions)]
+
+    def partition(self, employee_id) -> int:
+        """ Return the number of the partition an employee id belongs to """
+        return hash(employee_id) % len(self.partitions)
+
+    def __len__(self) -> int:
+        return sum(len(partition) for partition in self.partitions)
+
+    def __contains__(self, employee_id) -> bool:
+        number = self.partition(employee_id)
+        with self.locks[number]:
+            return employee_id in self.partitions[number]
+
+    def add(self, employee_id, employee: Employee) -> None:
+        """
+        Add an employee, failing if the id is already used
+
+        :param employee_id: an id that is unique to this employee, such as an int or str
+        :param employee: (Employee) the employee
+        """
+        number = self.partition(employee_id)
+        with self.locks[number]:
+            if employee_id in self.partitions[number]:
+                raise Exception(f"An employee with the id {employee_id} is already registered.")
+            self.partitions[number][employee_id] = employee
+
+    def get(self, employee_id) -> Employee:
+        """ Return the employee with an id, or None if there is none """
+        number = self.partition(employee_id)
+        with self.locks[number]:
+            return self.partitions[number].get(employee_id)
+
+    def remove(self, employee_id) -> Employee:
+        """ Remove and return the employee with an id, failing if there is none """
+        number = self.partition(employee_id)
+        with self.locks[number]:
+            if employee_id not in self.partitions[number]:
+                raise Exception(f"There is no employee with the id {employee_id}.")
+            return self.partitions[number].pop(employee_id)
+
+    def update(self, employee_id, **changes) -> Employee:
+        """
+        Change fields of an employee and set its updated_datetime, without another thread seeing half the change
+
+        Update listeners are called while only this partition is locked, so they must not use this registry,
+        and may run at the same time as listeners called for employees in other partitions.
+
+        :param employee_id: the id of the employee to change
+        :param changes: the new value for each field, such as salary=2000
+
+        :return: the updated employee
+        """
+        return self.update_with(employee_id, lambda employee: changes)
+
+    def update_with(self, employee_id, function) -> Employee:
+        """
+        Work out changes from an employee's current values and apply them, with no other thread changing it between
+
+        Use this to change a value based on itself, such as giving a raise.
+
+        :param employee_id: the id of the employee to change
+        :param function: (function) called with the employee, returning the changes, such as {"salary": 2000}
+
+        :return: the updated employee
+        """
+        number = self.partition(employee_id)
+        with self.locks[number]:
+            employee = self.partitions[number].get(employee_id)
+            if employee is None:
+                raise Exception(f"There is no employee with the id {employee_id}.")
+            employee.update(**function(employee))
+            return employee
+
+    def snapshot(self) -> dict:
+        """
+        Copy every employee at a single moment, while other threads keep adding and updating employees
+
+        Every partition is locked, always in the same order, so the copy never mixes old and new values.
+
+        :return: a dictionary of employee copies by their id, which later updates do not change
+        """
+        for lock in self.locks:
+            lock.acquire()
+        try:
+            return {
+                employee_id: Employee.from_fields(
+                    full_name=employee.full_name,
+                    age=employee.age,
+                    salary=employee.salary,
+                    email=employee.email,
+                    created_datetime=employee.created_datetime,
+                    updated_datetime=employee.updated_datetime
+                )
+                for partition in self.partitions
+                for employee_id, employee in partition.items()
+            }
+        finally:
+            for lock in reversed(self.locks):
+                lock.release()
+
+    def __iter__(self):
+        """ Iterate over (id, employee) pairs of a snapshot, so the registry can change while it is read """
+        return iter(self.snapshot().items())
@@ -0,0 +1,171 @@
+# Import the required libraries
+import heapq
+import os
+import pickle
+import tempfile
+
+from itertools import count, islice
+
+from custom_object import Employee, employee_fields, sort_key
+
+
+def top_k(employees, k: int, *, by: str = "salary") -> list:
+    """
+    Find the k employees with the highest value of a field, reading them one at a time
+
+    Only k employees are held at once, so the stream can be far larger than memory.
+
+    :param employees: (iterable) employees, or anything with the same fields such as table rows
+    :param k: (int) how many employees to keep
+    :param by: (str) the field to order by, such as salary or age
+
+    :return: the k employees, highest first, with ties kept in the order they were read
+    """
+    return heapq.nlargest(k, employees, key=sort_key(by))
+
+
+def bottom_k(employees, k: int, *, by: str = "salary") -> list:
+    """
+    Find the k employees with the lowest value of a field, reading them one at a time
+
+    :param employees: (iterable) employees, or anything with the same fields such as table rows
+    :param k: (int) how many employees to keep
+    :param by: (str) the field to order by, such as salary or age
+
+    :return: the k employees, lowest first, with ties kept in the order they were read
+    """
+    return heapq.nsmallest(k, employees, key=sort_key(by))
+
+
+class Reversed:
+    """ Wraps a value so it compares the opposite way, letting one heap keep either the highest or lowest values """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other) -> bool:
+        return other.value < self.value
+
+    def __gt__(self, other) -> bool:
+        return other.value > self.value
+
+    def __eq__(self, other) -> bool:
+        return self.value == other.value
+
+
+class TopK:
+    """ Keeps the k employees with the highest, or lowest, value of a field as employees keep arriving """
+
+    def __init__(self, k: int, *, by: str = "salary", largest: bool = True):
+        """
+        :param k: (int) how many employees to keep
+        :param by: (str) the field to order by, such as salary or age
+        :param largest: (bool) keep the highest values, or the lowest values when False
+        """
+        self.k = k
+        self.key = sort_key(by)
+        self.largest = largest
+
+        # A heap of (value, -arrival, employee) with the employee that would be dropped next at the front
+        # Lowest values are kept by wrapping the values so they compare the opposite way
+        self.heap = []
+        self.arrivals = count()
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def add(self, employee) -> None:
+        """ Consider one more employee, dropping the weakest kept employee if there are more than k """
+        value = self.key(employee)
+        entry = (value if self.largest else Reversed(value), -next(self.arrivals), employee)
+
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, entry)
+        elif self.k and entry[:2] > self.heap[0][:2]:
+            heapq.heapreplace(self.heap, entry)
+
+    def extend(self, employees) -> None:
+        """ Consider every employee in an iterable """
+        for employee in employees:
+            self.add(employee)
+
+    def items(self) -> list:
+        """ Return the kept employees, best first, with ties kept in the order they arrived """
+        return [employee for *_, employee in sorted(self.heap, key=lambda entry: entry[:2], reverse=True)]
+
+
+def write_run(employees: list, folder: str, number: int) -> str:
+    """
+    Write already sorted employees to a temporary file, returning its path
+
+    Only the field values are written, pickling a table row itself would write its whole table every time.
+    """
+    path = os.path.join(folder, f"run{number}.pickle")
+    with open(path, "wb") as file:
+        for employee in employees:
+            pickle.dump(employee_fields(employee), file, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def read_run(path: str):
+    """ Stream the employees written by write_run, one at a time, as new Employees """
+    with open(path, "rb") as file:
+        while True:
+            try:
+                full_name, age, salary, email, created_datetime, updated_datetime = pickle.load(file)
+            except EOFError:
+                return
+            yield Employee.from_fields(
+                full_name=full_name,
+                age=age,
+                salary=salary,
+                email=email,
+                created_datetime=created_datetime,
+                updated_datetime=updated_datetime
+            )
+
+
+def external_sort(
+    employees,
+    *,
+    by: str = "salary",
+    reverse: bool = False,
+    chunk_size: int = 100000,
+    folder: str = None
+):
+    """
+    Sort employees by a field, holding at most chunk_size of them in memory
+
+    Each chunk is sorted and written to a temporary file, and the files are then merged together.
+    Employees with the same value keep the order they were read in.
+    Once the employees do not fit in one chunk, they are read back from the files as new Employees,
+    so table rows come back as standalone copies of the rows.
+
+    :param employees: (iterable) employees, or anything with the same fields such as table rows
+    :param by: (str) the field to order by, such as salary or age
+    :param reverse: (bool) highest values first when True
+    :param chunk_size: (int) the most employees sorted in memory at once
+    :param folder: (str) where the temporary files are written, defaults to the system temporary folder
+
+    :return: a generator of the sorted employees, the temporary files are removed once it is finished
+    """
+    key = sort_key(by)
+    employees = iter(employees)
+
+    with tempfile.TemporaryDirectory(dir=folder) as folder:
+        paths = []
+        while True:
+            chunk = list(islice(employees, chunk_size))
+            if not chunk:
+                break
+            chunk.sort(key=key, reverse=reverse)
+
+            # A roster that fits in one chunk never needs to touch the disk
+            if not paths and len(chunk) < chunk_size:
+                yield from chunk
+                return
+            paths.append(write_run(chunk, folder, len(paths)))
+
+        yield from heapq.merge(*(read_run(path) for path in paths), key=key, reverse=reverse)
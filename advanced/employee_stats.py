@@ -0,0 +1,227 @@
+# Import the required libraries
+import math
+import threading
+
+import custom_object
+from custom_object import Employee
+from employee_index import identity
+
+
+class RunningMoments:
+    """ The count, mean, and variance of some values, updated as values are added and removed """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+
+        # The sum of squared differences from the mean (Welford's method)
+        self.squares = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.squares += delta * (value - self.mean)
+
+    def remove(self, value: float) -> None:
+        # Undo add, in the reverse order
+        if self.count <= 1:
+            self.__init__()
+            return
+        delta = value - self.mean
+        self.mean -= delta / (self.count - 1)
+        self.squares -= delta * (value - self.mean)
+        self.count -= 1
+
+    def variance(self) -> float:
+        """ Return the population variance, or 0 when there are no values """
+        return max(self.squares, 0.0) / self.count if self.count else 0.0
+
+
+class QuantileSketch:
+    """
+    Estimates quantiles by counting values in buckets whose width grows with the value
+
+    Every estimate is within relative_accuracy of a value that was added, for example 1% of the true salary.
+    Adding and removing values only changes one bucket count, so both cost O(1).
+    Values below 1 are counted as 0.
+    """
+
+    def __init__(self, *, relative_accuracy: float = 0.01):
+        """
+        :param relative_accuracy: (float) how far an estimate may be from the true value, as a fraction of it
+        """
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets = {}
+        self.zeros = 0
+        self.count = 0
+
+    def bucket(self, value: float) -> int:
+        """ Return the bucket a value belongs in """
+        return math.ceil(math.log(value) / self.log_gamma)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        if value < 1:
+            self.zeros += 1
+        else:
+            key = self.bucket(value)
+            self.buckets[key] = self.buckets.get(key, 0) + 1
+
+    def remove(self, value: float) -> None:
+        self.count -= 1
+        if value < 1:
+            self.zeros -= 1
+            return
+        key = self.bucket(value)
+        self.buckets[key] -= 1
+        if not self.buckets[key]:
+            del self.buckets[key]
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the value that a fraction q of the values are less than or equal to
+
+        :param q: (float) between 0 and 1, 0.5 is the median
+
+        :return: the estimate, or None when there are no values
+        """
+        if not self.count:
+            return None
+
+        # The position of the wanted value if every value was sorted
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                # The middle of the bucket, measured so the relative error is the same at both ends
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+
+class EmployeeStats:
+    """
+    Live salary and age statistics that follow employees as they are created, updated, and removed
+
+    Only changes made with Employee.update are followed, setting a field directly such as employee.salary = 10
+    is not seen and leaves the statistics out of date.
+    Every counted employee is kept alive until it is removed, so use watch only for as long as it is needed,
+    such as inside a with block which stops watching when it ends.
+    """
+
+    def __init__(self, employees=(), *, watch: bool = False, bin_width: int = 10, relative_accuracy: float = 0.01):
+        """
+        :param employees: (iterable) employees that already exist
+        :param watch: (bool) whether every employee created from now on, anywhere, is added automatically
+        :param bin_width: (int) how many years each age histogram group covers
+        :param relative_accuracy: (float) how far salary percentiles may be from the true value, as a fraction
+        """
+        self.bin_width = bin_width
+        self.salary = RunningMoments()
+        self.age = RunningMoments()
+        self.salary_sketch = QuantileSketch(relative_accuracy=relative_accuracy)
+        self.age_histogram = {}
+
+        # The employees counted by their identity, so updates to other employees are ignored
+        self.members = {}
+
+        # Held while the statistics are read or changed, since employees may be created and updated by several threads
+        self.lock = threading.RLock()
+
+        # Updates are always followed, new employees only when watching, until close or these are no longer used
+        self.update_listener = custom_object.add_listener(custom_object.update_listeners, self.on_update)
+        self.created_listener = custom_object.add_listener(custom_object.created_listeners, self.add) if watch else None
+
+        for employee in employees:
+            self.add(employee)
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def __enter__(self) -> "EmployeeStats":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """ Stop following employees, the statistics will no longer change on their own """
+        custom_object.remove_listener(custom_object.update_listeners, self.update_listener)
+        if self.created_listener:
+            custom_object.remove_listener(custom_object.created_listeners, self.created_listener)
+
+    def add(self, employee: Employee) -> None:
+        """ Count an employee or table row, adding it again does nothing """
+        key = identity(employee)
+        with self.lock:
+            if key in self.members:
+                return
+            self.members[key] = employee
+            self.add_salary(employee.salary)
+            self.add_age(employee.age)
+
+    def remove(self, employee: Employee) -> None:
+        """ Stop counting an employee """
+        key = identity(employee)
+        with self.lock:
+            if key not in self.members:
+                raise Exception(f"The employee {employee.full_name} is not counted in these statistics.")
+            del self.members[key]
+            self.remove_salary(employee.salary)
+            self.remove_age(employee.age)
+
+    def on_update(self, employee: Employee, field: str, old_value, new_value) -> None:
+        """ Replace the old salary or age of a counted employee with the new one """
+        with self.lock:
+            if identity(employee) not in self.members:
+                return
+            if field == "salary":
+                self.remove_salary(old_value)
+                self.add_salary(new_value)
+            elif field == "age":
+                self.remove_age(old_value)
+                self.add_age(new_value)
+
+    def add_salary(self, salary: int) -> None:
+        self.salary.add(salary)
+        self.salary_sketch.add(salary)
+
+    def remove_salary(self, salary: int) -> None:
+        self.salary.remove(salary)
+        self.salary_sketch.remove(salary)
+
+    def add_age(self, age: int) -> None:
+        self.age.add(age)
+        group = age // self.bin_width * self.bin_width
+        self.age_histogram[group] = self.age_histogram.get(group, 0) + 1
+
+    def remove_age(self, age: int) -> None:
+        self.age.remove(age)
+        group = age // self.bin_width * self.bin_width
+        self.age_histogram[group] -= 1
+        if not self.age_histogram[group]:
+            del self.age_histogram[group]
+
+    def snapshot(self, *, percentiles=(0.5, 0.9, 0.99)) -> dict:
+        """
+        Return the current statistics
+
+        :param percentiles: (tuple) the salary percentiles to estimate, as fractions
+
+        :return: a dictionary of the count, salary and age statistics, and the age histogram in age order
+        """
+        with self.lock:
+            return {
+                "count": len(self.members),
+                "salary_mean": self.salary.mean,
+                "salary_variance": self.salary.variance(),
+                "salary_stddev": math.sqrt(self.salary.variance()),
+                "salary_percentiles": {q: self.salary_sketch.quantile(q) for q in percentiles},
+                "age_mean": self.age.mean,
+                "age_variance": self.age.variance(),
+                "age_histogram": dict(sorted(self.age_histogram.items())),
+            }
@@ -0,0 +1,177 @@
+# Import the required libraries
+import mmap
+import struct
+
+from clocks import from_epoch_ns, to_epoch_ns
+from custom_object import Employee
+from employee_table import NOT_UPDATED
+
+# The first bytes of every employee store file
+MAGIC = b"EMPS"
+
+# Increase this whenever the layout below changes
+SCHEMA_VERSION = 1
+
+# Magic, schema version, row size, row count, where the string table starts, and the number of strings
+HEADER = struct.Struct("<4sHHQQQ")
+
+# Name string id, email string id, age, salary, created and updated nanoseconds since the epoch
+ROW = struct.Struct("<IIiqqq")
+
+# Every entry in the string table's offset list
+OFFSET = struct.Struct("<Q")
+
+
+def write_employees(path: str, employees) -> int:
+    """
+    Write employees to a binary file that EmployeeStore can open without reading the whole file
+
+    The file is a header, then one fixed size row per employee, then a table of every distinct name and email.
+    Rows refer to names and emails by their position in that table, so repeated values are only stored once.
+
+    :param path: (str) the file to create or replace
+    :param employees: (iterable) the employees to write, rows from an EmployeeTable work too
+
+    :return: the number of employees written
+    """
+    # Every distinct string, and its id, in the order it was first seen
+    string_ids = {}
+    row_count = 0
+
+    with open(path, "wb") as file:
+        # Leave room for the header, it is written last once the counts are known
+        file.write(bytes(HEADER.size))
+
+        for employee in employees:
+            name_id = string_ids.setdefault(employee.full_name, len(string_ids))
+            email_id = string_ids.setdefault(employee.email, len(string_ids))
+            updated = employee.updated_datetime
+            file.write(ROW.pack(
+                name_id,
+                email_id,
+                employee.age,
+                employee.salary,
+                to_epoch_ns(employee.created_datetime),
+                to_epoch_ns(updated) if updated else NOT_UPDATED
+            ))
+            row_count += 1
+
+        # The string table is the end of every string in the blob that follows it
+        strings_offset = file.tell()
+        encoded = [value.encode() for value in string_ids]
+        end = 0
+        file.write(OFFSET.pack(0))
+        for value in encoded:
+            end += len(value)
+            file.write(OFFSET.pack(end))
+        file.write(b"".join(encoded))
+
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, SCHEMA_VERSION, ROW.size, row_count, strings_offset, len(encoded)))
+
+    return row_count
+
+
+class EmployeeStore:
+    """ Reads employees straight out of a memory mapped file written by write_employees """
+
+    def __init__(self, path: str):
+        """
+        Open the file and read only its header, rows are read when they are asked for
+
+        :param path: (str) a file written by write_employees
+        """
+        with open(path, "rb") as file:
+            # mmap can not map an empty file, which is never a valid store anyway
+            if file.seek(0, 2) < HEADER.size:
+                raise Exception(f"{path} is not an employee store, it is too small.")
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, row_size, self.row_count, self.strings_offset, self.string_count = (
+            HEADER.unpack_from(self.buffer)
+        )
+        if magic != MAGIC:
+            self.close()
+            raise Exception(f"{path} is not an employee store.")
+        if version != SCHEMA_VERSION:
+            self.close()
+            raise Exception(f"{path} uses schema version {version}, only version {SCHEMA_VERSION} can be read.")
+        if row_size != ROW.size:
+            self.close()
+            raise Exception(f"{path} has {row_size} byte rows, version {version} rows are {ROW.size} bytes.")
+
+        # Strings start right after the list of their offsets
+        self.blob_offset = self.strings_offset + OFFSET.size * (self.string_count + 1)
+
+        # Slices of this view read the mapped file without copying it
+        self.view = memoryview(self.buffer)
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def __getitem__(self, index: int) -> Employee:
+        return self.employee(index)
+
+    def __iter__(self):
+        for index in range(self.row_count):
+            yield self.employee(index)
+
+    def __enter__(self) -> "EmployeeStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """ Unmap the file, every view returned by string_bytes must be released first """
+        if hasattr(self, "view"):
+            self.view.release()
+        self.buffer.close()
+
+    def row(self, index: int) -> tuple:
+        """
+        Read one row's raw values without decoding any strings
+
+        :param index: (int) the position of the employee in the file
+
+        :return: the name id, email id, age, salary, created nanoseconds, and updated nanoseconds
+        """
+        if index < 0:
+            index += self.row_count
+        if not 0 <= index < self.row_count:
+            raise IndexError("EmployeeStore index out of range")
+        return ROW.unpack_from(self.buffer, HEADER.size + index * ROW.size)
+
+    def string_bytes(self, string_id: int) -> memoryview:
+        """
+        Return the encoded bytes of a single string as a view of the mapped file, without copying them
+
+        :param string_id: (int) the position of the string in the string table
+
+        :return: a memoryview that must be released, or no longer used, before the store is closed
+        """
+        start, end = struct.unpack_from("<QQ", self.buffer, self.strings_offset + string_id * OFFSET.size)
+        return self.view[self.blob_offset + start:self.blob_offset + end]
+
+    def string(self, string_id: int) -> str:
+        """ Decode a single string from the string table, straight from the mapped file into a new str """
+        with self.string_bytes(string_id) as encoded:
+            return str(encoded, "utf-8")
+
+    def employee(self, index: int) -> Employee:
+        """
+        Read a single employee, only its own row and strings are decoded
+
+        :param index: (int) the position of the employee in the file
+
+        :return: the employee
+        """
+        name_id, email_id, age, salary, created, updated = self.row(index)
+        return Employee.from_fields(
+            full_name=self.string(name_id),
+            age=age,
+            salary=salary,
+            email=self.string(email_id),
+            created_datetime=from_epoch_ns(created),
+            updated_datetime=None if updated == NOT_UPDATED else from_epoch_ns(updated)
+        )
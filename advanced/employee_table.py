@@ -0,0 +1,289 @@
+# Import the required libraries
+from array import array
+from datetime import datetime
+
+import numpy as np
+
+import custom_object
+from clocks import from_epoch_ns, to_epoch_ns
+from custom_object import Employee
+
+# Stored in the updated column for employees that were never updated
+NOT_UPDATED = -(2 ** 63)
+
+
+class StringColumn:
+    """ A column of strings packed into one UTF-8 buffer instead of one str object per row """
+
+    def __init__(self):
+        # The encoded strings, mostly back to back
+        self.data = bytearray()
+
+        # Where every string starts and ends in data
+        self.starts = array("Q")
+        self.ends = array("Q")
+
+        # The bytes in data no longer used by any string, left behind by set
+        self.unused = 0
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, index: int) -> str:
+        return self.data[self.starts[index]:self.ends[index]].decode()
+
+    def append(self, value: str) -> None:
+        """ Add a string to the end of the column """
+        self.starts.append(len(self.data))
+        self.data += value.encode()
+        self.ends.append(len(self.data))
+
+    def set(self, index: int, value: str) -> None:
+        """ Replace a string in the column without moving any other string """
+        start = self.starts[index]
+        end = self.ends[index]
+        encoded = value.encode()
+
+        # A string that fits is written over the old one, a longer one is added to the end of data instead
+        if len(encoded) <= end - start:
+            self.data[start:start + len(encoded)] = encoded
+            self.unused += end - start - len(encoded)
+        else:
+            self.unused += end - start
+            start = len(self.data)
+            self.data += encoded
+            self.starts[index] = start
+        self.ends[index] = start + len(encoded)
+
+        # Pack the strings back together once more than half of data is left behind, so each set is O(1) on average
+        if self.unused > len(self.data) // 2:
+            self.compact()
+
+    def compact(self) -> None:
+        """ Copy every string back to back into a new buffer, dropping the bytes set left behind """
+        data = bytearray()
+        for index in range(len(self)):
+            start = len(data)
+            data += self.data[self.starts[index]:self.ends[index]]
+            self.starts[index] = start
+            self.ends[index] = len(data)
+        self.data = data
+        self.unused = 0
+
+    def nbytes(self) -> int:
+        """ Return the number of bytes used to hold the column's values """
+        return len(self.data) + self.starts.itemsize * (len(self.starts) + len(self.ends))
+
+
+class EmployeeTable:
+    """ Holds many employees as typed columns instead of one Employee object each """
+
+    def __init__(self, employees=()):
+        # Every column holds one value per employee, in the same order
+        self.full_name = StringColumn()
+        self.age = array("i")
+        self.salary = array("q")
+        self.email = StringColumn()
+        self.created = array("q")
+        self.updated = array("q")
+
+        # Add any employees given
+        self.extend(employees)
+
+    def __len__(self) -> int:
+        return len(self.age)
+
+    def __getitem__(self, index: int) -> "EmployeeRow":
+        # Support negative indexes the same way a list does
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("EmployeeTable index out of range")
+        return EmployeeRow(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield EmployeeRow(self, index)
+
+    def append_fields(
+        self,
+        *,
+        full_name: str,
+        age: int,
+        salary: int,
+        email: str = "",
+        created_datetime: datetime = None,
+        updated_datetime: datetime = None
+    ) -> None:
+        """
+        Add a single employee to the table from its field values
+
+        :param full_name: (str) the already formatted full name
+        :param age: (int) the employee's age
+        :param salary: (int) the employee's salary
+        :param email: (str) the employee's email
+        :param created_datetime: (datetime) when the employee was created, defaults to now
+        :param updated_datetime: (datetime) when the employee was last updated, if ever
+        """
+        self.full_name.append(full_name)
+        self.age.append(age)
+        self.salary.append(salary)
+        self.email.append(email)
+        self.created.append(to_epoch_ns(created_datetime or custom_object.get_datetime()))
+        self.updated.append(to_epoch_ns(updated_datetime) if updated_datetime else NOT_UPDATED)
+
+    def append(self, employee: Employee) -> None:
+        """
+        Add a single employee to the table
+
+        :param employee: (Employee) the employee, or a row from another table, to copy into this table
+        """
+        self.append_fields(
+            full_name=employee.full_name,
+            age=employee.age,
+            salary=employee.salary,
+            email=employee.email,
+            created_datetime=employee.created_datetime,
+            updated_datetime=employee.updated_datetime
+        )
+
+    def extend(self, employees) -> None:
+        """
+        Add many employees to the table, one column at a time
+
+        :param employees: (iterable) the employees to copy into this table
+        """
+        # Columns are filled in bulk so the list is needed more than once
+        employees = list(employees)
+
+        for employee in employees:
+            self.full_name.append(employee.full_name)
+            self.email.append(employee.email)
+
+        self.age.extend(employee.age for employee in employees)
+        self.salary.extend(employee.salary for employee in employees)
+        self.created.extend(to_epoch_ns(employee.created_datetime) for employee in employees)
+        self.updated.extend(
+            to_epoch_ns(employee.updated_datetime) if employee.updated_datetime else NOT_UPDATED
+            for employee in employees
+        )
+
+    def salaries(self) -> np.ndarray:
+        """ Return the salary column as a NumPy array sharing its memory, the table can not grow until it is released """
+        return np.frombuffer(self.salary, dtype=np.int64)
+
+    def ages(self) -> np.ndarray:
+        """ Return the age column as a NumPy array sharing its memory, the table can not grow until it is released """
+        return np.frombuffer(self.age, dtype=np.int32)
+
+    def total_salary(self) -> int:
+        """ Return the sum of every employee's salary """
+        return int(self.salaries().sum())
+
+    def mean_salary(self) -> float:
+        """ Return the average salary, or 0 for an empty table """
+        return float(self.salaries().mean()) if len(self) else 0.0
+
+    def mean_age(self) -> float:
+        """ Return the average age, or 0 for an empty table """
+        return float(self.ages().mean()) if len(self) else 0.0
+
+    def age_histogram(self, bin_width: int = 10) -> dict:
+        """
+        Count the employees in each age group
+
+        :param bin_width: (int) how many years each group covers
+
+        :return: a dictionary of the first age in each group to the number of employees in it, in age order
+        """
+        # unique sorts the groups and counts each one over the whole column at once
+        groups, counts = np.unique(self.ages() // bin_width, return_counts=True)
+        return {int(group) * bin_width: int(count) for group, count in zip(groups, counts)}
+
+    def nbytes(self) -> int:
+        """ Return the number of bytes used to hold every column """
+        numeric = (self.age, self.salary, self.created, self.updated)
+        return (
+                self.full_name.nbytes() +
+                self.email.nbytes() +
+                sum(column.itemsize * len(column) for column in numeric)
+        )
+
+
+class EmployeeRow:
+    """ A view of one row in an EmployeeTable that behaves like an Employee """
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table: EmployeeTable, index: int):
+        self.table = table
+        self.index = index
+
+    @property
+    def full_name(self) -> str:
+        return self.table.full_name[self.index]
+
+    @full_name.setter
+    def full_name(self, value: str) -> None:
+        self.table.full_name.set(self.index, value)
+
+    @property
+    def age(self) -> int:
+        return self.table.age[self.index]
+
+    @age.setter
+    def age(self, value: int) -> None:
+        self.table.age[self.index] = value
+
+    @property
+    def salary(self) -> int:
+        return self.table.salary[self.index]
+
+    @salary.setter
+    def salary(self, value: int) -> None:
+        self.table.salary[self.index] = value
+
+    @property
+    def email(self) -> str:
+        return self.table.email[self.index]
+
+    @email.setter
+    def email(self, value: str) -> None:
+        self.table.email.set(self.index, value)
+
+    @property
+    def created_datetime(self) -> datetime:
+        return from_epoch_ns(self.table.created[self.index])
+
+    @property
+    def updated_datetime(self) -> datetime:
+        value = self.table.updated[self.index]
+        return None if value == NOT_UPDATED else from_epoch_ns(value)
+
+    @updated_datetime.setter
+    def updated_datetime(self, value: datetime) -> None:
+        self.table.updated[self.index] = to_epoch_ns(value) if value else NOT_UPDATED
+
+    # Reuse the Employee behaviour, it only relies on the attributes above
+    __str__ = Employee.__str__
+    __repr__ = Employee.__repr__
+    __eq__ = Employee.__eq__
+    __lt__ = Employee.__lt__
+    __le__ = Employee.__le__
+    __gt__ = Employee.__gt__
+    __ge__ = Employee.__ge__
+    display_company_message = Employee.display_company_message
+    greet_employee = Employee.greet_employee
+    retrieve_email = Employee.retrieve_email
+    update = Employee.update
+
+    def to_employee(self) -> Employee:
+        """ Copy this row into a standalone Employee """
+        return Employee.from_fields(
+            full_name=self.full_name,
+            age=self.age,
+            salary=self.salary,
+            email=self.email,
+            created_datetime=self.created_datetime,
+            updated_datetime=self.updated_datetime
+        )
@@ -0,0 +1,149 @@
+# Import the required libraries
+import logging
+
+from collections import deque
+from contextlib import contextmanager
+
+
+class Event:
+    """ Something that happened, such as an employee being created, with its message formatted only when needed """
+
+    __slots__ = ("name", "template", "args")
+
+    def __init__(self, name: str, template: str, args: tuple = ()):
+        # A short name to find the event by, such as "employee_created"
+        self.name = name
+
+        # A %-style message and the values that fill it in
+        self.template = template
+        self.args = args
+
+    @property
+    def message(self) -> str:
+        """ Return the message with the values filled in """
+        return self.template % self.args if self.args else self.template
+
+    def __repr__(self) -> str:
+        return f"Event({self.name!r}, {self.message!r})"
+
+
+class PrintSink:
+    """ Prints every message, the same as the original print calls """
+
+    def emit(self, name: str, template: str, args: tuple) -> None:
+        print(template % args if args else template)
+
+
+class NullSink:
+    """ Ignores every message, so creating objects in bulk pays nothing for output """
+
+    def emit(self, name: str, template: str, args: tuple) -> None:
+        pass
+
+
+class BufferedFileSink:
+    """ Writes every message to a file through a large buffer instead of one write per message """
+
+    def __init__(self, path: str, *, buffer_size: int = 1 << 20):
+        """
+        :param path: (str) the file messages are added to the end of
+        :param buffer_size: (int) how many bytes are collected before they are written to the file
+        """
+        self.file = open(path, "a", buffering=buffer_size, encoding="utf-8")
+
+    def emit(self, name: str, template: str, args: tuple) -> None:
+        self.file.write((template % args if args else template) + "\n")
+
+    def close(self) -> None:
+        """ Write anything still buffered and close the file """
+        self.file.close()
+
+    def __enter__(self) -> "BufferedFileSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class RingBufferSink:
+    """ Keeps the most recent events in memory, which tests can check instead of the printed output """
+
+    def __init__(self, maxlen: int = 1000):
+        """
+        :param maxlen: (int) how many events are kept before the oldest is dropped
+        """
+        self.events = deque(maxlen=maxlen)
+
+    def emit(self, name: str, template: str, args: tuple) -> None:
+        self.events.append(Event(name, template, args))
+
+    def names(self) -> list:
+        """ Return the name of every kept event, oldest first """
+        return [event.name for event in self.events]
+
+    def messages(self) -> list:
+        """ Return the message of every kept event, oldest first """
+        return [event.message for event in self.events]
+
+
+class LoggingSink:
+    """ Sends every message to a logger, which only formats it if the level is enabled """
+
+    def __init__(self, logger: logging.Logger = None, *, level: int = logging.INFO):
+        """
+        :param logger: (Logger) where messages are sent, defaults to the "advanced" logger
+        :param level: (int) the logging level every message is sent with
+        """
+        self.logger = logger or logging.getLogger("advanced")
+        self.level = level
+
+    def emit(self, name: str, template: str, args: tuple) -> None:
+        # Passing the args separately lets logging skip formatting messages that are filtered out
+        self.logger.log(self.level, template, *args, extra={"event": name})
+
+
+# A single sink that drops everything, use it instead of creating a new NullSink each time
+NULL_SINK = NullSink()
+
+# The sink used when a call does not provide its own
+current_sink = PrintSink()
+
+
+def emit(name: str, template: str, *args, sink=None) -> None:
+    """
+    Send an event to the sink given, or the current sink
+
+    :param name: (str) a short name for the event
+    :param template: (str) a %-style message
+    :param args: the values that fill in the message
+    :param sink: a sink used for this call only
+    """
+    (sink or current_sink).emit(name, template, args)
+
+
+def set_sink(sink) -> object:
+    """
+    Change the sink used by every call that does not provide its own
+
+    :param sink: the new sink, such as NULL_SINK
+
+    :return: the previous sink, so it can be put back
+    """
+    global current_sink
+    previous = current_sink
+    current_sink = sink
+    return previous
+
+
+@contextmanager
+def use_sink(sink):
+    """
+    Use a sink for everything inside a with block, then put the previous sink back
+
+    :param sink: the sink used inside the with block
+    """
+    previous = set_sink(sink)
+    try:
+        yield sink
+    finally:
+        set_sink(previous)
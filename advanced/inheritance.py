@@ -1,28 +1,82 @@
 # Import the required libraries
 import sys
 
+from breeds import Breed, breed_registry
+from events import emit
+
 
 class Animal:
-    # An animal's name
-    name = ""
+    # The type written in rows for this class, which animal_classes finds the class by
+    tag = "Animal"
+
+    # The keys of the rows to_row returns, a subclass whose rows add a field adds it here too so CSV reports have it
+    row_fields = ("type", "name", "age")
+
+    # Only these attributes can be set, which removes the per-animal __dict__
+    __slots__ = (
+        # An animal's name
+        "name",
 
-    # An animal's age
-    age = 0
+        # An animal's age
+        "age",
+    )
 
     def __init__(
         self,
         *,
         name: str,
         age: int,
+        sink=None
     ):
 
-        # Display a message to track code progress
-        print("Creating a new animal!")
+        # Display a message to track code progress, sink can replace where the message goes for this call
+        emit("animal_created", "Creating a new animal!", sink=sink)
 
         # Set up the object variables using the information given
         self.name = name.capitalize()
         self.age = age
 
+    def __init_subclass__(cls, *, tag: str = None, **kwargs):
+        """
+        Register every subclass so rows tagged with its name can be turned back into it
+
+        :param tag: (str) the type written in rows for this class, defaults to the class name
+        """
+        super().__init_subclass__(**kwargs)
+
+        # A later class with the same tag replaces the earlier one, such as when a module is reloaded
+        cls.tag = tag or cls.__name__
+        animal_classes[cls.tag] = cls
+
+    @classmethod
+    def from_rows(cls, rows: list) -> list:
+        """
+        Build an animal of this class from every row without running __init__, so no messages are displayed
+
+        Subclasses that add fields extend this instead of from_row, so a whole batch is built in one call.
+
+        :param rows: (list) rows with name and age, extra keys such as type are ignored
+
+        :return: animals equal to ones created with __init__ from the same values
+        """
+        new = cls.__new__
+        animals = []
+        for row in rows:
+            animal = new(cls)
+            animal.name = row["name"].capitalize()
+            animal.age = int(row["age"])
+            animals.append(animal)
+        return animals
+
+    @classmethod
+    def from_row(cls, row: dict) -> "Animal":
+        """ Build one animal of this class from a row, without displaying a message """
+        return cls.from_rows([row])[0]
+
+    def to_row(self) -> dict:
+        """ Return the animal's type and fields as a dictionary that from_row can read back """
+        return {"type": self.tag, "name": self.name, "age": self.age}
+
     def __str__(self) -> str:
         """ Override the string function to format it appropriately """
         return (
@@ -36,32 +90,85 @@ class Animal:
         return str(self)
 
     def __eq__(self, target) -> bool:
-        """ Override the equal to compare our overriden str message """
-        return str(self) == str(target)
+        """ Override the equal to compare every field, custom_object.equal_as_string compares the str messages """
+        # Only animals of exactly the same class can be equal, a Dog is never equal to a plain Animal
+        if type(self) is not type(target):
+            return NotImplemented
+        return self.fields() == target.fields()
+
+    # Every field can change after an animal is stored in a set or dict, so animals can not be hashed, like employees
+    # Use animal.fields() as the set member or dict key instead
+    __hash__ = None
+
+    def fields(self) -> tuple:
+        """ Return every field of the animal, used to compare animals and as a hashable key for sets and dicts """
+        return self.name, self.age
 
-    def speak(self) -> None:
+    def speak(self, *, sink=None) -> None:
         """ This function displays a message from the animal """
-        print(f"{self.name}: I'm speaking!")
+        emit("animal_spoke", "%s: I'm speaking!", self.name, sink=sink)
 
-    def move(self) -> None:
+    def move(self, *, sink=None) -> None:
         """ This function displays a message from the animal """
-        print(f"{self.name}: I'm moving!")
+        emit("animal_moved", "%s: I'm moving!", self.name, sink=sink)
 
-    def eat(self) -> None:
+    def eat(self, *, sink=None) -> None:
         """ This function displays a message from the animal """
-        print(f"{self.name}: Nom Nom Nom!")
+        emit("animal_ate", "%s: Nom Nom Nom!", self.name, sink=sink)
+
+
+# Every Animal class by the type written in its rows, subclasses add themselves when they are defined
+animal_classes = {"Animal": Animal}
 
 
 class Dog(Animal):
+    # The keys of the rows to_row returns
+    row_fields = ("type", "name", "breed", "age")
+
+    # Only the attributes Dog adds to Animal
+    __slots__ = (
+        # The id of a dog's breed in the breed registry, the breed's details are shared instead of copied
+        "breed_id",
+    )
 
     def __init__(
             self,
             *,
             name: str,
             age: int,
+            breed: str = "German Shepard",
+            sink=None
     ):
-        super().__init__(name=name, age=age)
-        self.breed = "German Shepard"
+        super().__init__(name=name, age=age, sink=sink)
+        self.breed_id = breed_registry.find(breed).id
+
+    @property
+    def breed(self) -> str:
+        """ The name of the dog's breed """
+        return breed_registry.breeds[self.breed_id].name
+
+    @property
+    def breed_details(self) -> Breed:
+        """ Every detail of the dog's breed, shared with every other dog of the breed """
+        return breed_registry.breeds[self.breed_id]
+
+    @classmethod
+    def from_rows(cls, rows: list) -> list:
+        """ Build a dog from every row with name, age, and optionally breed, looking each breed up only once """
+        dogs = super().from_rows(rows)
+
+        breed_ids = {}
+        for dog, row in zip(dogs, rows):
+            breed = row.get("breed") or "German Shepard"
+            breed_id = breed_ids.get(breed)
+            if breed_id is None:
+                breed_id = breed_ids[breed] = breed_registry.find(breed).id
+            dog.breed_id = breed_id
+        return dogs
+
+    def to_row(self) -> dict:
+        """ Return the dog's type and fields as a dictionary that from_row can read back """
+        return {"type": self.tag, "name": self.name, "breed": self.breed, "age": self.age}
 
     def __str__(self) -> str:
         """ Override the string function to format it appropriately """
@@ -73,13 +180,17 @@ class Dog(Animal):
 
         )
 
-    def speak(self) -> None:
+    def fields(self) -> tuple:
+        """ Return every field of the dog, used to compare dogs and as a hashable key for sets and dicts """
+        return self.name, self.breed_id, self.age
+
+    def speak(self, *, sink=None) -> None:
         """ This function displays a message from the animal """
-        print(f"{self.name}: Woof Woof!")
+        emit("animal_spoke", "%s: Woof Woof!", self.name, sink=sink)
 
-    def move(self) -> None:
+    def move(self, *, sink=None) -> None:
         """ This function displays a message from the animal """
-        print(f"{self.name}: I'm running!")
+        emit("animal_moved", "%s: I'm running!", self.name, sink=sink)
 
 
 def main():
@@ -0,0 +1,158 @@
+# Import the required libraries
+import numpy as np
+
+import custom_object
+from clocks import to_epoch_ns
+from employee_table import EmployeeTable
+
+
+def round_half_up(values: np.ndarray) -> np.ndarray:
+    """ Round to whole numbers with halves always going up, np.rint sends halves to the nearest even number instead """
+    return np.floor(values + 0.5)
+
+
+class Payroll:
+    """ Salary changes worked out for every employee at once, on NumPy columns instead of one employee at a time """
+
+    def __init__(self, salaries, ages, *, employees=None, table: EmployeeTable = None):
+        """
+        Use Payroll.from_employees or Payroll.from_table instead of creating a Payroll directly
+
+        :param salaries: the current salary of every employee
+        :param ages: the age of every employee, in the same order
+        :param employees: (list) the employees the salaries came from, if any
+        :param table: (EmployeeTable) the table the salaries came from, if any
+        """
+        self.current = np.asarray(salaries, dtype=np.int64)
+        self.ages = np.asarray(ages, dtype=np.int64)
+
+        # The new salaries are worked out with fractions, and only rounded to whole numbers when written back
+        self.salaries = self.current.astype(np.float64)
+        self.employees = employees
+        self.table = table
+
+    @classmethod
+    def from_employees(cls, employees) -> "Payroll":
+        """ Copy the salaries and ages out of a list of employees """
+        employees = list(employees)
+        salaries = np.fromiter((employee.salary for employee in employees), dtype=np.int64, count=len(employees))
+        ages = np.fromiter((employee.age for employee in employees), dtype=np.int64, count=len(employees))
+        return cls(salaries, ages, employees=employees)
+
+    @classmethod
+    def from_table(cls, table: EmployeeTable) -> "Payroll":
+        """
+        Copy the salary and age columns of a table, in bulk instead of one employee at a time
+
+        The columns are copied so the table can still have employees added while the payroll is used,
+        write_back only changes the employees that were in the table when the payroll was made.
+        """
+        return cls(table.salaries().copy(), table.ages().copy(), table=table)
+
+    def __len__(self) -> int:
+        return len(self.salaries)
+
+    def raise_by_age_band(self, bands: list) -> "Payroll":
+        """
+        Give every employee the percentage raise of their age band
+
+        :param bands: (list) (youngest age, percent) pairs, such as [(18, 3), (30, 2.5), (50, 2)]
+            Each band covers every age until the next band starts, employees younger than every band get nothing
+
+        :return: this payroll, so operations can be chained
+        """
+        bands = sorted(bands)
+        starts = np.array([start for start, _ in bands])
+        percents = np.array([0.0] + [percent for _, percent in bands])
+
+        # The band number for every employee, 0 is younger than every band
+        band = np.searchsorted(starts, self.ages, side="right")
+        self.salaries *= 1 + percents[band] / 100
+        return self
+
+    def raise_all(self, percent: float) -> "Payroll":
+        """ Give every employee the same percentage raise """
+        self.salaries *= 1 + percent / 100
+        return self
+
+    def cap(self, maximum: float = None, *, minimum: float = None) -> "Payroll":
+        """
+        Keep every salary within a range
+
+        :param maximum: (float) the highest salary allowed
+        :param minimum: (float) the lowest salary allowed
+
+        :return: this payroll, so operations can be chained
+        """
+        np.clip(self.salaries, minimum, maximum, out=self.salaries)
+        return self
+
+    def round(self, *, to: int = 1, mode: str = "nearest") -> "Payroll":
+        """
+        Round every salary to a multiple of a number
+
+        :param to: (int) the multiple, such as 100 for whole hundreds
+        :param mode: (str) nearest, up, or down
+
+        :return: this payroll, so operations can be chained
+        """
+        functions = {"nearest": round_half_up, "up": np.ceil, "down": np.floor}
+        if mode not in functions:
+            raise Exception(f"The rounding mode {mode} is not supported, please use nearest, up, or down.")
+        self.salaries = functions[mode](self.salaries / to) * to
+        return self
+
+    def bonuses(self, percent: float) -> np.ndarray:
+        """ Return every employee's bonus as a percentage of their new salary, without changing the salaries """
+        return self.salaries * percent / 100
+
+    def total(self) -> float:
+        """ Return the total of every new salary """
+        return float(self.salaries.sum())
+
+    def project(self, years: int, percent: float) -> np.ndarray:
+        """
+        Project the total payroll if every salary grows by the same percentage each year
+
+        :param years: (int) how many years to project
+        :param percent: (float) the yearly raise
+
+        :return: the projected total for each year, starting with next year
+        """
+        return self.total() * (1 + percent / 100) ** np.arange(1, years + 1)
+
+    def changed(self) -> np.ndarray:
+        """ Return the positions of the employees whose salary changed """
+        return np.flatnonzero(self.final() != self.current)
+
+    def final(self) -> np.ndarray:
+        """ Return the new salaries rounded to whole numbers """
+        return round_half_up(self.salaries).astype(np.int64)
+
+    def write_back(self) -> int:
+        """
+        Save the new salaries to the employees or table they came from, setting updated_datetime for each change
+
+        Every changed employee gets the same updated_datetime.
+        A table's columns are written in bulk, unless an index, statistics, or journal is listening for updates,
+        then each changed row goes through update like a list of employees does so they hear about it.
+
+        :return: the number of employees whose salary changed
+        """
+        final = self.final()
+        changed = self.changed()
+        updated = custom_object.get_datetime()
+
+        if self.table is not None and not custom_object.update_listeners:
+            # Write straight into the table's columns, the views are dropped straight away so the table can still grow
+            self.table.salaries()[changed] = final[changed]
+            np.frombuffer(self.table.updated, dtype=np.int64)[changed] = to_epoch_ns(updated)
+        else:
+            # Update goes through Employee.update so indexes, statistics, and journals hear about each change
+            employees = self.employees if self.table is None else self.table
+            for position, salary in zip(changed.tolist(), final[changed].tolist()):
+                employees[position].update(salary=salary, updated_datetime=updated)
+        self.current = final
+
+        self.salaries = final.astype(np.float64)
+        return len(changed)
@@ -0,0 +1,228 @@
+# Import the required libraries
+import sys
+import time
+
+import numpy as np
+
+from inheritance import Animal, Dog
+
+# The days in a year, used to age animals by a number of days
+DAYS_PER_YEAR = 365.25
+
+
+class SpeciesState:
+    """ The state of every animal of one species, kept as one array per field instead of one object per animal """
+
+    def __init__(self, ages, names=None):
+        """
+        :param ages: the age in years of every animal
+        :param names: (list) the name of every animal, in the same order, if they have names
+        """
+        count = len(ages)
+        self.ages = np.asarray(ages, dtype=np.float64)
+        self.names = list(names) if names is not None else None
+
+        # Where each animal is, how hungry it is from 0 to 1, and what it has done so far
+        self.positions = np.zeros((count, 2), dtype=np.float32)
+        self.hunger = np.zeros(count, dtype=np.float32)
+        self.distance = np.zeros(count, dtype=np.float64)
+        self.meals = np.zeros(count, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.ages)
+
+    def extend(self, other: "SpeciesState") -> None:
+        """ Add every animal of another state of the same species to the end of this one """
+        # Animals added without names are given None as their name once named animals join them
+        if self.names is not None or other.names is not None:
+            self.names = (self.names or [None] * len(self)) + (other.names or [None] * len(other))
+
+        self.ages = np.concatenate((self.ages, other.ages))
+        self.positions = np.concatenate((self.positions, other.positions))
+        self.hunger = np.concatenate((self.hunger, other.hunger))
+        self.distance = np.concatenate((self.distance, other.distance))
+        self.meals = np.concatenate((self.meals, other.meals))
+
+
+class AnimalBehaviour:
+    """ How every animal of a species ages, moves, and eats, applied to the whole species at once """
+
+    # The most distance moved in a day
+    speed = 1.0
+
+    # How much hungrier an animal gets each day, it eats once its hunger reaches 1
+    metabolism = 0.34
+
+    def tick(self, state: SpeciesState, random: np.random.Generator, days: float) -> None:
+        """
+        Advance every animal of a species by a number of days
+
+        :param state: (SpeciesState) the animals to advance
+        :param random: (np.random.Generator) where the random movement comes from
+        :param days: (float) how many days pass
+        """
+        self.age(state, days)
+        self.move(state, random, days)
+        self.eat(state, days)
+
+    def age(self, state: SpeciesState, days: float) -> None:
+        """ Make every animal older """
+        state.ages += days / DAYS_PER_YEAR
+
+    def move(self, state: SpeciesState, random: np.random.Generator, days: float) -> None:
+        """ Move every animal a random distance up to its speed in a random direction """
+        count = len(state)
+        angles = random.random(count, dtype=np.float32) * np.float32(2 * np.pi)
+        steps = random.random(count, dtype=np.float32) * np.float32(self.speed * days)
+        state.positions[:, 0] += np.cos(angles) * steps
+        state.positions[:, 1] += np.sin(angles) * steps
+        state.distance += steps
+
+    def eat(self, state: SpeciesState, days: float) -> None:
+        """ Make every animal hungrier, feeding the ones that are hungry enough """
+        state.hunger += np.float32(self.metabolism * days)
+        hungry = state.hunger >= 1
+        state.meals += hungry
+        state.hunger[hungry] = 0
+
+
+class DogBehaviour(AnimalBehaviour):
+    """ Dogs run instead of moving, so they cover more ground and get hungry sooner """
+
+    speed = 3.0
+    metabolism = 0.5
+
+
+# The behaviour of each class, subclasses use the behaviour of the closest listed class
+BEHAVIOURS = {Animal: AnimalBehaviour(), Dog: DogBehaviour()}
+
+
+def find_behaviour(species: type) -> AnimalBehaviour:
+    """ Return the behaviour of a species, using the closest listed class for classes that are not listed """
+    for cls in species.__mro__:
+        if cls in BEHAVIOURS:
+            return BEHAVIOURS[cls]
+    raise Exception(f"There is no behaviour for {species.__name__}, please add one to BEHAVIOURS.")
+
+
+class Population:
+    """ Millions of animals, grouped by species, advanced a day at a time with one array operation per field """
+
+    def __init__(self, *, seed: int = None):
+        """
+        :param seed: (int) start the random movement from this seed so a simulation can be repeated
+        """
+        # The state of the animals of each species, by their class
+        self.species = {}
+        self.random = np.random.default_rng(seed)
+        self.days = 0.0
+
+    def __len__(self) -> int:
+        return sum(len(state) for state in self.species.values())
+
+    def add_species(self, species: type, state: SpeciesState) -> None:
+        """ Add the animals in a state to a species, checking the species has a behaviour first """
+        find_behaviour(species)
+        if species in self.species:
+            self.species[species].extend(state)
+        else:
+            self.species[species] = state
+
+    def extend(self, animals) -> None:
+        """
+        Copy the name and age of animal objects into the population
+
+        :param animals: (iterable) Animal, Dog, or other Animal subclass objects
+        """
+        grouped = {}
+        for animal in animals:
+            grouped.setdefault(type(animal), []).append(animal)
+
+        for species, members in grouped.items():
+            state = SpeciesState([animal.age for animal in members], [animal.name for animal in members])
+            self.add_species(species, state)
+
+    def add_many(self, species: type, ages) -> None:
+        """
+        Add animals without names straight into the arrays, which is much quicker than creating objects
+
+        :param species: (type) the class of the animals, such as Dog
+        :param ages: the age in years of every animal to add
+        """
+        self.add_species(species, SpeciesState(ages))
+
+    def tick(self, days: float = 1) -> None:
+        """ Advance every animal by a number of days, running each species' behaviour once for all its animals """
+        for species, state in self.species.items():
+            find_behaviour(species).tick(state, self.random, days)
+        self.days += days
+
+    def run(self, ticks: int, *, days: float = 1) -> dict:
+        """
+        Advance every animal a number of times and measure how quickly it was done
+
+        :param ticks: (int) how many times to advance the population
+        :param days: (float) how many days each tick covers
+
+        :return: a dictionary with the ticks, animals, seconds taken, ticks per second, and animal updates per second
+        """
+        start = time.perf_counter()
+        for _ in range(ticks):
+            self.tick(days)
+        seconds = time.perf_counter() - start
+
+        animals = len(self)
+        return {
+            "ticks": ticks,
+            "animals": animals,
+            "seconds": seconds,
+            "ticks_per_second": ticks / seconds if seconds else 0.0,
+            "updates_per_second": ticks * animals / seconds if seconds else 0.0,
+        }
+
+    def summary(self) -> dict:
+        """ Return the number of animals, mean age, total meals, and mean distance moved of every species """
+        return {
+            species.__name__: {
+                "count": len(state),
+                "mean_age": float(state.ages.mean()) if len(state) else 0.0,
+                "meals": int(state.meals.sum()),
+                "mean_distance": float(state.distance.mean()) if len(state) else 0.0,
+            }
+            for species, state in self.species.items()
+        }
+
+
+def main():
+    # args is a list of the command line arguments, the number of animals and optionally the number of ticks
+    args = sys.argv[1:]
+    if len(args) not in (1, 2):
+        raise Exception(
+            "This program expects 1 or 2 arguments.\n"
+            "Please provide the number of animals and optionally the number of days to simulate."
+        )
+    count = int(args[0])
+    ticks = int(args[1]) if len(args) == 2 else 100
+
+    # Half the animals are dogs, every animal starts between 0 and 15 years old
+    population = Population(seed=0)
+    ages = np.random.default_rng(0).random(count) * 15
+    population.add_many(Animal, ages[:count // 2])
+    population.add_many(Dog, ages[count // 2:])
+
+    report = population.run(ticks)
+
+    print(f"<---------- {report['animals']} Animals, {report['ticks']} Days ---------->")
+    for species, totals in population.summary().items():
+        print(
+            f"{species}: {totals['count']} animals, mean age {totals['mean_age']:.2f} years, "
+            f"{totals['meals']} meals, mean distance {totals['mean_distance']:.1f}"
+        )
+    print(
+        f"Simulated in {report['seconds']:.2f} seconds "
+        f"({report['ticks_per_second']:.1f} ticks/sec, {report['updates_per_second']:.0f} animal-updates/sec)"
+    )
+
+
+if __name__ == "__main__":
+    main()
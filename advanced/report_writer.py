@@ -0,0 +1,241 @@
+# Import the required libraries
+import csv
+import io
+import json
+import sys
+
+from functools import lru_cache
+
+from custom_object import Employee
+from employee_table import EmployeeRow
+from inheritance import Animal, Dog, animal_classes
+
+# The text templates match each class's __str__, followed by the new line print adds
+EMPLOYEE_TEXT = (
+    "\n------------ Employee Information ------------\n"
+    "Name: %s\n"
+    "Age: %s\n"
+    "Salary: %s\n"
+    "%s"
+    "Created Date: %s\n"
+    "%s"
+    "\n"
+)
+ANIMAL_TEXT = (
+    "\n------------ Animal Information ------------\n"
+    "Name: %s\n"
+    "Age: %s\n"
+    "\n"
+)
+DOG_TEXT = (
+    "\n------------ Dog Information ------------\n"
+    "Name: %s\n"
+    "Breed: %s\n"
+    "Age: %s\n"
+    "\n"
+)
+
+# The columns every CSV report has, a record leaves the columns it does not use empty
+CSV_COLUMNS = (
+    "type", "full_name", "name", "breed", "age", "salary", "email", "created_datetime", "updated_datetime"
+)
+
+
+@lru_cache(maxsize=4096)
+def format_datetime(value) -> str:
+    """ Format a datetime the same way Employee.__str__ does, reusing the result for repeated timestamps """
+    return value.strftime('%B %d, %Y at %H:%M:%S')
+
+
+def employee_text(employee) -> str:
+    """ Return the employee's str message followed by a new line """
+    return EMPLOYEE_TEXT % (
+        employee.full_name,
+        employee.age,
+        employee.salary,
+        f"Email: {employee.email}\n" if employee.email else "",
+        format_datetime(employee.created_datetime),
+        f"Updated Date: {format_datetime(employee.updated_datetime)}\n" if employee.updated_datetime else ""
+    )
+
+
+def animal_text(animal) -> str:
+    """ Return the animal's str message followed by a new line """
+    return ANIMAL_TEXT % (animal.name, animal.age)
+
+
+def dog_text(dog) -> str:
+    """ Return the dog's str message followed by a new line """
+    return DOG_TEXT % (dog.name, dog.breed, dog.age)
+
+
+def employee_row(employee) -> dict:
+    """ Return the employee's fields as a dictionary """
+    return {
+        "type": "Employee",
+        "full_name": employee.full_name,
+        "age": employee.age,
+        "salary": employee.salary,
+        "email": employee.email,
+        "created_datetime": employee.created_datetime.isoformat(),
+        "updated_datetime": employee.updated_datetime.isoformat() if employee.updated_datetime else None,
+    }
+
+
+def animal_row(animal) -> dict:
+    """ Return the fields of an animal of any subclass as a dictionary, the same row Animal.from_row reads """
+    return animal.to_row()
+
+
+# The text formatter for each class, classes that are not listed use their own str message
+TEXT_FORMATTERS = {Employee: employee_text, EmployeeRow: employee_text, Animal: animal_text, Dog: dog_text}
+
+# The dictionary formatter for each class, subclasses use the formatter of the closest listed class
+ROW_FORMATTERS = {Employee: employee_row, EmployeeRow: employee_row, Animal: animal_row}
+
+
+def row_formatter(cls):
+    """ Find the function that turns a record of this class into a dictionary """
+    return next(ROW_FORMATTERS[base] for base in cls.__mro__ if base in ROW_FORMATTERS)
+
+
+def csv_columns(classes=None) -> tuple:
+    """
+    Find every column that rows of some Animal classes need, such as the extra fields of a subclass
+
+    The columns come from each class's row_fields, so they are known before any record is read.
+
+    :param classes: (iterable) the Animal classes, defaults to every class in animal_classes
+
+    :return: CSV_COLUMNS followed by every other row field of the classes, in the order they are first seen
+    """
+    columns = dict.fromkeys(CSV_COLUMNS)
+    for cls in animal_classes.values() if classes is None else classes:
+        columns.update(dict.fromkeys(cls.row_fields))
+    return tuple(columns)
+
+
+class ReportWriter:
+    """ Writes Employee, Animal, and Dog records as text, CSV, or JSON Lines through a large buffer """
+
+    def __init__(self, file=None, *, format: str = "text", buffer_size: int = 1 << 20, columns: tuple = None):
+        """
+        :param file: an open text file to write to, defaults to stdout
+        :param format: (str) text, csv, or jsonl
+        :param buffer_size: (int) how many characters are collected before they are written to the file
+        :param columns: (tuple) the CSV header, defaults to csv_columns() which covers every registered Animal class
+        """
+        if format not in ("text", "csv", "jsonl"):
+            raise Exception(f"The format {format} is not supported, please use text, csv, or jsonl.")
+
+        self.file = file or sys.stdout
+        self.format = format
+        self.buffer_size = buffer_size
+        self.chunks = []
+        self.pending = 0
+
+        # The formatter found for each class, so the class hierarchy is only searched once per class
+        self.formatters = {}
+
+        # CSV rows are formatted into this buffer by the csv module before they are collected
+        if format == "csv":
+            self.csv_buffer = io.StringIO()
+            self.csv_writer = csv.DictWriter(self.csv_buffer, fieldnames=columns or csv_columns(), lineterminator="\n")
+            self.csv_writer.writeheader()
+            self.add(self.take_csv())
+
+    def __enter__(self) -> "ReportWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
+
+    def formatter(self, cls):
+        """ Find the function that turns a record of this class into a string """
+        if self.format == "text":
+            # Classes that are not listed may have changed __str__, so only exact matches use a template
+            return TEXT_FORMATTERS.get(cls, lambda record: f"{record}\n")
+
+        # Use the formatter of the closest listed class
+        formatter = row_formatter(cls)
+        if self.format == "jsonl":
+            return lambda record: json.dumps(formatter(record)) + "\n"
+        return lambda record: self.format_csv(formatter(record))
+
+    def format_csv(self, row: dict) -> str:
+        """ Turn a dictionary into a CSV line """
+        try:
+            self.csv_writer.writerow(row)
+        except ValueError:
+            missing = [key for key in row if key not in self.csv_writer.fieldnames]
+            raise Exception(
+                f"The {row.get('type')} row has the fields {', '.join(missing)} which are not CSV columns, "
+                "please add them to the class's row_fields."
+            )
+        return self.take_csv()
+
+    def take_csv(self) -> str:
+        """ Return and clear whatever the csv module has written """
+        text = self.csv_buffer.getvalue()
+        self.csv_buffer.seek(0)
+        self.csv_buffer.truncate()
+        return text
+
+    def add(self, text: str) -> None:
+        """ Collect text, writing everything collected once the buffer is full """
+        self.chunks.append(text)
+        self.pending += len(text)
+        if self.pending >= self.buffer_size:
+            self.flush()
+
+    def write(self, record) -> None:
+        """
+        Add a single record to the report
+
+        :param record: an Employee, Animal, Dog, or a row from an EmployeeTable
+        """
+        cls = type(record)
+        formatter = self.formatters.get(cls)
+        if formatter is None:
+            formatter = self.formatters[cls] = self.formatter(cls)
+        self.add(formatter(record))
+
+    def write_all(self, records) -> int:
+        """
+        Add many records to the report
+
+        :param records: (iterable) Employee, Animal, Dog, or EmployeeTable row records
+
+        :return: the number of records written
+        """
+        count = 0
+        for record in records:
+            self.write(record)
+            count += 1
+        return count
+
+    def flush(self) -> None:
+        """ Write everything collected so far in one call """
+        if self.chunks:
+            self.file.write("".join(self.chunks))
+            self.chunks = []
+            self.pending = 0
+        self.file.flush()
+
+
+def write_report(records, path: str = None, *, format: str = "text") -> int:
+    """
+    Write a whole report to a file or stdout
+
+    :param records: (iterable) Employee, Animal, Dog, or EmployeeTable row records
+    :param path: (str) the file to create or replace, defaults to stdout
+    :param format: (str) text, csv, or jsonl, every format streams the records without keeping them in memory
+
+    :return: the number of records written
+    """
+    if path is None:
+        with ReportWriter(format=format) as writer:
+            return writer.write_all(records)
+
+    with open(path, "w", newline="", encoding="utf-8") as file, ReportWriter(file, format=format) as writer:
+        return writer.write_all(records)
@@ -0,0 +1,150 @@
+# Import the required libraries
+import argparse
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+
+from employee_loader import build_employees, read_rows
+
+
+class PartialAggregate:
+    """ Salary and age totals for some employees, which can be merged with the totals for others """
+
+    def __init__(self, *, bin_width: int = 10):
+        """
+        :param bin_width: (int) how many years each age histogram group covers
+        """
+        self.bin_width = bin_width
+        self.count = 0
+        self.salary_sum = 0
+        self.salary_min = None
+        self.salary_max = None
+        self.age_histogram = {}
+
+    def add(self, employees: list) -> None:
+        """ Add a batch of employees to the totals """
+        if not employees:
+            return
+
+        salaries = [employee.salary for employee in employees]
+        self.count += len(salaries)
+        self.salary_sum += sum(salaries)
+        low = min(salaries)
+        high = max(salaries)
+        self.salary_min = low if self.salary_min is None else min(self.salary_min, low)
+        self.salary_max = high if self.salary_max is None else max(self.salary_max, high)
+
+        for employee in employees:
+            group = employee.age // self.bin_width * self.bin_width
+            self.age_histogram[group] = self.age_histogram.get(group, 0) + 1
+
+    def merge(self, other: "PartialAggregate") -> "PartialAggregate":
+        """
+        Add another set of totals to these ones
+
+        :param other: (PartialAggregate) totals using the same bin width
+
+        :return: these totals, so merges can be chained
+        """
+        if other.bin_width != self.bin_width:
+            raise Exception("Only aggregates with the same bin width can be merged.")
+        if not other.count:
+            return self
+
+        self.count += other.count
+        self.salary_sum += other.salary_sum
+        self.salary_min = other.salary_min if self.salary_min is None else min(self.salary_min, other.salary_min)
+        self.salary_max = other.salary_max if self.salary_max is None else max(self.salary_max, other.salary_max)
+        for group, count in other.age_histogram.items():
+            self.age_histogram[group] = self.age_histogram.get(group, 0) + count
+        return self
+
+    def mean_salary(self) -> float:
+        """ Return the average salary, or 0 when there are no employees """
+        return self.salary_sum / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict:
+        """ Return the totals as a dictionary, with the age histogram in age order """
+        return {
+            "count": self.count,
+            "salary_sum": self.salary_sum,
+            "salary_min": self.salary_min,
+            "salary_max": self.salary_max,
+            "salary_mean": self.mean_salary(),
+            "age_histogram": dict(sorted(self.age_histogram.items())),
+        }
+
+
+def aggregate_shard(path: str, *, chunk_size: int = 1000, bin_width: int = 10) -> PartialAggregate:
+    """
+    Load every employee in one shard file and total them, this runs inside a worker process
+
+    :param path: (str) a .csv or .jsonl file of employees
+    :param chunk_size: (int) the number of employees built and totalled at once
+    :param bin_width: (int) how many years each age histogram group covers
+
+    :return: the totals for this shard
+    """
+    partial = PartialAggregate(bin_width=bin_width)
+    for employees in build_employees(read_rows(path), batch_size=chunk_size):
+        partial.add(employees)
+    return partial
+
+
+def aggregate_shards(paths: list, *, workers: int = None, chunk_size: int = 1000, bin_width: int = 10) -> dict:
+    """
+    Total every shard in its own worker process and merge the results
+
+    This only gets faster with more workers when there are CPUs free to run them, run_benchmarks.py measures it.
+    With a single CPU the extra processes only add their start up time.
+
+    :param paths: (list) the shard files
+    :param workers: (int) the number of worker processes, defaults to the number of CPUs
+    :param chunk_size: (int) the number of employees each worker builds and totals at once
+    :param bin_width: (int) how many years each age histogram group covers
+
+    :return: the merged totals, plus the seconds taken and the rows per second
+    """
+    start = time.perf_counter()
+    total = PartialAggregate(bin_width=bin_width)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(aggregate_shard, path, chunk_size=chunk_size, bin_width=bin_width) for path in paths
+        ]
+        # Merge in shard order so the result does not depend on which worker finishes first
+        for future in futures:
+            total.merge(future.result())
+
+    seconds = time.perf_counter() - start
+    result = total.to_dict()
+    result["seconds"] = seconds
+    result["rows_per_second"] = total.count / seconds if seconds else 0.0
+    return result
+
+
+def main():
+    # Read the shard files and options from the command line
+    parser = argparse.ArgumentParser(description="Total salaries and ages across many employee shard files.")
+    parser.add_argument("paths", nargs="+", help=".csv or .jsonl files of employees")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes, defaults to the CPU count")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="employees each worker loads at once")
+    parser.add_argument("--bin-width", type=int, default=10, help="years in each age histogram group")
+    args = parser.parse_args()
+
+    result = aggregate_shards(
+        args.paths, workers=args.workers, chunk_size=args.chunk_size, bin_width=args.bin_width
+    )
+
+    # Display the merged totals
+    print(f"\n<---------- {len(args.paths)} Shards, {result['count']} Employees ---------->")
+    print(f"Salary Total: {result['salary_sum']}")
+    print(f"Salary Mean: {result['salary_mean']:.2f}")
+    print(f"Salary Range: {result['salary_min']} to {result['salary_max']}")
+    for group, count in result["age_histogram"].items():
+        print(f"Ages {group}-{group + args.bin_width - 1}: {count}")
+    print(f"Loaded in {result['seconds']:.2f} seconds ({result['rows_per_second']:.0f} rows/sec)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# Import the required libraries
+import io
+import os
+import sys
+import tempfile
+import unittest
+import pytest
+from unittest.mock import patch
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+from animal_factory import build_animals, load_animals, save_animals
+from breeds import breed_registry
+from events import NULL_SINK
+from inheritance import Animal, Dog, animal_classes
+
+
+class TestAnimalFactory(unittest.TestCase):
+    """ Test building animals of the right classes from tagged rows """
+
+    def setUp(self):
+        """ Run this code before every test """
+        breed_registry.register("Beagle")
+
+        # An Animal subclass registered with its own tag, defined here so tearDown can unregister it
+        class Parrot(Animal, tag="Bird"):
+            __slots__ = ()
+
+        self.Parrot = Parrot
+        self.animals = [
+            Dog(name="bobbers", age=5, sink=NULL_SINK),
+            Animal(name="whiskers", age=2, sink=NULL_SINK),
+            Parrot(name="polly", age=40, sink=NULL_SINK),
+            Dog(name="rex", age=1, breed="Beagle", sink=NULL_SINK),
+        ]
+
+    def tearDown(self):
+        """ Run this code after every test """
+        animal_classes.pop("Bird")
+
+    def test_subclasses_registered(self):
+        """ Test that subclasses register themselves by name or tag """
+        assert animal_classes["Animal"] is Animal
+        assert animal_classes["Dog"] is Dog
+        assert animal_classes["Bird"] is self.Parrot
+        assert self.Parrot(name="polly", age=40, sink=NULL_SINK).to_row()["type"] == "Bird"
+
+    def test_build_animals(self):
+        """ Test that rows become the same animals __init__ creates, in order, without any messages """
+        rows = [
+            {"type": "Dog", "name": "bobbers", "age": "5"},
+            {"type": "", "name": "whiskers", "age": 2},
+            {"type": "Bird", "name": "polly", "age": 40},
+            {"type": "Dog", "name": "rex", "age": 1, "breed": "Beagle"},
+        ]
+        with patch("sys.stdout", new_callable=io.StringIO) as output:
+            batches = list(build_animals(rows, batch_size=3))
+
+        assert [len(batch) for batch in batches] == [3, 1]
+        assert sum(batches, []) == self.animals
+        assert output.getvalue() == ""
+
+        with pytest.raises(Exception):
+            list(build_animals([{"type": "Unicorn", "name": "sparkle", "age": 1}]))
+
+    def test_round_trip(self):
+        """ Test that animals saved to CSV and JSON Lines load back equal """
+        with tempfile.TemporaryDirectory() as folder:
+            for name in ("animals.csv", "animals.jsonl"):
+                path = os.path.join(folder, name)
+                assert save_animals(self.animals, path) == 4
+                assert load_animals(path, batch_size=2) == self.animals
+
+            with pytest.raises(Exception):
+                save_animals(self.animals, os.path.join(folder, "animals.xml"))
+
+    def test_save_extra_field_csv(self):
+        """ Test that a subclass whose rows add a field is saved to CSV with that column and loads back equal """
+        class Ferret(Animal):
+            __slots__ = ("color",)
+            row_fields = Animal.row_fields + ("color",)
+
+            @classmethod
+            def from_rows(cls, rows: list) -> list:
+                ferrets = super().from_rows(rows)
+                for ferret, row in zip(ferrets, rows):
+                    ferret.color = row["color"]
+                return ferrets
+
+            def to_row(self) -> dict:
+                return {**super().to_row(), "color": self.color}
+
+            def fields(self) -> tuple:
+                return self.name, self.age, self.color
+
+        try:
+            ferret = Ferret(name="slinky", age=1, sink=NULL_SINK)
+            ferret.color = "white"
+            animals = self.animals + [ferret]
+
+            with tempfile.TemporaryDirectory() as folder:
+                path = os.path.join(folder, "animals.csv")
+                assert save_animals(animals, path) == 5
+                assert load_animals(path) == animals
+        finally:
+            animal_classes.pop("Ferret")
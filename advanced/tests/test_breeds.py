@@ -0,0 +1,39 @@
+# Import the required libraries
+import sys
+import unittest
+import pytest
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+from breeds import BreedRegistry
+
+
+class TestBreedRegistry(unittest.TestCase):
+    """ Test the shared, unchangeable breeds """
+
+    def setUp(self):
+        """ Run this code before every test """
+        self.registry = BreedRegistry()
+        self.beagle = self.registry.register("Beagle", min_weight=20, max_weight=30, energy=4)
+
+    def test_register_interns(self):
+        """ Test that a breed name always returns the same object """
+        assert self.registry.register("beagle") is self.beagle
+        assert self.registry.register("Beagle", min_weight=20, max_weight=30, energy=4) is self.beagle
+        assert self.registry.find("BEAGLE") is self.registry.get(self.beagle.id) is self.beagle
+        assert self.registry.register("Pug").id == 1
+        assert len(self.registry) == 2
+
+        with pytest.raises(Exception):
+            self.registry.register("Beagle", min_weight=25)
+        with pytest.raises(Exception):
+            self.registry.find("Husky")
+
+    def test_breed_immutable(self):
+        """ Test that a breed can not be changed or given new attributes """
+        with pytest.raises(Exception):
+            self.beagle.energy = 5
+        with pytest.raises(Exception):
+            del self.beagle.name
+        assert self.beagle.energy == 4
+        assert repr(self.beagle) == "Breed(0, 'Beagle')"
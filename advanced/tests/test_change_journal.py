@@ -0,0 +1,156 @@
+# Import the required libraries
+import gc
+import os
+import sys
+import tempfile
+import unittest
+import pytest
+from datetime import datetime
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+from change_journal import (
+    Change, ChangeJournal, apply_changes, compact_changes, decode_changes, encode_changes
+)
+from clocks import BatchClock, to_epoch_ns, use_clock
+import custom_object
+from custom_object import Employee
+from employee_store import EmployeeStore, write_employees
+from events import NULL_SINK, RingBufferSink, use_sink
+
+
+class TestChangeJournal(unittest.TestCase):
+    """ Test recording employee changes and applying them to a snapshot """
+
+    def setUp(self):
+        """ Run this code before every test """
+        self.folder = tempfile.TemporaryDirectory()
+        self.snapshot_path = os.path.join(self.folder.name, "employees.bin")
+        self.journal_path = os.path.join(self.folder.name, "employees.journal")
+
+        # Write a snapshot, then follow the same employees with a journal
+        with use_sink(NULL_SINK), use_clock(BatchClock(datetime(2011, 11, 11))):
+            self.employees = [
+                Employee(first_name="Lizzie", last_name="Altena", age=25, salary=1000),
+                Employee(first_name="Bob", last_name="Smith", age=31, salary=2000),
+            ]
+        write_employees(self.snapshot_path, self.employees)
+        self.journal = ChangeJournal(self.employees, path=self.journal_path)
+
+    def tearDown(self):
+        """ Run this code after every test """
+        self.journal.close()
+        self.folder.cleanup()
+
+    def test_records_updates(self):
+        """ Test that every changed field is recorded with the old and new values """
+        with use_clock(BatchClock(datetime(2012, 1, 1))):
+            self.employees[1].update(email="bob@test.com", salary=2500)
+
+        assert self.journal.changes == [
+            Change(1, "email", "", "bob@test.com", to_epoch_ns(datetime(2012, 1, 1))),
+            Change(1, "salary", 2000, 2500, to_epoch_ns(datetime(2012, 1, 1))),
+        ]
+
+    def test_encode_decode(self):
+        """ Test that changes survive the binary encoding, and the journal file matches """
+        changes = [Change(0, "full_name", "Lizzie Altena", "Amélie Altena", 5), Change(3, "age", 25, 26, -1)]
+        assert decode_changes(encode_changes(changes)) == changes
+
+        self.employees[0].update(age=26)
+        self.journal.flush()
+        with open(self.journal_path, "rb") as file:
+            assert decode_changes(file.read()) == self.journal.changes
+
+        with pytest.raises(Exception):
+            decode_changes(b"NOPE\x01\x00")
+
+    def test_compaction(self):
+        """ Test that repeated changes combine into one, and changes that were undone disappear """
+        self.journal.compact_every = 4
+        self.employees[0].update(salary=1100)
+        self.employees[0].update(salary=1200)
+        self.employees[1].update(age=32)
+        self.employees[1].update(age=31)
+
+        assert [change[:4] for change in self.journal.changes] == [(0, "salary", 1000, 1200)]
+        with open(self.journal_path, "rb") as file:
+            assert decode_changes(file.read()) == self.journal.changes
+
+        assert compact_changes([]) == []
+
+    def test_reopen_journal(self):
+        """ Test that a journal file keeps the changes from earlier runs """
+        self.employees[0].update(salary=1100)
+        self.journal.close()
+
+        self.journal = ChangeJournal(self.employees, path=self.journal_path)
+        self.employees[0].update(salary=1200)
+        assert [change.new_value for change in self.journal.changes] == [1100, 1200]
+
+    def test_reopen_torn_journal(self):
+        """ Test that a change left part way written by a crash is dropped when the journal is opened again """
+        self.employees[0].update(salary=1100)
+        self.employees[1].update(email="bob@test.com")
+        self.journal.close()
+        size = os.path.getsize(self.journal_path)
+        os.truncate(self.journal_path, size - 3)
+
+        with open(self.journal_path, "rb") as file:
+            with pytest.raises(Exception, match="part way"):
+                decode_changes(file.read())
+
+        sink = RingBufferSink()
+        self.journal = ChangeJournal(self.employees, path=self.journal_path, sink=sink)
+        assert [change.new_value for change in self.journal.changes] == [1100]
+        assert sink.names() == ["journal_truncated"]
+
+        # New changes follow the last complete one, so the file can be read whole again
+        self.employees[0].update(salary=1200)
+        self.journal.flush()
+        with open(self.journal_path, "rb") as file:
+            assert [change.new_value for change in decode_changes(file.read())] == [1100, 1200]
+
+    def test_apply_changes_to_replica(self):
+        """ Test that shipping only the journal brings a replica snapshot up to date """
+        replica_path = os.path.join(self.folder.name, "replica.bin")
+        with open(self.snapshot_path, "rb") as source, open(replica_path, "wb") as replica:
+            replica.write(source.read())
+
+        with use_clock(BatchClock(datetime(2012, 1, 1))):
+            self.employees[0].update(email="lizzie@test.com")
+            self.employees[0].update(salary=1500)
+
+        assert apply_changes(replica_path, decode_changes(self.journal.encode())) == 1
+
+        with EmployeeStore(replica_path) as store:
+            assert list(store) == self.employees
+            assert store[0].updated_datetime == datetime(2012, 1, 1)
+
+    def test_apply_number_changes_in_place(self):
+        """ Test that age and salary changes are written into the changed rows instead of a new snapshot """
+        inode = os.stat(self.snapshot_path).st_ino
+        with use_clock(BatchClock(datetime(2012, 1, 1))):
+            self.employees[1].update(salary=2500, age=32)
+
+        assert apply_changes(self.snapshot_path, self.journal.changes) == 1
+        assert os.stat(self.snapshot_path).st_ino == inode
+        with EmployeeStore(self.snapshot_path) as store:
+            assert list(store) == self.employees
+            assert store[0].updated_datetime is None
+
+        with pytest.raises(Exception):
+            apply_changes(self.snapshot_path, [Change(5, "age", 25, 26, 0)])
+
+    def test_close(self):
+        """ Test that a journal stops recording once closed, or once it is no longer used """
+        self.journal.close()
+        with ChangeJournal(self.employees) as journal:
+            self.employees[0].update(age=26)
+        self.employees[0].update(age=27)
+        assert [change.new_value for change in journal.changes] == [26]
+
+        listeners = len(custom_object.update_listeners)
+        ChangeJournal(self.employees)
+        gc.collect()
+        assert len(custom_object.update_listeners) == listeners
@@ -0,0 +1,69 @@
+# Import the required libraries
+import sys
+import unittest
+from unittest.mock import patch
+from datetime import datetime
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+import clocks
+from clocks import BatchClock, CachedClock, from_epoch_ns, set_clock, to_epoch_ns, use_clock
+from custom_object import Employee, get_datetime
+from events import NULL_SINK
+
+
+class TestClocks(unittest.TestCase):
+    """ Test the clocks used to stamp employees """
+
+    def test_epoch_ns_round_trip(self):
+        """ Test that datetimes survive being stored as nanoseconds """
+        value = datetime(2011, 11, 11, 11, 11, 11, 123456)
+        assert to_epoch_ns(datetime(1970, 1, 1, 0, 0, 1)) == 1000000000
+        assert from_epoch_ns(to_epoch_ns(value)) == value
+        assert from_epoch_ns(to_epoch_ns(datetime(1960, 1, 1))) == datetime(1960, 1, 1)
+
+    def test_cached_clock_reuses_reading(self):
+        """ Test that the cached clock only reads the system clock again after a tick """
+        clock = CachedClock(resolution=60)
+        first = clock.now()
+
+        assert clock.now() is first
+        assert clock.now_ns() == to_epoch_ns(first)
+
+        # Forcing a tick reads the system clock again
+        with patch("clocks.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(2011, 11, 11, 11, 11, 11)
+            clock.tick()
+        assert clock.now() == datetime(2011, 11, 11, 11, 11, 11)
+
+    def test_cached_clock_expires(self):
+        """ Test that the cached clock reads the system clock again once the reading is stale """
+        clock = CachedClock(resolution=0)
+        first = clock.now()
+        with patch("clocks.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(2011, 11, 11, 11, 11, 11)
+            assert clock.now() is not first
+
+    def test_batch_clock_stamps_employees(self):
+        """ Test that every employee created while a batch clock is used shares one timestamp """
+        batch = BatchClock(datetime(2011, 11, 11, 11, 11, 11))
+        with use_clock(batch):
+            employees = [
+                Employee(first_name="Lizzie", last_name="Altena", age=25, salary=number, sink=NULL_SINK)
+                for number in range(3)
+            ]
+            employees[0].update(salary=10)
+
+        assert {employee.created_datetime for employee in employees} == {datetime(2011, 11, 11, 11, 11, 11)}
+        assert employees[0].updated_datetime == datetime(2011, 11, 11, 11, 11, 11)
+        assert batch.now_ns() == to_epoch_ns(datetime(2011, 11, 11, 11, 11, 11))
+
+    def test_set_clock_returns_previous(self):
+        """ Test that the system clock is the default and can be put back """
+        previous = set_clock(BatchClock(datetime(2011, 11, 11)))
+        try:
+            assert get_datetime() == datetime(2011, 11, 11)
+        finally:
+            set_clock(previous)
+        assert isinstance(clocks.current_clock, clocks.SystemClock)
+        assert get_datetime() != datetime(2011, 11, 11)
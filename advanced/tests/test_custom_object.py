@@ -8,7 +8,7 @@ from datetime import datetime
 
 # These red lines are expected and pytest will work
 sys.path.append(sys.path[0] + '/..')
-from custom_object import Employee, get_datetime, main
+from custom_object import Employee, employee_fields, equal_as_string, get_datetime, main, sort_key
 
 
 # To run the tests, execute the following code in the terminal :
@@ -71,6 +71,38 @@ class TestEmployee(unittest.TestCase):
 
         # Using == will call the function __eq__
         assert self.employee == employee_new
+
+        # Any difference in the fields makes them unequal
+        employee_new.salary = 2000
+        assert self.employee != employee_new
+        assert self.employee != "Lizzie Altena"
+
+    def test_employee_hash(self):
+        """ Test that employees can not be hashed, while their fields can be used as the same set member and dict key """
+        employee_new = Employee(first_name="lizzie", last_name="altena", age=25, salary=1000)
+
+        with pytest.raises(TypeError):
+            hash(self.employee)
+        assert len({employee_fields(self.employee), employee_fields(employee_new)}) == 1
+        assert {employee_fields(self.employee): "found"}[employee_fields(employee_new)] == "found"
+
+    def test_employee_eq_as_string(self):
+        """ Test that the original str comparison is still available, and == agrees with the ordering """
+        # These only differ in microseconds, which the str message does not display
+        employee_new = Employee.from_fields(
+            full_name="Lizzie Altena",
+            age=25,
+            salary=1000,
+            created_datetime=datetime(2011, 11, 11, 11, 11, 11, 500)
+        )
+        assert self.employee != employee_new
+        assert self.employee < employee_new
+        assert equal_as_string(self.employee, employee_new)
+
+    def test_employee_slots(self):
+        """ Test that employees do not carry a __dict__ """
+        with pytest.raises(AttributeError):
+            self.employee.nickname = "Liz"
     
     def test_display_company_message(self):
         """ Test that the correct message is printed out """
@@ -120,6 +152,52 @@ class TestEmployee(unittest.TestCase):
         assert self.employee.email == "test@test.com"
         assert self.employee.updated_datetime == datetime(2011, 11, 11, 11, 11, 11)
 
+    def test_retrieve_email_stricter_check(self):
+        """ Test that emails the old check let through, an @ and a . anywhere, are now asked for again """
+        mock_inputs = ["a.b@c", "@test.com", "te st@test.com", "a@b@c.com", " test@test.com", "test@test.com"]
+        with patch("builtins.input", side_effect=mock_inputs) as mocked_input:
+            self.employee.retrieve_email()
+
+        assert mocked_input.call_count == len(mock_inputs)
+        assert self.employee.email == "test@test.com"
+
+    def test_update(self):
+        """ Test that update changes fields, sets updated_datetime, and tells the listeners """
+        changes = []
+        with patch("custom_object.update_listeners", [lambda *change: changes.append(change)]):
+            self.employee.update(salary=2000)
+
+        assert self.employee.salary == 2000
+        assert changes == [
+            (self.employee, "salary", 1000, 2000),
+            (self.employee, "updated_datetime", None, datetime(2011, 11, 11, 11, 11, 11)),
+        ]
+
+        # A timestamp can be given instead of reading the clock
+        self.employee.update(age=26, updated_datetime=datetime(2012, 1, 1))
+        assert self.employee.updated_datetime == datetime(2012, 1, 1)
+
+        # Only the fields describing the employee can be changed
+        with pytest.raises(Exception):
+            self.employee.update(created_datetime=datetime(2012, 1, 1))
+
+    def test_ordering(self):
+        """ Test that employees order by their fields, and sort_key orders them by a single field """
+        older = Employee(first_name="Lizzie", last_name="Altena", age=30, salary=500)
+        other = Employee(first_name="Sam", last_name="Smith", age=40, salary=2000)
+
+        assert self.employee < older < other
+        assert other >= self.employee
+        assert sorted([other, older, self.employee]) == [self.employee, older, other]
+        assert max([other, older, self.employee], key=sort_key("salary")) is other
+
+        # Never updated employees come before updated ones
+        older.update(age=30)
+        assert sorted([older, self.employee], key=sort_key("updated_datetime")) == [self.employee, older]
+
+        with pytest.raises(Exception):
+            sort_key("created_date")
+
 
 # Test the main functions
 class TestMain(unittest.TestCase):
@@ -0,0 +1,124 @@
+# Import the required libraries
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+import pytest
+from unittest.mock import patch
+from datetime import datetime
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+from clocks import BatchClock, use_clock
+from custom_object import Employee, is_valid_email
+from email_intake import EmailIntake, intake_email, parse_message
+from events import NULL_SINK, RingBufferSink
+
+
+class TestEmailIntake(unittest.TestCase):
+    """ Test collecting employee emails from streams of messages """
+
+    def setUp(self):
+        """ Run this code before every test """
+        self.employees = {
+            str(number): Employee(first_name="first", last_name="last", age=30, salary=1000, sink=NULL_SINK)
+            for number in range(3)
+        }
+        self.intake = EmailIntake(self.employees, batch_size=2)
+
+    def test_is_valid_email(self):
+        """ Test the precompiled email check """
+        assert is_valid_email("test@test.com")
+        assert not is_valid_email("test")
+        assert not is_valid_email("te st@test.com")
+        assert not is_valid_email("test@test")
+        assert not is_valid_email("a@b@c.com")
+
+    def test_parse_message(self):
+        """ Test both message formats """
+        assert parse_message("7, a@b.com\n") == ("7", "a@b.com")
+        assert parse_message('{"id": 7, "email": "a@b.com"}') == ("7", "a@b.com")
+
+    def test_batches_and_rejects(self):
+        """ Test that valid emails are applied once a batch fills, and bad messages are reported """
+        with use_clock(BatchClock(datetime(2011, 11, 11))):
+            assert self.intake.submit("0", "zero@test.com") is None
+            assert self.employees["0"].email == ""
+            assert self.intake.submit("9", "nine@test.com") == "unknown employee"
+            assert self.intake.submit_line("1,not-an-email") == "invalid email"
+            assert self.intake.submit_line('{"email": "x@test.com"}') == "unreadable message"
+            assert self.intake.submit_line("2,two@test.com") is None
+
+        assert self.employees["0"].email == "zero@test.com"
+        assert self.employees["2"].updated_datetime == datetime(2011, 11, 11)
+        assert self.intake.report() == {
+            "accepted": 2,
+            "pending": 0,
+            "rejected": [
+                ("9", "nine@test.com", "unknown employee"),
+                ("1", "not-an-email", "invalid email"),
+                (None, '{"email": "x@test.com"}', "unreadable message"),
+            ],
+        }
+
+    def test_flush_leaves_clock(self):
+        """ Test that a batch shares one updated_datetime without changing the clock other threads read """
+        with patch("clocks.set_clock", side_effect=AssertionError("The clock was changed.")):
+            self.intake.submit("0", "zero@test.com")
+            self.intake.submit("1", "one@test.com")
+
+        assert self.employees["0"].updated_datetime == self.employees["1"].updated_datetime
+
+    def test_intake_email(self):
+        """ Test that the first valid response is applied and every invalid one before it is reported """
+        sink = RingBufferSink()
+        responses = iter(["a.b@c", "one@test.com", "never@test.com"])
+
+        assert intake_email(self.employees["1"], responses, sink=sink) == "one@test.com"
+        assert self.employees["1"].email == "one@test.com"
+        assert next(responses) == "never@test.com"
+        assert sink.names() == ["invalid_email"]
+        assert sink.events[0].args == ("a.b@c",)
+
+        with pytest.raises(Exception):
+            intake_email(self.employees["2"], ["test"], sink=sink)
+
+    def test_consume_file(self):
+        """ Test that every line of a file is handled and the last partial batch is applied """
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "emails.txt")
+            with open(path, "w") as file:
+                file.write("0,zero@test.com\n\n1,one@test.com\n2,bad\n1,again@test.com\n")
+
+            report = asyncio.run(self.intake.consume_file(path, chunk_size=10))
+
+        assert report["accepted"] == 3
+        assert len(report["rejected"]) == 1
+        assert self.employees["1"].email == "again@test.com"
+
+    def test_serve(self):
+        """ Test that messages sent over TCP are answered and applied """
+        async def send_messages():
+            server = await self.intake.serve(port=0, flush_interval=0.01)
+            port = server.sockets[0].getsockname()[1]
+
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"0,zero@test.com\n5,five@test.com\n")
+            await writer.drain()
+            answers = [await reader.readline(), await reader.readline()]
+
+            # The periodic flush applies the email even though the batch is not full
+            await asyncio.sleep(0.05)
+            email = self.employees["0"].email
+
+            writer.close()
+            await writer.wait_closed()
+            server.close()
+            await server.wait_closed()
+            return answers, email
+
+        answers, email = asyncio.run(send_messages())
+
+        assert answers == [b"OK\n", b"REJECTED unknown employee\n"]
+        assert email == "zero@test.com"
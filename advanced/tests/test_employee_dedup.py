@@ -0,0 +1,64 @@
+# Import the required libraries
+import sys
+import unittest
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+from custom_object import Employee
+from employee_dedup import DisjointSet, find_duplicates, normalize_email, normalize_name
+from employee_table import EmployeeTable
+from events import NULL_SINK
+
+
+def make_employee(first_name: str, last_name: str, age: int, email: str = "") -> Employee:
+    """ Create an employee without displaying a message """
+    return Employee(first_name=first_name, last_name=last_name, age=age, salary=1000, email=email, sink=NULL_SINK)
+
+
+class TestEmployeeDedup(unittest.TestCase):
+    """ Test finding duplicate employees """
+
+    def setUp(self):
+        """ Run this code before every test """
+        self.employees = [
+            make_employee("Lizzie", "Altena", 25, "lizzie@test.com"),
+            make_employee("Bob", "Smith", 31),
+            make_employee("LIZZIE", "ALTENA", 25),
+            make_employee("Liz", "Altena", 40, " Lizzie+HR@Test.com"),
+            make_employee("Amélie", "Dupont", 38),
+            make_employee("Amelie", "Dupont", 38),
+            make_employee("Robert", "Smith", 31),
+            make_employee("Jonathon", "Jones", 50),
+            make_employee("Jonathan", "Jones", 50),
+        ]
+
+    def test_normalize(self):
+        """ Test that names and emails ignore the differences merges introduce """
+        assert normalize_name("  Amélie   O'Dupont ") == "amelie odupont"
+        assert normalize_email(" Lizzie+HR@Test.com ") == "lizzie@test.com"
+        assert normalize_email("") == ""
+
+    def test_disjoint_set(self):
+        """ Test that grouping is transitive and keeps the smallest representative """
+        groups = DisjointSet(5)
+        groups.union(3, 4)
+        groups.union(4, 1)
+
+        assert {groups.find(number) for number in (1, 3, 4)} == {1}
+        assert groups.find(2) == 2
+
+    def test_find_duplicates(self):
+        """ Test that exact, email, and near duplicates are clustered and different people are not """
+        clusters = find_duplicates(self.employees, partitions=4)
+
+        # Lizzie matches by name and age, and by email once the +tag is ignored
+        # Amélie matches once the accent is ignored, Jonathon is a near duplicate of Jonathan
+        assert clusters == [[0, 2, 3], [4, 5], [7, 8]]
+
+    def test_find_duplicates_in_table(self):
+        """ Test that table rows can be checked the same way, with a single partition """
+        assert find_duplicates(EmployeeTable(self.employees), partitions=1) == [[0, 2, 3], [4, 5], [7, 8]]
+
+    def test_similarity_threshold(self):
+        """ Test that a stricter similarity only keeps the exact matches """
+        assert find_duplicates(self.employees, similarity=1.0) == [[0, 2, 3], [4, 5]]
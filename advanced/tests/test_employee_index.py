@@ -0,0 +1,143 @@
+# Import the required libraries
+import gc
+import io
+import sys
+import unittest
+import pytest
+from unittest.mock import patch
+from datetime import datetime
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+import custom_object
+from custom_object import Employee
+from employee_index import EmployeeIndex, SortedPairs
+from employee_table import EmployeeTable
+
+
+class TestEmployeeIndex(unittest.TestCase):
+    """ Test the functions within the EmployeeIndex class """
+
+    def setUp(self):
+        """ Run this code before every test """
+        # Mock the function that gets datetime.now, therefore, we know what date to expect everytime it is called
+        self.mock_datetime = patch("custom_object.get_datetime", return_value=datetime(2011, 11, 11, 11, 11, 11))
+        self.mock_datetime.start()
+
+        # Capture all printed statements here instead of the terminal
+        self.capturedOutput = io.StringIO()
+        sys.stdout = self.capturedOutput
+
+        # Define any re-useable variables
+        self.lizzie = Employee(first_name="Lizzie", last_name="Altena", age=25, salary=1000, email="liz@test.com")
+        self.bob = Employee(first_name="Bob", last_name="Smith", age=31, salary=3000)
+        self.amy = Employee(first_name="Amy", last_name="Jones", age=40, salary=2000)
+        self.index = EmployeeIndex([self.lizzie, self.bob, self.amy])
+
+    def tearDown(self):
+        """ Run this code after every test """
+        self.index.close()
+        self.mock_datetime.stop()
+        sys.stdout = sys.__stdout__
+
+    def test_hash_lookups(self):
+        """ Test finding employees by email and by name """
+        assert self.index.find_by_email("liz@test.com") == [self.lizzie]
+        assert self.index.find_by_email("") == [self.bob, self.amy]
+        assert self.index.find_by_name("Bob Smith") == [self.bob]
+        assert self.index.find_by_name("Nobody") == []
+
+    def test_range_queries(self):
+        """ Test the inclusive age and salary ranges """
+        assert self.index.age_range(25, 31) == [self.lizzie, self.bob]
+        assert self.index.age_range(41, 99) == []
+        assert self.index.salary_range(1500, 3000) == [self.amy, self.bob]
+
+    def test_top_salaries(self):
+        """ Test that the highest paid employees come first """
+        assert self.index.top_salaries(2) == [self.bob, self.amy]
+        assert self.index.top_salaries(0) == []
+
+    @patch("builtins.input", return_value="bob@test.com")
+    def test_retrieve_email_keeps_index_current(self, valid_input):
+        """ Test that an email collected by retrieve_email moves the employee in the email index """
+        self.bob.retrieve_email()
+
+        assert self.index.find_by_email("bob@test.com") == [self.bob]
+        assert self.index.find_by_email("") == [self.amy]
+        assert self.bob.updated_datetime == datetime(2011, 11, 11, 11, 11, 11)
+
+    def test_update_keeps_sorted_indexes_current(self):
+        """ Test that salary and age changes move the employee in the sorted indexes """
+        self.lizzie.update(salary=5000, age=50)
+
+        assert self.index.top_salaries(1) == [self.lizzie]
+        assert self.index.age_range(45, 55) == [self.lizzie]
+        assert self.index.salary_range(0, 1000) == []
+
+    def test_remove(self):
+        """ Test that removed employees are no longer found """
+        self.index.remove(self.amy)
+
+        assert len(self.index) == 2
+        assert self.amy not in self.index
+        assert self.index.salary_range(0, 10000) == [self.lizzie, self.bob]
+        with pytest.raises(Exception):
+            self.index.remove(self.amy)
+
+    def test_table_rows_follow_updates(self):
+        """ Test that an index of table rows stays correct after rows read again are updated """
+        table = EmployeeTable([self.lizzie, self.bob, self.amy])
+        with EmployeeIndex(table) as index:
+            table[0].update(salary=9000, email="new@test.com")
+            table[2].update(age=20)
+
+            assert [employee.full_name for employee in index.top_salaries(1)] == ["Lizzie Altena"]
+            assert [employee.full_name for employee in index.find_by_email("new@test.com")] == ["Lizzie Altena"]
+            assert [employee.full_name for employee in index.age_range(0, 25)] == ["Amy Jones", "Lizzie Altena"]
+            assert table[1] in index
+
+            index.remove(table[0])
+            assert index.find_by_email("new@test.com") == []
+            assert len(index) == 2
+
+    def test_close(self):
+        """ Test that a closed or forgotten index stops listening for updates """
+        listeners = len(custom_object.update_listeners)
+        with EmployeeIndex([self.bob]) as index:
+            assert len(custom_object.update_listeners) == listeners + 1
+        self.bob.update(salary=1)
+        assert index.top_salaries(1)[0].salary == 1
+        assert index.salary_range(3000, 3000) == [self.bob]
+        assert len(custom_object.update_listeners) == listeners
+
+        # An index that is never closed is still let go of once nothing uses it
+        EmployeeIndex([self.bob])
+        gc.collect()
+        assert len(custom_object.update_listeners) == listeners
+
+    def test_sorted_pairs(self):
+        """ Test that pairs stay in order across many small buckets """
+        pairs = SortedPairs()
+        pairs.bucket_size = 4
+        for number in range(50):
+            pairs.add((number * 7 % 50, (number,)))
+        for number in range(0, 50, 3):
+            pairs.remove((number * 7 % 50, (number,)))
+
+        expected = sorted((number * 7 % 50, (number,)) for number in range(50) if number % 3)
+        assert list(pairs) == expected
+        assert len(pairs) == len(expected)
+        assert list(pairs.between(10, 20)) == [pair for pair in expected if 10 <= pair[0] <= 20]
+        assert list(pairs.largest(3)) == expected[:-4:-1]
+
+    def test_sorted_pairs_remove_missing(self):
+        """ Test that removing a pair that is not there raises instead of removing another pair """
+        pairs = SortedPairs()
+        for number in range(5):
+            pairs.add((number * 10, (number,)))
+
+        for missing in [(20, (9,)), (15, (1,)), (99, (0,))]:
+            with pytest.raises(Exception, match="not in the sorted pairs"):
+                pairs.remove(missing)
+        assert list(pairs) == [(number * 10, (number,)) for number in range(5)]
@@ -0,0 +1,103 @@
+# Import the required libraries
+import io
+import os
+import sys
+import tempfile
+import unittest
+import pytest
+from unittest.mock import patch
+from datetime import datetime
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+from clocks import BatchClock
+from custom_object import main
+from employee_loader import build_employees, ingest, read_rows
+
+
+class TestEmployeeLoader(unittest.TestCase):
+    """ Test streaming employees from files """
+
+    def setUp(self):
+        """ Run this code before every test """
+        # Write the same employees as a CSV file and a JSON Lines file
+        self.folder = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.folder.name, "employees.csv")
+        self.jsonl_path = os.path.join(self.folder.name, "employees.jsonl")
+
+        with open(self.csv_path, "w") as file:
+            file.write("first_name,last_name,age,salary,email\n")
+            file.write("lizzie,altena,25,1000,lizzie@test.com\n")
+            file.write("bob,smith,31,2000,\n")
+            file.write("amy,jones,40,3000,amy@test.com\n")
+
+        with open(self.jsonl_path, "w") as file:
+            file.write('{"first_name": "lizzie", "last_name": "altena", "age": 25, "salary": 1000}\n')
+            file.write('{"first_name": "bob", "last_name": "smith", "age": 31, "salary": 2000}\n\n')
+
+        # Capture all printed statements here instead of the terminal
+        self.capturedOutput = io.StringIO()
+        sys.stdout = self.capturedOutput
+
+    def tearDown(self):
+        """ Run this code after every test """
+        self.folder.cleanup()
+        sys.stdout = sys.__stdout__
+
+    def test_read_rows(self):
+        """ Test that both file formats produce the same kind of rows """
+        assert [row["first_name"] for row in read_rows(self.csv_path)] == ["lizzie", "bob", "amy"]
+        assert [row["salary"] for row in read_rows(self.jsonl_path)] == [1000, 2000]
+
+    def test_read_rows_json(self):
+        """ Test that a .json file is read as a list of employees, not as JSON Lines """
+        path = os.path.join(self.folder.name, "employees.json")
+        with open(path, "w") as file:
+            file.write('[\n  {"first_name": "lizzie", "last_name": "altena", "age": 25, "salary": 1000}\n]\n')
+        assert [row["first_name"] for row in read_rows(path)] == ["lizzie"]
+
+        with open(path, "w") as file:
+            file.write('{"first_name": "lizzie", "last_name": "altena", "age": 25, "salary": 1000}\n')
+        with pytest.raises(Exception, match="must hold a list of employees"):
+            list(read_rows(path))
+
+    def test_read_rows_unknown_format(self):
+        """ Test that unsupported files raise an error about their format """
+        path = os.path.join(self.folder.name, "employees.txt")
+        with open(path, "w") as file:
+            file.write("lizzie,altena,25,1000\n")
+
+        with pytest.raises(Exception, match="only .csv, .jsonl, and .json files are supported"):
+            list(read_rows(path))
+
+    def test_build_employees_batches_quietly(self):
+        """ Test that employees are built in batches without displaying a message for each one """
+        batches = list(build_employees(read_rows(self.csv_path), batch_size=2))
+
+        assert [len(batch) for batch in batches] == [2, 1]
+        assert batches[0][0].full_name == "Lizzie Altena"
+        assert batches[0][1].email == ""
+        assert self.capturedOutput.getvalue() == ""
+
+    def test_ingest(self):
+        """ Test that every batch is handed over and counted """
+        employees = []
+        report = ingest(self.csv_path, batch_size=2, handle_batch=employees.extend)
+
+        assert report["rows"] == 3
+        assert report["rows_per_second"] > 0
+        assert [employee.salary for employee in employees] == [1000, 2000, 3000]
+
+    def test_ingest_with_batch_clock(self):
+        """ Test that a batch clock gives every loaded employee the same timestamp """
+        employees = []
+        ingest(self.csv_path, handle_batch=employees.extend, clock=BatchClock(datetime(2011, 11, 11)))
+
+        assert {employee.created_datetime for employee in employees} == {datetime(2011, 11, 11)}
+
+    def test_main_from_file(self):
+        """ Test the --from-file option of the main function """
+        with patch.object(sys, "argv", ["custom_object.py", "--from-file", self.jsonl_path]):
+            main()
+
+        assert self.capturedOutput.getvalue().startswith("Loaded 2 employees in ")
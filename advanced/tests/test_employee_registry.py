@@ -0,0 +1,129 @@
+# Import the required libraries
+import sys
+import threading
+import unittest
+from datetime import datetime
+
+import pytest
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+from clocks import BatchClock, use_clock
+from custom_object import Employee
+from employee_index import EmployeeIndex
+from employee_registry import EmployeeRegistry
+from employee_stats import EmployeeStats
+from events import NULL_SINK
+
+
+def make_employee(salary: int = 1000) -> Employee:
+    """ Create an employee without displaying a message """
+    return Employee(first_name="first", last_name="last", age=30, salary=salary, sink=NULL_SINK)
+
+
+class TestEmployeeRegistry(unittest.TestCase):
+    """ Test the thread-safe employee registry """
+
+    def setUp(self):
+        """ Run this code before every test """
+        self.registry = EmployeeRegistry(partitions=4)
+
+    def test_add_get_remove(self):
+        """ Test adding, finding, and removing employees by id """
+        employee = make_employee()
+        self.registry.add(7, employee)
+
+        assert self.registry.get(7) is employee
+        assert 7 in self.registry and len(self.registry) == 1
+        with pytest.raises(Exception):
+            self.registry.add(7, make_employee())
+
+        assert self.registry.remove(7) is employee
+        assert self.registry.get(7) is None
+        with pytest.raises(Exception):
+            self.registry.remove(7)
+        with pytest.raises(Exception):
+            EmployeeRegistry(partitions=0)
+
+    def test_update_and_snapshot(self):
+        """ Test that updates set updated_datetime and snapshots do not change afterwards """
+        self.registry.add("a", make_employee())
+        with use_clock(BatchClock(datetime(2011, 11, 11))):
+            employee = self.registry.update("a", salary=2000)
+        assert employee.salary == 2000
+        assert employee.updated_datetime == datetime(2011, 11, 11)
+
+        snapshot = self.registry.snapshot()
+        self.registry.update("a", salary=3000)
+        assert snapshot["a"].salary == 2000
+        assert dict(self.registry)["a"].salary == 3000
+
+        with pytest.raises(Exception):
+            self.registry.update("missing", salary=1)
+
+    def test_concurrent_updates(self):
+        """ Test that many threads adding, updating, and reading at once lose no changes """
+        threads_count = 8
+        per_thread = 200
+        for number in range(50):
+            self.registry.add(number, make_employee(salary=0))
+
+        # Failures and snapshot sizes seen inside the threads, checked once every thread has finished
+        errors = []
+        sizes = []
+
+        def work(thread: int):
+            try:
+                for step in range(per_thread):
+                    # Every thread adds its own employees and raises a shared employee's salary
+                    self.registry.add((thread, step), make_employee())
+                    self.registry.update_with(step % 50, lambda employee: {"salary": employee.salary + 1})
+                    if step % 50 == 0:
+                        sizes.append(len(self.registry.snapshot()))
+            except Exception as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=work, args=(thread,)) for thread in range(threads_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(sizes) == threads_count * per_thread // 50 and min(sizes) >= 50
+        snapshot = self.registry.snapshot()
+        assert len(snapshot) == 50 + threads_count * per_thread
+        assert sum(snapshot[number].salary for number in range(50)) == threads_count * per_thread
+        assert all(snapshot[number].updated_datetime for number in range(50))
+
+    def test_listeners_follow_concurrent_updates(self):
+        """ Test that an index and statistics stay correct while employees in every partition are updated at once """
+        employees = [make_employee(salary=0) for _ in range(8)]
+        for number, employee in enumerate(employees):
+            self.registry.add(number, employee)
+
+        errors = []
+
+        # Switch threads far more often than usual, so listener calls for different employees interleave
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(0.000001)
+        self.addCleanup(sys.setswitchinterval, interval)
+
+        def work(number: int):
+            try:
+                for salary in range(1, 201):
+                    self.registry.update(number, salary=number * 1000 + salary)
+            except Exception as error:
+                errors.append(error)
+
+        with EmployeeIndex(employees) as index, EmployeeStats(employees) as stats:
+            threads = [threading.Thread(target=work, args=(number,)) for number in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert errors == []
+            assert index.salary_range(0, 10000) == employees
+            assert len(index.by_salary) == 8
+            assert stats.snapshot()["salary_mean"] == sum(number * 1000 + 200 for number in range(8)) / 8
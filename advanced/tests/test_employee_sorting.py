@@ -0,0 +1,99 @@
+# Import the required libraries
+import csv
+import io
+import os
+import pickle
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+from custom_object import Employee, main
+from employee_sorting import TopK, bottom_k, external_sort, top_k, write_run
+from employee_table import EmployeeTable
+from events import NULL_SINK
+
+
+def make_employees(salaries: list) -> list:
+    """ Create an employee for every salary, numbered by their position """
+    return [
+        Employee(first_name=f"first{number}", last_name="last", age=20 + number % 7, salary=salary, sink=NULL_SINK)
+        for number, salary in enumerate(salaries)
+    ]
+
+
+class TestEmployeeSorting(unittest.TestCase):
+    """ Test the top-k and sorted views of employees """
+
+    def setUp(self):
+        """ Run this code before every test """
+        self.employees = make_employees([500, 900, 100, 900, 300, 700, 100, 800])
+
+    def test_top_and_bottom_k(self):
+        """ Test that the highest and lowest employees are found, ties in the order they were read """
+        assert [employee.salary for employee in top_k(iter(self.employees), 3)] == [900, 900, 800]
+        assert top_k(self.employees, 2)[0] is self.employees[1]
+        assert bottom_k(self.employees, 2) == [self.employees[2], self.employees[6]]
+        assert top_k(self.employees, 1, by="age")[0].age == 26
+
+    def test_running_top_k(self):
+        """ Test that TopK matches top_k and bottom_k as employees arrive one at a time """
+        for k in (0, 1, 3, 20):
+            highest = TopK(k)
+            highest.extend(self.employees)
+            assert highest.items() == top_k(self.employees, k)
+
+            lowest = TopK(k, largest=False)
+            lowest.extend(self.employees)
+            assert lowest.items() == bottom_k(self.employees, k)
+
+    def test_external_sort(self):
+        """ Test that sorting through temporary files matches sorting in memory """
+        expected = sorted(self.employees, key=lambda employee: employee.salary)
+
+        with tempfile.TemporaryDirectory() as folder:
+            for chunk_size in (1, 3, 100):
+                assert list(external_sort(self.employees, chunk_size=chunk_size, folder=folder)) == expected
+            assert os.listdir(folder) == []
+
+        descending = list(external_sort(self.employees, by="salary", reverse=True, chunk_size=3))
+        assert descending == sorted(self.employees, key=lambda employee: employee.salary, reverse=True)
+
+    def test_external_sort_table_rows(self):
+        """ Test that table rows are written as their fields, not with their whole table, and come back as copies """
+        table = EmployeeTable(make_employees(range(1000)))
+        rows = list(table)
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = write_run(rows[:2], folder, 0)
+            assert os.path.getsize(path) * 100 < len(pickle.dumps(table))
+
+        result = list(external_sort(rows, by="salary", reverse=True, chunk_size=300))
+        assert result == rows[::-1]
+        assert all(type(employee) is Employee for employee in result)
+
+    def test_main_top_k(self):
+        """ Test listing the highest paid employees of a file from the command line """
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "employees.csv")
+            with open(path, "w", newline="") as file:
+                writer = csv.writer(file)
+                writer.writerow(["first_name", "last_name", "age", "salary"])
+                writer.writerows([["ann", "lee", 30, 100], ["bob", "ray", 40, 300], ["cat", "fox", 50, 200]])
+
+            for args, expected in (
+                (["--top-k", "2", "--by", "salary"], ["Bob Ray", "Cat Fox"]),
+                (["--bottom-k", "1", "--by", "age"], ["Ann Lee"]),
+                (["--sort-by", "age", "--descending", "--chunk-size", "1"], ["Cat Fox", "Bob Ray", "Ann Lee"]),
+                # --from-file may also come first
+                (["--from-file", path, "--top-k", "1"], ["Bob Ray"]),
+            ):
+                if "--from-file" not in args:
+                    args = args + ["--from-file", path]
+                with patch("sys.argv", ["custom_object.py"] + args), \
+                        patch("sys.stdout", new_callable=io.StringIO) as output:
+                    main()
+                names = [line[6:] for line in output.getvalue().splitlines() if line.startswith("Name: ")]
+                assert names == expected
@@ -0,0 +1,119 @@
+# Import the required libraries
+import gc
+import random
+import statistics
+import sys
+import unittest
+import pytest
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+import custom_object
+from custom_object import Employee
+from employee_stats import EmployeeStats, QuantileSketch, RunningMoments
+from events import NULL_SINK
+
+
+def make_employee(age: int, salary: int) -> Employee:
+    """ Create an employee without displaying a message """
+    return Employee(first_name="Lizzie", last_name="Altena", age=age, salary=salary, sink=NULL_SINK)
+
+
+class TestEmployeeStats(unittest.TestCase):
+    """ Test the live salary and age statistics """
+
+    def setUp(self):
+        """ Run this code before every test """
+        self.existing = make_employee(25, 1000)
+        self.stats = EmployeeStats([self.existing], watch=True)
+
+    def tearDown(self):
+        """ Run this code after every test """
+        self.stats.close()
+
+    def test_running_moments(self):
+        """ Test that adding and removing values matches recomputing from scratch """
+        values = [random.randint(0, 100000) for _ in range(200)]
+        moments = RunningMoments()
+        for value in values:
+            moments.add(value)
+        for value in values[:50]:
+            moments.remove(value)
+
+        assert moments.count == 150
+        assert moments.mean == pytest.approx(statistics.fmean(values[50:]))
+        assert moments.variance() == pytest.approx(statistics.pvariance(values[50:]))
+
+    def test_quantile_sketch_accuracy(self):
+        """ Test that percentiles are within the relative accuracy of the true values """
+        values = sorted(random.randint(20000, 500000) for _ in range(10000))
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.1, 0.5, 0.9, 0.99):
+            true_value = values[int(q * (len(values) - 1))]
+            assert sketch.quantile(q) == pytest.approx(true_value, rel=0.011)
+
+        assert QuantileSketch().quantile(0.5) is None
+
+    def test_follows_new_employees(self):
+        """ Test that employees created after the statistics are counted automatically """
+        make_employee(35, 3000)
+
+        snapshot = self.stats.snapshot()
+        assert snapshot["count"] == 2
+        assert snapshot["salary_mean"] == 2000
+        assert snapshot["age_histogram"] == {20: 1, 30: 1}
+
+    def test_follows_updates(self):
+        """ Test that salary and age updates replace the old values """
+        self.existing.update(salary=5000, age=41)
+
+        snapshot = self.stats.snapshot(percentiles=(0.5,))
+        assert snapshot["salary_mean"] == 5000
+        assert snapshot["salary_percentiles"][0.5] == pytest.approx(5000, rel=0.01)
+        assert snapshot["age_histogram"] == {40: 1}
+
+    def test_remove(self):
+        """ Test that removed employees are no longer counted """
+        newer = make_employee(35, 3000)
+        self.stats.remove(self.existing)
+
+        snapshot = self.stats.snapshot()
+        assert snapshot["count"] == 1
+        assert snapshot["salary_mean"] == 3000
+        assert snapshot["salary_variance"] == 0
+        assert snapshot["age_histogram"] == {30: 1}
+
+        with pytest.raises(Exception):
+            self.stats.remove(self.existing)
+
+        # Updates to employees that are not counted are ignored
+        self.existing.update(salary=1)
+        assert self.stats.snapshot()["salary_mean"] == 3000
+        assert len(self.stats) == 1
+        assert newer.salary == 3000
+
+    def test_close(self):
+        """ Test that closed statistics stop following employees """
+        self.stats.close()
+        make_employee(35, 3000)
+        self.existing.update(salary=9000)
+        assert self.stats.snapshot()["salary_mean"] == 1000
+
+        # tearDown closes the statistics again, which does nothing
+        self.stats.close()
+
+    def test_watch_is_opt_in(self):
+        """ Test that only watching statistics count new employees, and unused ones stop listening """
+        listeners = len(custom_object.created_listeners), len(custom_object.update_listeners)
+        with EmployeeStats() as stats:
+            make_employee(35, 3000)
+            assert len(stats) == 0
+        assert (len(custom_object.created_listeners), len(custom_object.update_listeners)) == listeners
+
+        # Watching statistics that are never closed are let go of once nothing uses them
+        EmployeeStats(watch=True)
+        gc.collect()
+        assert (len(custom_object.created_listeners), len(custom_object.update_listeners)) == listeners
@@ -0,0 +1,111 @@
+# Import the required libraries
+import os
+import sys
+import tempfile
+import unittest
+import pytest
+from datetime import datetime
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+from clocks import BatchClock, use_clock
+from custom_object import Employee
+from employee_store import EmployeeStore, HEADER, MAGIC, ROW, SCHEMA_VERSION, write_employees
+from employee_table import EmployeeTable
+from events import NULL_SINK, use_sink
+
+
+class TestEmployeeStore(unittest.TestCase):
+    """ Test writing and reading the binary employee store """
+
+    def setUp(self):
+        """ Run this code before every test """
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, "employees.bin")
+
+        # Define any re-useable variables
+        with use_sink(NULL_SINK), use_clock(BatchClock(datetime(2011, 11, 11, 11, 11, 11, 500))):
+            self.employees = [
+                Employee(first_name="Lizzie", last_name="Altena", age=25, salary=1000),
+                Employee(first_name="Bob", last_name="Smith", age=31, salary=2000, email="bob@test.com"),
+                Employee(first_name="Amélie", last_name="Dupont", age=38, salary=4000),
+            ]
+            self.employees[2].update(email="bob@test.com")
+
+    def tearDown(self):
+        """ Run this code after every test """
+        self.folder.cleanup()
+
+    def test_round_trip(self):
+        """ Test that every employee reads back exactly as it was written """
+        assert write_employees(self.path, self.employees) == 3
+
+        with EmployeeStore(self.path) as store:
+            assert len(store) == 3
+            assert list(store) == self.employees
+            assert store[-1].updated_datetime == datetime(2011, 11, 11, 11, 11, 11, 500)
+            assert store[0].updated_datetime is None
+
+    def test_strings_are_interned(self):
+        """ Test that repeated names and emails are only stored once """
+        write_employees(self.path, self.employees)
+
+        with EmployeeStore(self.path) as store:
+            # "Lizzie Altena", "", "Bob Smith", "bob@test.com", and "Amélie Dupont"
+            assert store.string_count == 5
+            assert store.row(1)[1] == store.row(2)[1]
+
+        assert os.path.getsize(self.path) == (
+            HEADER.size + 3 * ROW.size + 6 * 8 + len("Lizzie AltenaBob Smithbob@test.comAmélie Dupont".encode())
+        )
+
+    def test_write_from_table(self):
+        """ Test that rows from an EmployeeTable can be written directly """
+        write_employees(self.path, EmployeeTable(self.employees))
+
+        with EmployeeStore(self.path) as store:
+            assert store[1] == self.employees[1]
+
+    def test_index_out_of_range(self):
+        """ Test that reading past the last row raises an error """
+        write_employees(self.path, self.employees)
+
+        with EmployeeStore(self.path) as store:
+            with pytest.raises(IndexError):
+                store.row(3)
+
+    def test_invalid_files(self):
+        """ Test that files which are not employee stores are rejected """
+        with open(self.path, "wb") as file:
+            file.write(b"not an employee store at all, just text")
+        with pytest.raises(Exception):
+            EmployeeStore(self.path)
+
+        with open(self.path, "wb") as file:
+            file.write(b"")
+        with pytest.raises(Exception):
+            EmployeeStore(self.path)
+
+    def test_version_and_row_size_errors(self):
+        """ Test that a newer schema and a wrong row size each give their own message """
+        write_employees(self.path, self.employees)
+        with open(self.path, "r+b") as file:
+            file.write(HEADER.pack(MAGIC, SCHEMA_VERSION + 1, ROW.size, 3, 0, 0))
+        with pytest.raises(Exception, match=f"schema version {SCHEMA_VERSION + 1}"):
+            EmployeeStore(self.path)
+
+        with open(self.path, "r+b") as file:
+            file.write(HEADER.pack(MAGIC, SCHEMA_VERSION, ROW.size + 8, 3, 0, 0))
+        with pytest.raises(Exception, match=f"has {ROW.size + 8} byte rows"):
+            EmployeeStore(self.path)
+
+    def test_string_bytes(self):
+        """ Test that string bytes are a view of the file, which must be released before closing """
+        write_employees(self.path, self.employees)
+
+        with EmployeeStore(self.path) as store:
+            name_id = store.row(2)[0]
+            with store.string_bytes(name_id) as encoded:
+                assert isinstance(encoded, memoryview)
+                assert encoded == "Amélie Dupont".encode()
+            assert store.string(name_id) == "Amélie Dupont"
@@ -0,0 +1,96 @@
+# Import the required libraries
+import io
+import sys
+import unittest
+import pytest
+from unittest.mock import patch
+from datetime import datetime
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+from custom_object import Employee
+from employee_table import EmployeeTable, StringColumn
+
+
+class TestEmployeeTable(unittest.TestCase):
+    """ Test the functions within the EmployeeTable class """
+
+    def setUp(self):
+        """ Run this code before every test """
+        # Mock the function that gets datetime.now, therefore, we know what date to expect everytime it is called
+        self.mock_datetime = patch("custom_object.get_datetime", return_value=datetime(2011, 11, 11, 11, 11, 11))
+        self.mock_datetime.start()
+
+        # Capture all printed statements here instead of the terminal
+        self.capturedOutput = io.StringIO()
+        sys.stdout = self.capturedOutput
+
+        # Define any re-useable variables
+        self.employees = [
+            Employee(first_name="Lizzie", last_name="Altena", age=25, salary=1000),
+            Employee(first_name="Bob", last_name="Smith", age=31, salary=2000, email="bob@test.com"),
+            Employee(first_name="Amélie", last_name="Dupont", age=38, salary=4000),
+        ]
+        self.table = EmployeeTable(self.employees)
+
+    def tearDown(self):
+        """ Run this code after every test """
+        self.mock_datetime.stop()
+        sys.stdout = sys.__stdout__
+
+    def test_rows_match_employees(self):
+        """ Test that every row looks exactly like the employee it was copied from """
+        assert len(self.table) == 3
+        for row, employee in zip(self.table, self.employees):
+            assert str(row) == str(employee)
+            assert row == employee
+            assert row.to_employee() == employee
+        assert self.table[-1].full_name == "Amélie Dupont"
+
+    def test_append(self):
+        """ Test that single employees and raw fields can be appended """
+        self.table.append(self.employees[0])
+        self.table.append_fields(full_name="New Person", age=50, salary=10)
+        assert len(self.table) == 5
+        assert self.table[3] == self.employees[0]
+        assert self.table[4].created_datetime == datetime(2011, 11, 11, 11, 11, 11)
+        assert self.table[4].updated_datetime is None
+
+    def test_index_out_of_range(self):
+        """ Test that reading past the end of the table raises an error """
+        with pytest.raises(IndexError):
+            self.table[3]
+
+    @patch("builtins.input", return_value="lizzie@test.com")
+    def test_row_retrieve_email(self, valid_input):
+        """ Test that updating a row writes back to the table without disturbing other rows """
+        self.table[0].retrieve_email()
+        assert self.table[0].email == "lizzie@test.com"
+        assert self.table[0].updated_datetime == datetime(2011, 11, 11, 11, 11, 11)
+        assert self.table[1].email == "bob@test.com"
+        assert self.table[2].full_name == "Amélie Dupont"
+
+    def test_aggregates(self):
+        """ Test the salary and age aggregates """
+        assert self.table.total_salary() == 7000
+        assert self.table.mean_salary() == 7000 / 3
+        assert self.table.mean_age() == (25 + 31 + 38) / 3
+        assert self.table.age_histogram() == {20: 1, 30: 2}
+        assert self.table.age_histogram(bin_width=5) == {25: 1, 30: 1, 35: 1}
+        assert EmployeeTable().mean_salary() == 0.0
+
+    def test_string_column_set(self):
+        """ Test that shorter and longer strings replace one row only, and the left behind bytes are packed away """
+        column = StringColumn()
+        for value in ("aaaa", "bbbb", "cccc"):
+            column.append(value)
+
+        column.set(1, "b")
+        column.set(0, "a much longer string")
+        assert [column[index] for index in range(3)] == ["a much longer string", "b", "cccc"]
+
+        # Enough changes to leave more than half of the buffer unused always packs the strings back together
+        for number in range(50):
+            column.set(2, "é" * (number % 7))
+        assert [column[index] for index in range(3)] == ["a much longer string", "b", "é" * (49 % 7)]
+        assert column.unused <= len(column.data) // 2
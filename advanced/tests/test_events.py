@@ -0,0 +1,96 @@
+# Import the required libraries
+import io
+import logging
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+import events
+from custom_object import Employee
+from events import BufferedFileSink, LoggingSink, NULL_SINK, RingBufferSink, emit, set_sink, use_sink
+from inheritance import Dog
+
+
+class TestEvents(unittest.TestCase):
+    """ Test the event sinks """
+
+    def setUp(self):
+        """ Run this code before every test """
+        # Capture all printed statements here instead of the terminal
+        self.capturedOutput = io.StringIO()
+        sys.stdout = self.capturedOutput
+
+    def tearDown(self):
+        """ Run this code after every test """
+        sys.stdout = sys.__stdout__
+
+    def test_print_sink_is_default(self):
+        """ Test that messages are printed when no sink was chosen """
+        emit("test", "Hello %s!", "Lizzie")
+        assert self.capturedOutput.getvalue() == "Hello Lizzie!\n"
+
+    def test_null_sink(self):
+        """ Test that the null sink hides messages, for one call or for a with block """
+        Employee(first_name="Lizzie", last_name="Altena", age=25, salary=1000, sink=NULL_SINK)
+        with use_sink(NULL_SINK):
+            Dog(name="Bobbers", age=5).speak()
+        assert self.capturedOutput.getvalue() == ""
+
+    def test_set_sink_returns_previous(self):
+        """ Test that the global sink can be swapped and put back """
+        ring = RingBufferSink()
+        previous = set_sink(ring)
+        try:
+            emit("test", "first")
+        finally:
+            assert set_sink(previous) is ring
+        assert events.current_sink is previous
+        assert ring.messages() == ["first"]
+
+    def test_ring_buffer_sink(self):
+        """ Test that object messages are kept as events and old events are dropped """
+        ring = RingBufferSink(maxlen=3)
+        with use_sink(ring):
+            employee = Employee(first_name="Lizzie", last_name="Altena", age=25, salary=1000)
+            employee.greet_employee()
+            dog = Dog(name="Bobbers", age=5)
+            dog.speak()
+            dog.move()
+
+        assert ring.names() == ["animal_created", "animal_spoke", "animal_moved"]
+        assert ring.messages()[1:] == ["Bobbers: Woof Woof!", "Bobbers: I'm running!"]
+        assert self.capturedOutput.getvalue() == ""
+
+    @patch("builtins.input", side_effect=["test", "test@test.com"])
+    def test_ring_buffer_sink_per_call(self, mocked_input):
+        """ Test that a sink given to a single call only receives that call's messages """
+        ring = RingBufferSink()
+        employee = Employee(first_name="Lizzie", last_name="Altena", age=25, salary=1000)
+        employee.retrieve_email(sink=ring)
+
+        assert ring.names() == ["invalid_email"]
+        assert self.capturedOutput.getvalue() == "Creating a new employee!\n"
+
+    def test_buffered_file_sink(self):
+        """ Test that messages are written to the file once the sink is closed """
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "events.log")
+            with BufferedFileSink(path) as sink:
+                Dog(name="Bobbers", age=5, sink=sink).eat(sink=sink)
+
+            with open(path) as file:
+                assert file.read() == "Creating a new animal!\nBobbers: Nom Nom Nom!\n"
+
+    def test_logging_sink(self):
+        """ Test that messages are logged with the event name and formatted lazily """
+        logger = logging.getLogger("test_events")
+        with self.assertLogs(logger, level="INFO") as logs:
+            Dog(name="Bobbers", age=5).speak(sink=LoggingSink(logger))
+
+        assert logs.records[0].getMessage() == "Bobbers: Woof Woof!"
+        assert logs.records[0].event == "animal_spoke"
+        assert logs.records[0].args == ("Bobbers",)
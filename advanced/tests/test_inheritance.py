@@ -0,0 +1,64 @@
+# Import the required libraries
+import io
+import sys
+import unittest
+import pytest
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+from breeds import breed_registry
+from custom_object import equal_as_string
+from inheritance import Animal, Dog
+
+
+class TestAnimal(unittest.TestCase):
+    """ Test the comparison functions within the Animal and Dog classes """
+
+    def setUp(self):
+        """ Run this code before every test """
+        # Capture all printed statements here instead of the terminal
+        self.capturedOutput = io.StringIO()
+        sys.stdout = self.capturedOutput
+
+    def tearDown(self):
+        """ Run this code after every test """
+        sys.stdout = sys.__stdout__
+
+    def test_animal_eq_hash(self):
+        """ Test that animals compare by their fields, and their fields are hashed instead of the animals """
+        assert Animal(name="bobbers", age=5) == Animal(name="Bobbers", age=5)
+        assert Animal(name="Bobbers", age=5) != Animal(name="Bobbers", age=6)
+        assert len({Dog(name="Bobbers", age=5).fields(), Dog(name="bobbers", age=5).fields()}) == 1
+
+        with pytest.raises(TypeError):
+            hash(Dog(name="Bobbers", age=5))
+
+    def test_dog_never_equals_animal(self):
+        """ Test that a Dog and an Animal with the same name and age are different """
+        assert Animal(name="Bobbers", age=5) != Dog(name="Bobbers", age=5)
+        assert Dog(name="Bobbers", age=5) != Animal(name="Bobbers", age=5)
+
+    def test_animal_eq_as_string(self):
+        """ Test that the original str comparison is still available for animals """
+        expected = "\n------------ Animal Information ------------\nName: Bobbers\nAge: 5\n"
+        assert Animal(name="Bobbers", age=5) != expected
+        assert equal_as_string(Animal(name="Bobbers", age=5), expected)
+
+    def test_animal_slots(self):
+        """ Test that animals do not carry a __dict__ """
+        with pytest.raises(AttributeError):
+            Dog(name="Bobbers", age=5).owner = "Lizzie"
+
+    def test_dog_breed(self):
+        """ Test that dogs share their breed's details instead of copying them """
+        poodle = breed_registry.register("Poodle", min_weight=40, max_weight=70, energy=4)
+        first = Dog(name="Bobbers", age=5, breed="poodle")
+        second = Dog(name="Rex", age=3, breed="Poodle")
+
+        assert first.breed == "Poodle"
+        assert first.breed_details is second.breed_details is poodle
+        assert Dog(name="Bobbers", age=5).breed == "German Shepard"
+        assert first != Dog(name="Bobbers", age=5)
+
+        with pytest.raises(Exception):
+            Dog(name="Bobbers", age=5, breed="Unknown")
@@ -0,0 +1,114 @@
+# Import the required libraries
+import sys
+import unittest
+import pytest
+from datetime import datetime
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+from clocks import BatchClock, use_clock
+from custom_object import Employee
+from employee_index import EmployeeIndex
+from employee_stats import EmployeeStats
+from employee_table import EmployeeTable
+from events import NULL_SINK, use_sink
+from payroll import Payroll
+
+
+class TestPayroll(unittest.TestCase):
+    """ Test the vectorized payroll operations """
+
+    def setUp(self):
+        """ Run this code before every test """
+        with use_sink(NULL_SINK), use_clock(BatchClock(datetime(2011, 11, 11))):
+            self.employees = [
+                Employee(first_name="Lizzie", last_name="Altena", age=17, salary=1000),
+                Employee(first_name="Bob", last_name="Smith", age=25, salary=2000),
+                Employee(first_name="Amy", last_name="Jones", age=45, salary=100000),
+            ]
+
+    def test_raise_by_age_band(self):
+        """ Test that each employee gets the raise of their band, and employees younger than every band get none """
+        payroll = Payroll.from_employees(self.employees).raise_by_age_band([(40, 2), (18, 10)])
+
+        assert payroll.salaries.tolist() == pytest.approx([1000, 2200, 102000])
+
+    def test_cap_round_and_total(self):
+        """ Test capping, rounding, and totalling the new salaries """
+        payroll = Payroll.from_employees(self.employees).raise_all(3.3).cap(100000, minimum=1500)
+
+        assert payroll.salaries.tolist() == pytest.approx([1500, 2066, 100000])
+        assert payroll.round(to=100, mode="up").salaries.tolist() == [1500, 2100, 100000]
+        assert payroll.round(to=1000, mode="down").salaries.tolist() == [1000, 2000, 100000]
+        assert payroll.total() == 103000
+
+        with pytest.raises(Exception):
+            payroll.round(mode="sideways")
+
+    def test_bonuses_and_projection(self):
+        """ Test bonuses and projected totals do not change the salaries """
+        payroll = Payroll.from_employees(self.employees)
+
+        assert payroll.bonuses(10).tolist() == pytest.approx([100, 200, 10000])
+        assert payroll.project(2, 10).tolist() == pytest.approx([113300, 124630])
+        assert payroll.total() == 103000
+
+    def test_write_back_to_employees(self):
+        """ Test that only changed salaries are written back, each with the same updated_datetime """
+        payroll = Payroll.from_employees(self.employees).raise_by_age_band([(18, 5)]).cap(100000)
+
+        with use_clock(BatchClock(datetime(2012, 1, 1))):
+            assert payroll.write_back() == 1
+
+        assert [employee.salary for employee in self.employees] == [1000, 2100, 100000]
+        assert self.employees[1].updated_datetime == datetime(2012, 1, 1)
+        assert self.employees[2].updated_datetime is None
+        assert payroll.write_back() == 0
+
+    def test_write_back_to_table(self):
+        """ Test that a payroll made from a table changes the table's columns directly """
+        table = EmployeeTable(self.employees)
+        payroll = Payroll.from_table(table).raise_all(10)
+
+        with use_clock(BatchClock(datetime(2012, 1, 1))):
+            assert payroll.write_back() == 3
+
+        assert list(table.salary) == [1100, 2200, 110000]
+        assert table[0].updated_datetime == datetime(2012, 1, 1)
+        assert [employee.salary for employee in self.employees] == [1000, 2000, 100000]
+
+    def test_round_halves_up(self):
+        """ Test that salaries exactly half way between two multiples are rounded up, not to the even multiple """
+        payroll = Payroll([250, 350, 249, 1050], [30] * 4)
+
+        assert payroll.round(to=100).salaries.tolist() == [300, 400, 200, 1100]
+        payroll.salaries[:] = [0.5, 1.5, 2.5, 3.5]
+        assert payroll.final().tolist() == [1, 2, 3, 4]
+
+    def test_table_grows_while_payroll_is_used(self):
+        """ Test that employees can be added to a table after a payroll was made from it """
+        table = EmployeeTable(self.employees)
+        payroll = Payroll.from_table(table).raise_all(10)
+
+        with use_sink(NULL_SINK):
+            table.append(Employee(first_name="Ann", last_name="Lee", age=30, salary=5000))
+        assert payroll.write_back() == 3
+        assert list(table.salary) == [1100, 2200, 110000, 5000]
+
+    def test_write_back_to_table_with_listeners(self):
+        """ Test that an index and statistics on a table's rows hear about every salary written back """
+        table = EmployeeTable(self.employees)
+        with EmployeeIndex(table) as index, EmployeeStats(table) as stats:
+            with use_clock(BatchClock(datetime(2012, 1, 1))):
+                assert Payroll.from_table(table).raise_all(10).write_back() == 3
+
+            assert index.salary_range(1000, 1000) == []
+            assert [row.salary for row in index.salary_range(1100, 2200)] == [1100, 2200]
+            assert stats.snapshot()["salary_mean"] == pytest.approx(113300 / 3)
+
+            # Later updates still find the rows where the payroll left them
+            table[0].update(salary=1500)
+            assert [row.index for row in index.salary_range(0, 3000)] == [0, 1]
+
+        assert list(table.salary) == [1500, 2200, 110000]
+        assert table[1].updated_datetime == datetime(2012, 1, 1)
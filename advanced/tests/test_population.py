@@ -0,0 +1,74 @@
+# Import the required libraries
+import io
+import sys
+import unittest
+import pytest
+from unittest.mock import patch
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+from events import NULL_SINK
+from inheritance import Animal, Dog, animal_classes
+from population import DAYS_PER_YEAR, Population, find_behaviour, main
+
+
+class TestPopulation(unittest.TestCase):
+    """ Test the array-backed population simulation """
+
+    def setUp(self):
+        """ Run this code before every test """
+        # A Dog subclass without its own behaviour, defined here so tearDown can take it back out of animal_classes
+        class Puppy(Dog):
+            __slots__ = ()
+
+        self.Puppy = Puppy
+        self.population = Population(seed=1)
+        self.population.extend([
+            Animal(name="Bobbers", age=5, sink=NULL_SINK),
+            Dog(name="Rex", age=2, sink=NULL_SINK),
+            self.Puppy(name="Bit", age=0, sink=NULL_SINK),
+        ])
+        self.population.add_many(Dog, [1, 3])
+
+    def tearDown(self):
+        """ Run this code after every test """
+        animal_classes.pop("Puppy")
+
+    def test_grouped_by_species(self):
+        """ Test that animals are grouped by their class and subclasses borrow behaviour """
+        assert len(self.population) == 5
+        assert len(self.population.species[Dog]) == 3
+        assert self.population.species[Animal].names == ["Bobbers"]
+        assert self.population.species[Dog].names == ["Rex", None, None]
+        assert find_behaviour(self.Puppy) is find_behaviour(Dog)
+
+        with pytest.raises(Exception):
+            self.population.add_many(str, [1])
+
+    def test_tick(self):
+        """ Test that a tick ages, moves, and feeds every animal """
+        for _ in range(3):
+            self.population.tick()
+
+        dogs = self.population.species[Dog]
+        assert dogs.ages.tolist() == pytest.approx([age + 3 / DAYS_PER_YEAR for age in (2, 1, 3)])
+        assert (dogs.distance > 0).all() and (dogs.distance <= 9).all()
+
+        # Dogs get hungry every 2 days, other animals about every 3
+        assert dogs.meals.tolist() == [1, 1, 1]
+        assert self.population.species[Animal].meals.tolist() == [1]
+        assert self.population.days == 3
+
+    def test_run_report(self):
+        """ Test that running reports the rate of ticks and animal updates """
+        report = self.population.run(4)
+        assert report["ticks"] == 4 and report["animals"] == 5
+        assert report["updates_per_second"] == pytest.approx(report["ticks_per_second"] * 5)
+        assert self.population.summary()["Puppy"]["count"] == 1
+
+    def test_main(self):
+        """ Test the simulation from the command line """
+        with patch("sys.argv", ["population.py", "100", "5"]), patch("sys.stdout", new_callable=io.StringIO) as output:
+            main()
+        assert "100 Animals, 5 Days" in output.getvalue()
+        assert "animal-updates/sec" in output.getvalue()
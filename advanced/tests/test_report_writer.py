@@ -0,0 +1,124 @@
+# Import the required libraries
+import csv
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+import pytest
+from datetime import datetime
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+from clocks import BatchClock, use_clock
+from custom_object import Employee
+from employee_table import EmployeeTable
+from events import NULL_SINK, use_sink
+from inheritance import Animal, Dog, animal_classes
+from report_writer import CSV_COLUMNS, ReportWriter, csv_columns, write_report
+
+
+class TestReportWriter(unittest.TestCase):
+    """ Test writing reports of employees and animals """
+
+    def setUp(self):
+        """ Run this code before every test """
+        # A subclass the report writer has no template for, defined here so tearDown can unregister it
+        class Cat(Animal):
+            def __str__(self) -> str:
+                return f"Cat {self.name}"
+
+        with use_sink(NULL_SINK), use_clock(BatchClock(datetime(2011, 11, 11, 11, 11, 11))):
+            employee = Employee(first_name="Lizzie", last_name="Altena", age=25, salary=1000)
+            updated = Employee(first_name="Bob", last_name="Smith", age=31, salary=2000)
+            updated.update(email="bob@test.com")
+            self.records = [
+                employee,
+                updated,
+                Animal(name="Whiskers", age=2),
+                Dog(name="Bobbers", age=5),
+                Cat(name="Tom", age=3),
+            ]
+
+    def tearDown(self):
+        """ Run this code after every test """
+        animal_classes.pop("Cat")
+
+    def test_text_matches_print(self):
+        """ Test that the text report is exactly what printing every record displays """
+        output = io.StringIO()
+        with ReportWriter(output, buffer_size=100) as writer:
+            assert writer.write_all(self.records) == 5
+            writer.write(EmployeeTable(self.records[:2])[1])
+
+        assert output.getvalue() == "".join(f"{record}\n" for record in self.records + [self.records[1]])
+
+    def test_csv(self):
+        """ Test that every record becomes a CSV row with the columns it uses """
+        output = io.StringIO()
+        with ReportWriter(output, format="csv") as writer:
+            writer.write_all(self.records)
+
+        rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+        assert [row["type"] for row in rows] == ["Employee", "Employee", "Animal", "Dog", "Cat"]
+        assert rows[1]["email"] == "bob@test.com"
+        assert rows[1]["updated_datetime"] == "2011-11-11T11:11:11"
+        assert rows[3]["breed"] == "German Shepard"
+        assert rows[4]["name"] == "Tom"
+
+    def test_jsonl(self):
+        """ Test that every record becomes one JSON object per line """
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "report.jsonl")
+            assert write_report(self.records, path, format="jsonl") == 5
+
+            with open(path) as file:
+                rows = [json.loads(line) for line in file]
+
+        assert rows[0] == {
+            "type": "Employee",
+            "full_name": "Lizzie Altena",
+            "age": 25,
+            "salary": 1000,
+            "email": "",
+            "created_datetime": "2011-11-11T11:11:11",
+            "updated_datetime": None,
+        }
+        assert rows[3] == {"type": "Dog", "name": "Bobbers", "breed": "German Shepard", "age": 5}
+
+    def test_csv_extra_fields(self):
+        """ Test that an Animal subclass whose rows add a field gets its own CSV column """
+        class Ferret(Animal):
+            __slots__ = ("color",)
+            row_fields = Animal.row_fields + ("color",)
+
+            def to_row(self) -> dict:
+                return {**super().to_row(), "color": self.color}
+
+        try:
+            ferret = Ferret(name="Slinky", age=1, sink=NULL_SINK)
+            ferret.color = "white"
+            assert csv_columns() == CSV_COLUMNS + ("color",)
+            assert csv_columns([Animal, Dog]) == CSV_COLUMNS
+
+            # The records are only read once, as they are written
+            with tempfile.TemporaryDirectory() as folder:
+                path = os.path.join(folder, "report.csv")
+                assert write_report(iter(self.records + [ferret]), path, format="csv") == 6
+                with open(path) as file:
+                    rows = list(csv.DictReader(file))
+            assert rows[-1]["color"] == "white"
+            assert rows[0]["color"] == ""
+
+            # A writer given only the usual columns explains how to include the extra field
+            with pytest.raises(Exception, match="color"):
+                with ReportWriter(io.StringIO(), format="csv", columns=CSV_COLUMNS) as writer:
+                    writer.write(ferret)
+        finally:
+            animal_classes.pop("Ferret")
+
+    def test_unknown_format(self):
+        """ Test that only the supported formats can be used """
+        with pytest.raises(Exception):
+            ReportWriter(io.StringIO(), format="xml")
@@ -0,0 +1,58 @@
+# Import the required libraries
+import sys
+import unittest
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+sys.path.append(sys.path[0] + '/../benchmarks')
+from run_benchmarks import CONTROL, find_regressions, time_per_call
+
+
+class TestRunBenchmarks(unittest.TestCase):
+    """ Test how the benchmark results are compared to the baseline """
+
+    def setUp(self):
+        """ Run this code before every test """
+        self.baseline = {CONTROL: 100.0, "employee_eq": 1.0, "bulk_sort_1000": 50.0}
+
+    def test_no_regression(self):
+        """ Test metrics within the threshold are not reported """
+        metrics = {CONTROL: 100.0, "employee_eq": 1.2, "bulk_sort_1000": 40.0}
+        assert find_regressions(metrics, self.baseline, 0.25) == []
+
+    def test_regression(self):
+        """ Test a metric slower than the threshold is reported by name """
+        metrics = {CONTROL: 100.0, "employee_eq": 1.5, "bulk_sort_1000": 50.0}
+        regressions = find_regressions(metrics, self.baseline, 0.25)
+        assert len(regressions) == 1
+        assert regressions[0].startswith("employee_eq: 1.500 us is 50% slower")
+
+    def test_scaled_by_control(self):
+        """ Test a machine running twice as slow does not make every metric regress, but a real slowdown still does """
+        metrics = {CONTROL: 200.0, "employee_eq": 2.2, "bulk_sort_1000": 150.0}
+        regressions = find_regressions(metrics, self.baseline, 0.25)
+        assert [regression.split(":")[0] for regression in regressions] == ["bulk_sort_1000"]
+
+    def test_noisy_metric(self):
+        """ Test a metric whose runs vary a lot is allowed to vary by more than the threshold """
+        metrics = {CONTROL: 100.0, "employee_eq": 1.5, "bulk_sort_1000": 50.0}
+        assert find_regressions(metrics, self.baseline, 0.25, spread={"employee_eq": 0.2}) == []
+
+    def test_noise_allowance_is_capped(self):
+        """ Test a metric with very noisy runs is still reported once it is more than twice the threshold slower """
+        metrics = {CONTROL: 100.0, "employee_eq": 1.6, "bulk_sort_1000": 500.0}
+        spread = {"employee_eq": 4.5, "bulk_sort_1000": 4.5}
+        regressions = find_regressions(metrics, self.baseline, 0.25, spread=spread)
+        assert [regression.split(":")[0] for regression in regressions] == ["employee_eq", "bulk_sort_1000"]
+
+    def test_new_and_missing_metrics(self):
+        """ Test metrics missing from the baseline, and baselines without a control, are still compared safely """
+        metrics = {"employee_eq": 1.0, "new_metric": 1000.0}
+        assert find_regressions(metrics, {"employee_eq": 1.0}, 0.25) == []
+
+    def test_time_per_call(self):
+        """ Test the timing returns the microseconds per call and a spread that is never negative """
+        median, spread = time_per_call(lambda: None, number=100, repeat=5)
+        assert median > 0
+        assert spread >= 0
+
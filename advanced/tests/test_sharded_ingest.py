@@ -0,0 +1,81 @@
+# Import the required libraries
+import io
+import os
+import sys
+import tempfile
+import unittest
+import pytest
+from unittest.mock import patch
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+from sharded_ingest import PartialAggregate, aggregate_shard, aggregate_shards, main
+
+
+class TestShardedIngest(unittest.TestCase):
+    """ Test totalling employee shard files in worker processes """
+
+    def setUp(self):
+        """ Run this code before every test """
+        # Write three small shards, one of them empty
+        self.folder = tempfile.TemporaryDirectory()
+        self.paths = []
+        for number, rows in enumerate([
+            ["lizzie,altena,25,1000", "bob,smith,31,3000"],
+            ["amy,jones,47,2000"],
+            [],
+        ]):
+            path = os.path.join(self.folder.name, f"shard{number}.csv")
+            with open(path, "w") as file:
+                file.write("first_name,last_name,age,salary\n" + "\n".join(rows))
+            self.paths.append(path)
+
+    def tearDown(self):
+        """ Run this code after every test """
+        self.folder.cleanup()
+
+    def test_aggregate_shard(self):
+        """ Test the totals for a single shard """
+        partial = aggregate_shard(self.paths[0], chunk_size=1)
+
+        assert partial.to_dict() == {
+            "count": 2,
+            "salary_sum": 4000,
+            "salary_min": 1000,
+            "salary_max": 3000,
+            "salary_mean": 2000.0,
+            "age_histogram": {20: 1, 30: 1},
+        }
+
+    def test_merge(self):
+        """ Test that merging shards matches totalling everything at once, including empty shards """
+        merged = PartialAggregate()
+        for path in self.paths:
+            merged.merge(aggregate_shard(path))
+
+        assert merged.count == 3
+        assert merged.salary_min == 1000
+        assert merged.age_histogram == {20: 1, 30: 1, 40: 1}
+
+        with pytest.raises(Exception):
+            merged.merge(PartialAggregate(bin_width=5))
+
+    def test_aggregate_shards(self):
+        """ Test totalling the shards in worker processes """
+        result = aggregate_shards(self.paths, workers=2, chunk_size=1)
+
+        assert result["count"] == 3
+        assert result["salary_sum"] == 6000
+        assert result["salary_max"] == 3000
+        assert result["age_histogram"] == {20: 1, 30: 1, 40: 1}
+        assert result["rows_per_second"] > 0
+
+    def test_main(self):
+        """ Test the command line summary """
+        captured_output = io.StringIO()
+        with patch.object(sys, "argv", ["sharded_ingest.py", "--workers", "1", *self.paths]):
+            with patch.object(sys, "stdout", captured_output):
+                main()
+
+        assert "3 Employees" in captured_output.getvalue()
+        assert "Salary Total: 6000" in captured_output.getvalue()
@@ -0,0 +1,126 @@
+# Import the required libraries
+import os
+import random
+import threading
+import time
+
+import requests
+
+from requests.adapters import HTTPAdapter
+
+# The API every request is sent to, API_NINJAS_URL can point it at another server such as mock_api_server.py
+API_BASE_URL = os.environ.get("API_NINJAS_URL", "https://api.api-ninjas.com/v1")
+
+# The status codes worth trying again, the API is busy or briefly broken
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class ApiNinjasClient:
+    """ Sends requests to api-ninjas over reused connections, with timeouts and retries """
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        base_url: str = API_BASE_URL,
+        timeout: tuple = (3.05, 15),
+        retries: int = 3,
+        backoff: float = 0.5,
+        max_retry_after: float = 60,
+        pool_size: int = 10
+    ):
+        """
+        :param api_key: (str) the personal key sent in the X-Api-Key header
+        :param base_url: (str) where the API is, such as https://api.api-ninjas.com/v1
+        :param timeout: (tuple) the seconds to wait for a connection and for the response, or one number for both
+        :param retries: (int) how many more times a request is sent after a 429, 5xx, or connection failure
+        :param backoff: (float) the seconds waited before the first retry, doubling for each retry after it
+        :param max_retry_after: (float) the longest a Retry-After header can make a retry wait, in seconds
+        :param pool_size: (int) how many connections are kept open for reuse, the most threads sending at once
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_retry_after = max_retry_after
+
+        # The session keeps connections open between requests, so only the first one pays for TCP and TLS setup
+        self.session = requests.Session()
+        self.session.headers["X-Api-Key"] = api_key
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def __enter__(self) -> "ApiNinjasClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """ Close every open connection """
+        self.session.close()
+
+    def wait_before_retry(self, attempt: int, response=None) -> None:
+        """ Wait longer after each failure, with jitter so many clients do not retry together """
+        delay = self.backoff * 2 ** attempt * random.uniform(0.5, 1.5)
+
+        # Wait at least as long as a busy API asks, up to a limit so one header can not stall the program for hours
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, min(int(retry_after), self.max_retry_after))
+        time.sleep(delay)
+
+    def get(self, path: str, *, params: dict = None, headers: dict = None, stream: bool = False) -> requests.Response:
+        """
+        Send a GET request, retrying 429 and 5xx responses and connection failures
+
+        :param path: (str) the endpoint, such as dogs or babynames
+        :param params: (dict) the query params
+        :param headers: (dict) headers to send along with the API key, such as {"Accept": "image/jpg"}
+        :param stream: (bool) read the body only when it is used, such as when saving an image to a file
+
+        :return: the last response, which may still be an error once every retry is used
+        """
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        for attempt in range(self.retries + 1):
+            try:
+                response = self.session.get(url, params=params, headers=headers, timeout=self.timeout, stream=stream)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.retries:
+                    raise
+                self.wait_before_retry(attempt)
+                continue
+
+            if response.status_code not in RETRY_STATUS_CODES or attempt == self.retries:
+                return response
+
+            # Read the error so the connection can be reused for the retry
+            response.close()
+            self.wait_before_retry(attempt, response)
+
+
+# The client shared by every script, created the first time it is needed
+shared_client = None
+shared_client_lock = threading.Lock()
+
+
+def get_client() -> ApiNinjasClient:
+    """ Return the shared client, creating it with the key in config.secrets the first time """
+    global shared_client
+    with shared_client_lock:
+        if shared_client is None:
+            # Imported here so a client with another key, such as for a local server, does not need the secrets file
+            from config.secrets import API_NINJAS_KEY
+
+            shared_client = ApiNinjasClient(API_NINJAS_KEY)
+        return shared_client
+
+
+def set_client(client: ApiNinjasClient) -> ApiNinjasClient:
+    """ Replace the shared client, such as with one pointed at a local server, returning the previous one """
+    global shared_client
+    with shared_client_lock:
+        previous = shared_client
+        shared_client = client
+        return previous
@@ -2,7 +2,7 @@
 import sys
 import requests
 
-from config.secrets import API_NINJAS_KEY
+from api_ninjas import get_client
 
 
 def get_baby_names(*, gender: str = "neutral", popular_only: str = "true") -> str:
@@ -14,11 +14,8 @@ def get_baby_names(*, gender: str = "neutral", popular_only: str = "true") -> st
 
     :return: a formatted string of 10 baby names separated by a new line
     """
-    # Set up the API URL with our set params
-    api_url = 'https://api.api-ninjas.com/v1/babynames?gender={}&{}'.format(gender, popular_only)
-
-    # Send the GET request the defined URL and our personal authorization
-    response = requests.get(api_url, headers={'X-Api-Key': API_NINJAS_KEY})
+    # Send the GET request with our set params through the shared client, which adds our personal authorization
+    response = get_client().get("babynames", params={"gender": gender, "popular_only": popular_only})
 
     # Check if the request was successful
     if response.status_code == requests.codes.ok:
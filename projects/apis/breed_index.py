@@ -0,0 +1,217 @@
+# Import the required libraries
+import json
+import sys
+
+from bisect import bisect_left, bisect_right
+
+# The 0 to 5 rating fields a search can ask for exactly
+RATING_FIELDS = ("shedding", "barking", "energy", "protectiveness", "trainability")
+
+# The most dogs the dogs API returns at once
+PAGE_SIZE = 20
+
+
+# To save every breed from the API for offline searches, execute the following code in the terminal :
+#   python3 projects/apis/breed_index.py breeds.jsonl
+
+# Or fetch them with several workers at once, which can continue if it is stopped :
+#   python3 projects/apis/dog_crawler.py breeds.jsonl
+
+# Then search them without the API :
+#   python3 projects/apis/dogs.py --offline breeds.jsonl
+
+
+def given(breed: dict, *fields) -> list:
+    """ Return the values of the fields the breed has, leaving out missing ones """
+    return [breed[field] for field in fields if breed.get(field) is not None]
+
+
+def drop_lowest(bitmap: int, count: int) -> int:
+    """
+    Clear the lowest count set bits of a bitmap, used to skip the first matches of a search
+
+    The bits are counted a whole machine word at a time while bisecting for the cut, instead of one bit at a time.
+    """
+    if count <= 0:
+        return bitmap
+    if count >= bitmap.bit_count():
+        return 0
+
+    # The shortest run of low bits that holds count set bits
+    low, high = 0, bitmap.bit_length()
+    while low < high:
+        middle = (low + high) // 2
+        if (bitmap & ((1 << middle) - 1)).bit_count() >= count:
+            high = middle
+        else:
+            low = middle + 1
+    return bitmap >> low << low
+
+
+class RangeIndex:
+    """
+    A sorted array of one number from every breed, answering "at least" or "at most" with a bisect
+
+    Only the bitmap of the matching breeds is built for each search, instead of keeping one for every position,
+    so the index takes O(n) memory rather than O(n²) bits.
+    """
+
+    def __init__(self, values: list):
+        """
+        :param values: (list) the number of every breed, by the breed's position, None for breeds without one
+        """
+        self.size = len(values)
+
+        # The positions of the breeds with a number, sorted by it, a breed without one never matches a limit
+        self.order = sorted(
+            (position for position, value in enumerate(values) if value is not None), key=values.__getitem__
+        )
+        self.values = [values[position] for position in self.order]
+        self.present = self.bitmap(self.order)
+
+    def bitmap(self, positions: list) -> int:
+        """ Return a bitmap with the bit of every position set, built as bytes instead of one big int at a time """
+        bits = bytearray((self.size + 7) // 8)
+        for position in positions:
+            bits[position >> 3] |= 1 << (position & 7)
+        return int.from_bytes(bits, "little")
+
+    def between(self, start: int, end: int) -> int:
+        """ Return a bitmap of the breeds from start to end in sorted order, setting the fewest bits it can """
+        if end - start <= len(self.order) // 2:
+            return self.bitmap(self.order[start:end])
+        return self.present ^ self.bitmap(self.order[:start] + self.order[end:])
+
+    def at_least(self, value: float) -> int:
+        """ Return a bitmap of every breed whose number is at least the value """
+        return self.between(bisect_left(self.values, value), len(self.values))
+
+    def at_most(self, value: float) -> int:
+        """ Return a bitmap of every breed whose number is at most the value """
+        return self.between(0, bisect_right(self.values, value))
+
+
+class BreedIndex:
+    """ Every breed held locally, answering the same searches as get_dog_options without the API """
+
+    def __init__(self, breeds: list):
+        """
+        :param breeds: (list) breed dictionaries in the shape the dogs API returns them
+        """
+        # Breeds are kept in name order, the order the API returns them in
+        self.breeds = sorted(breeds, key=lambda breed: breed["name"])
+        self.all = (1 << len(self.breeds)) - 1
+
+        # A bitmap for every rating field and value, where bit i is set if breed i has the value
+        self.ratings = {field: [0] * 6 for field in RATING_FIELDS}
+        for position, breed in enumerate(self.breeds):
+            for field in RATING_FIELDS:
+                if breed.get(field) is not None:
+                    self.ratings[field][int(breed[field])] |= 1 << position
+
+        # A limit matches a breed when the breed's range overlaps it, with males and females counted together
+        # A breed missing every number a limit is checked against never matches that limit
+        self.heaviest = RangeIndex(
+            [max(given(breed, "max_weight_male", "max_weight_female"), default=None) for breed in self.breeds]
+        )
+        self.lightest = RangeIndex(
+            [min(given(breed, "min_weight_male", "min_weight_female"), default=None) for breed in self.breeds]
+        )
+        self.longest_life = RangeIndex([breed.get("max_life_expectancy") for breed in self.breeds])
+        self.shortest_life = RangeIndex([breed.get("min_life_expectancy") for breed in self.breeds])
+
+    def __len__(self) -> int:
+        return len(self.breeds)
+
+    @classmethod
+    def from_file(cls, path: str) -> "BreedIndex":
+        """ Load the breeds from a JSON Lines file with one breed per line, or a JSON file with a list of breeds """
+        with open(path, encoding="utf-8") as file:
+            if path.endswith(".jsonl"):
+                return cls([json.loads(line) for line in file if line.strip()])
+            return cls(json.load(file))
+
+    def save(self, path: str) -> None:
+        """ Save the breeds as a JSON Lines file that from_file can load """
+        with open(path, "w", encoding="utf-8") as file:
+            for breed in self.breeds:
+                file.write(json.dumps(breed) + "\n")
+
+    def query(self, params: dict) -> int:
+        """
+        Return a bitmap of every breed matching the query params
+
+        :param params: (dict) query params like the ones sent to the API, such as {"energy": "3", "max_weight": "40"}
+        """
+        found = self.all
+        if params.get("min_weight"):
+            found &= self.heaviest.at_least(float(params["min_weight"]))
+        if params.get("max_weight"):
+            found &= self.lightest.at_most(float(params["max_weight"]))
+        if params.get("min_life_expectancy"):
+            found &= self.longest_life.at_least(float(params["min_life_expectancy"]))
+        if params.get("max_life_expectancy"):
+            found &= self.shortest_life.at_most(float(params["max_life_expectancy"]))
+        for field in RATING_FIELDS:
+            if params.get(field):
+                value = int(params[field])
+                found &= self.ratings[field][value] if 0 <= value <= 5 else 0
+        return found
+
+    def search(self, *, offset: int = 0, limit: int = PAGE_SIZE, **criteria) -> list:
+        """
+        Find the breeds matching the same criteria get_dog_options takes
+
+        :param offset: (int) how many matching breeds to skip, for pagination
+        :param limit: (int) the most breeds returned, None returns every match
+        :param criteria: min_weight, max_weight, min_life_expectancy, max_life_expectancy, or a rating field
+
+        :return: a list of breed dictionaries, the same as the API returns
+        """
+        found = drop_lowest(self.query(criteria), offset)
+        results = []
+
+        # Go through the set bits from the lowest, which is name order
+        while found and (limit is None or len(results) < limit):
+            lowest = found & -found
+            found ^= lowest
+            results.append(self.breeds[lowest.bit_length() - 1])
+        return results
+
+    def count(self, **criteria) -> int:
+        """ Return how many breeds match the criteria """
+        return self.query(criteria).bit_count()
+
+
+def crawl(fetch_page) -> list:
+    """
+    Fetch every breed, one page at a time
+
+    :param fetch_page: (function) called with an offset, returning the page of breeds starting there
+
+    :return: every breed, in the order they were fetched
+    """
+    breeds = []
+    while True:
+        page = fetch_page(len(breeds))
+        breeds.extend(page)
+        if len(page) < PAGE_SIZE:
+            return breeds
+
+
+def main():
+    # args is a list of the command line arguments, the file to save the breeds to
+    args = sys.argv[1:]
+    if len(args) != 1:
+        raise Exception("This program expects 1 argument.\nPlease provide the .jsonl file to save the breeds to.")
+
+    # Imported here so searching a saved index never needs the API key
+    from dogs import get_dog_options
+
+    index = BreedIndex(crawl(lambda offset: get_dog_options(offset=offset, bypass_cache=True)))
+    index.save(args[0])
+    print(f"Saved {len(index)} breeds to {args[0]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# Import the required libraries
+import json
+import os
+import sys
+import tempfile
+
+import dogs
+
+from api_ninjas import ApiNinjasClient, set_client
+from dog_crawler import DogCrawler, rating_partitions
+from mock_api_server import MockApiServer
+from query_cache import QueryCache
+
+
+# To compare crawling with one worker and with several, execute the following code in the terminal :
+#   python3 projects/apis/crawler_benchmark.py 0.1
+
+
+def fetch(params: dict, offset: int) -> list:
+    """ Fetch one page of a partition from the dogs API """
+    return dogs.get_dog_options(**params, offset=offset, bypass_cache=True)
+
+
+def count_breeds(path: str) -> tuple:
+    """ Return the number of breeds in a JSON Lines file and the number of different names """
+    with open(path) as file:
+        names = [json.loads(line)["name"] for line in file]
+    return len(names), len(set(names))
+
+
+def main():
+    # args is a list of the command line arguments, optionally the server delay in seconds
+    args = sys.argv[1:]
+    delay = float(args[0]) if args else 0.1
+
+    # Point the dog searches at a local server and keep the saved searches out of the measurement
+    server = MockApiServer(delay=delay).start()
+    set_client(ApiNinjasClient("local", base_url=server.url, backoff=0.05))
+    dogs.dog_cache = QueryCache(":memory:")
+
+    print(f"<---------- {len(server.breeds)} Breeds, {delay} Second Server Delay ---------->")
+    with tempfile.TemporaryDirectory() as folder:
+        for workers in (1, 2, 6):
+            path = os.path.join(folder, f"breeds{workers}.jsonl")
+            report = DogCrawler(fetch, partitions=rating_partitions(), workers=workers).crawl(path)
+            print(
+                f"{workers} workers: {report['pages']} pages in {report['seconds']:.2f} seconds "
+                f"({report['pages_per_second']:.1f} pages/sec), {count_breeds(path)[1]} breeds saved"
+            )
+
+        # Fail some requests, which the client retries, then stop the crawl part way and continue it from the checkpoint
+        path = os.path.join(folder, "resumed.jsonl")
+        server.failures = [503, 429]
+        crawler = DogCrawler(fetch, partitions=rating_partitions(), workers=6)
+
+        def stop_part_way(params: dict, offset: int) -> list:
+            if crawler.requests > 8:
+                raise Exception("Stopped on purpose.")
+            return fetch(params, offset)
+
+        crawler.fetch = stop_part_way
+        try:
+            crawler.crawl(path)
+        except Exception:
+            pass
+        partial = count_breeds(path)[0]
+
+        report = DogCrawler(fetch, partitions=rating_partitions(), workers=6).crawl(path)
+        saved, unique = count_breeds(path)
+        print(
+            f"Resumed: {partial} breeds saved before stopping after {crawler.requests} requests, "
+            f"{report['breeds']} added after resuming, {saved} saved in total with {unique} different names"
+        )
+
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
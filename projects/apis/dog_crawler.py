@@ -0,0 +1,227 @@
+# Import the required libraries
+import argparse
+import json
+import os
+import random
+import threading
+import time
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# The most dogs the dogs API returns at once
+PAGE_SIZE = 20
+
+
+# To save every breed from the API to a file, execute the following code in the terminal :
+#   python3 projects/apis/dog_crawler.py breeds.jsonl --workers 6 --rate 10
+
+# Running the same command again after it was stopped continues from its checkpoint
+
+
+class RateLimiter:
+    """ Lets at most rate requests start each second, shared by every worker thread """
+
+    def __init__(self, rate: float, *, burst: int = 1):
+        """
+        :param rate: (float) the most requests started each second on average, None or 0 for no limit
+        :param burst: (int) how many requests can start at once after a quiet period
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self) -> None:
+        """ Wait until another request is allowed to start """
+        if not self.rate:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+
+
+def partition_key(params: dict) -> str:
+    """ Return the same text for the same partition params, used in the checkpoint """
+    return json.dumps(params, sort_keys=True)
+
+
+class DogCrawler:
+    """ Fetches every page of several filtered searches at once, saving each breed once to a JSON Lines file """
+
+    def __init__(
+        self,
+        fetch,
+        *,
+        partitions: list,
+        workers: int = 4,
+        rate: float = None,
+        retries: int = 0,
+        backoff: float = 0.5,
+        retry_on: tuple = (OSError,)
+    ):
+        """
+        :param fetch: (function) called with the params and an offset, returning that page of breeds
+        :param partitions: (list) params for each search, such as [{"energy": "1"}, {"energy": "2"}]
+            Together they should cover every breed, breeds found by more than one are only saved once
+        :param workers: (int) the most pages fetched at once
+        :param rate: (float) the most requests started each second, None for no limit
+        :param retries: (int) how many more times a page is fetched after a temporary failure before the crawl stops
+            Leave it at 0 when fetch already retries, such as get_dog_options through the shared ApiNinjasClient,
+            otherwise every retry here repeats all of its retries
+        :param backoff: (float) the seconds waited before the first retry, doubling for each retry after it
+        :param retry_on: (tuple) the exceptions that are temporary, the default covers connection errors and timeouts
+            Any other exception, such as a rejected search, stops the crawl straight away
+        """
+        self.fetch = fetch
+        self.partitions = partitions
+        self.workers = workers
+        self.limiter = RateLimiter(rate, burst=workers)
+        self.retries = retries
+        self.backoff = backoff
+        self.retry_on = retry_on
+
+        # Counted while crawling, and read by the report
+        self.requests = 0
+        self.retried = 0
+        self.counter_lock = threading.Lock()
+
+    def fetch_page(self, params: dict, offset: int) -> list:
+        """ Fetch one page, waiting for the rate limit and retrying temporary failures with backoff and jitter """
+        for attempt in range(self.retries + 1):
+            self.limiter.wait()
+            with self.counter_lock:
+                self.requests += 1
+            try:
+                return self.fetch(params, offset)
+            except self.retry_on:
+                if attempt == self.retries:
+                    raise
+                with self.counter_lock:
+                    self.retried += 1
+                time.sleep(self.backoff * 2 ** attempt * random.uniform(0.5, 1.5))
+
+    def crawl(self, output_path: str, *, checkpoint_path: str = None) -> dict:
+        """
+        Fetch every page of every partition, appending new breeds to the output file as pages arrive
+
+        Each partition stops at its first page with fewer than PAGE_SIZE breeds.
+        The checkpoint records where each partition got to, so a stopped crawl continues where it left off.
+
+        :param output_path: (str) the .jsonl file breeds are added to
+        :param checkpoint_path: (str) where progress is saved, defaults to the output path with .checkpoint added
+
+        :return: a dictionary with the pages, new breeds, requests, retries, seconds taken, and pages per second
+        """
+        checkpoint_path = checkpoint_path or output_path + ".checkpoint"
+        progress = {}
+        if os.path.exists(checkpoint_path):
+            with open(checkpoint_path) as file:
+                progress = json.load(file)
+
+        # Breeds saved by an earlier run are not saved again
+        names = set()
+        if os.path.exists(output_path):
+            with open(output_path, encoding="utf-8") as file:
+                names = {json.loads(line)["name"] for line in file if line.strip()}
+
+        start = time.perf_counter()
+        pages = 0
+        added = 0
+
+        with open(output_path, "a", encoding="utf-8") as output, \
+                ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="crawler") as executor:
+            # Each partition has one page being fetched at a time, the partitions are fetched side by side
+            running = {}
+            for params in self.partitions:
+                offset = progress.get(partition_key(params), 0)
+                if offset is not None:
+                    running[executor.submit(self.fetch_page, params, offset)] = (params, offset)
+
+            while running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    params, offset = running.pop(future)
+                    try:
+                        page = future.result()
+                    except Exception:
+                        # Stop every other page, the checkpoint keeps what was already saved
+                        for other in running:
+                            other.cancel()
+                        raise
+
+                    pages += 1
+                    for breed in page:
+                        if breed["name"] not in names:
+                            names.add(breed["name"])
+                            output.write(json.dumps(breed) + "\n")
+                            added += 1
+                    output.flush()
+
+                    # None marks a partition as finished
+                    next_offset = offset + PAGE_SIZE if len(page) == PAGE_SIZE else None
+                    progress[partition_key(params)] = next_offset
+                    self.save_checkpoint(checkpoint_path, progress)
+                    if next_offset is not None:
+                        running[executor.submit(self.fetch_page, params, next_offset)] = (params, next_offset)
+
+        seconds = time.perf_counter() - start
+        return {
+            "pages": pages,
+            "breeds": added,
+            "requests": self.requests,
+            "retries": self.retried,
+            "seconds": seconds,
+            "pages_per_second": pages / seconds if seconds else 0.0,
+        }
+
+    @staticmethod
+    def save_checkpoint(path: str, progress: dict) -> None:
+        """ Save the progress, writing a new file and swapping it in so a crash never leaves half a checkpoint """
+        with open(path + ".tmp", "w") as file:
+            json.dump(progress, file)
+        os.replace(path + ".tmp", path)
+
+
+def rating_partitions(field: str = "energy") -> list:
+    """ Return one partition for every value of a 0 to 5 rating field, together they cover every breed rated for it """
+    return [{field: str(value)} for value in range(6)]
+
+
+def main():
+    # Read the options from the command line
+    parser = argparse.ArgumentParser(description="Save every breed from the dogs API to a JSON Lines file.")
+    parser.add_argument("output", help="the .jsonl file breeds are added to")
+    parser.add_argument("--workers", type=int, default=4, help="the most pages fetched at once")
+    parser.add_argument("--rate", type=float, default=10, help="the most requests started each second")
+    parser.add_argument("--partition-field", default="energy", help="the rating field searches are split by")
+    parser.add_argument("--checkpoint", default=None, help="where progress is saved")
+    args = parser.parse_args()
+
+    # Imported here since the crawler itself works with any fetch function
+    from dogs import get_dog_options
+
+    # The shared client already retries busy and failed requests, so the crawler does not retry them again
+    crawler = DogCrawler(
+        lambda params, offset: get_dog_options(**params, offset=offset, bypass_cache=True),
+        partitions=rating_partitions(args.partition_field),
+        workers=args.workers,
+        rate=args.rate
+    )
+    report = crawler.crawl(args.output, checkpoint_path=args.checkpoint)
+
+    print(
+        f"Saved {report['breeds']} new breeds from {report['pages']} pages in {report['seconds']:.2f} seconds "
+        f"({report['pages_per_second']:.1f} pages/sec)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,44 @@
 # Import the required libraries
+import os
+import sys
 import requests
 
-# Import the secret key
-from config.secrets import API_NINJAS_KEY
+from api_ninjas import get_client
+from page_prefetcher import PagePrefetcher
+from query_cache import QueryCache
 
+# Where searches are saved so repeating them, or going back a page, does not use the API again
+CACHE_PATH = os.environ.get(
+    "DOGS_CACHE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "dogs_cache.db")
+)
 
-def get_dog_options(
+# How many seconds a saved search is used, breeds rarely change so the default is a week
+CACHE_TTL = float(os.environ.get("DOGS_CACHE_TTL", 7 * 24 * 60 * 60))
+
+# The most searches saved at once
+CACHE_MAX_ENTRIES = int(os.environ.get("DOGS_CACHE_MAX_ENTRIES", 1000))
+
+# The cache used by get_dog_options, opened the first time it is needed
+dog_cache = None
+
+
+def get_dog_cache() -> QueryCache:
+    """ Return the cache of dog searches, opening it the first time """
+    global dog_cache
+    if dog_cache is None:
+        dog_cache = QueryCache(CACHE_PATH, ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES)
+    return dog_cache
+
+
+def close_dog_cache() -> None:
+    """ Close the cache of dog searches if it is open, the next search opens it again """
+    global dog_cache
+    if dog_cache is not None:
+        dog_cache.close()
+        dog_cache = None
+
+
+def build_dog_query(
         *,
         min_weight: str = None,
         max_weight: str = None,
@@ -17,9 +50,49 @@ def get_dog_options(
         protectiveness: str = None,
         trainability: str = None,
         offset: int = 0
+) -> dict:
+    """
+    Turn the selected dog properties into the query params sent to the API
+
+    The same search always gives the same params, so it can be used to find saved searches.
+    See get_dog_options for what each property means.
+
+    :return: a dictionary of every param that was provided, as strings
+    """
+    params = {
+        # Use at least one query param
+        "min_weight": min_weight or "1",
+        "max_weight": max_weight,
+        "min_life_expectancy": min_life_expectancy,
+        "max_life_expectancy": max_life_expectancy,
+        "shedding": shedding,
+        "barking": barking,
+        "energy": energy,
+        "protectiveness": protectiveness,
+        "trainability": trainability,
+        "offset": offset,
+    }
+
+    # Only keep the params that were provided, the first page has no offset
+    return {name: str(value).strip() for name, value in params.items() if value}
+
+
+def get_dog_options(
+        *,
+        min_weight: str = None,
+        max_weight: str = None,
+        min_life_expectancy: str = None,
+        max_life_expectancy: str = None,
+        shedding: str = None,
+        barking: str = None,
+        energy: str = None,
+        protectiveness: str = None,
+        trainability: str = None,
+        offset: int = 0,
+        bypass_cache: bool = False
 ) -> list:
     """
-    Send a GET request to the api-ninjas API using the selected dog properties
+    Send a GET request to the api-ninjas API using the selected dog properties, unless the search was saved
 
     :param min_weight: (str) minimum weight in pounds
     :param max_weight (str) - maximum weight in pounds.
@@ -37,46 +110,39 @@ def get_dog_options(
         Possible values: 0, 1, 2, 3, 4, 5, where 0 indicates the breed is very difficult to train
         and 5 indicates the breed is very easy to train
     :param offset: (int) number of results to offset for pagination.
+    :param bypass_cache: (bool) always ask the API, still saving the response for later searches
 
     :return: a list of dogs that matched the criteria provided
     """
-    # Set up the API URL with our set params
-    api_url = 'https://api.api-ninjas.com/v1/dogs?'
-
-    # Use at least one query param
-    api_url += f"min_weight={min_weight or '1'}&"
-
-    # Check to see which query params were provided
-    if max_weight:
-        api_url += f"max_weight={max_weight}&"
-    if min_life_expectancy:
-        api_url += f"min_life_expectancy={min_life_expectancy}&"
-    if max_life_expectancy:
-        api_url += f"max_life_expectancy={max_life_expectancy}&"
-    if shedding:
-        api_url += f"shedding={shedding}&"
-    if barking:
-        api_url += f"barking={barking}&"
-    if energy:
-        api_url += f"energy={energy}&"
-    if protectiveness:
-        api_url += f"protectiveness={protectiveness}&"
-    if trainability:
-        api_url += f"trainability={trainability}&"
-    if offset:
-        api_url += f"offset={offset}&"
-
-    # Remove the last ampersand (&)
-    if api_url[-1] == "&":
-        api_url = api_url[:-1]
-
-    # Send the GET request the defined URL and our personal authorization
-    response = requests.get(api_url, headers={'X-Api-Key': API_NINJAS_KEY})
+    params = build_dog_query(
+        min_weight=min_weight,
+        max_weight=max_weight,
+        min_life_expectancy=min_life_expectancy,
+        max_life_expectancy=max_life_expectancy,
+        shedding=shedding,
+        barking=barking,
+        energy=energy,
+        protectiveness=protectiveness,
+        trainability=trainability,
+        offset=offset
+    )
+
+    # Use the saved response when the same search was made recently
+    cache = get_dog_cache()
+    if not bypass_cache:
+        dogs = cache.get(params)
+        if dogs is not None:
+            return dogs
+
+    # Send the GET request through the shared client, which adds our personal authorization
+    response = get_client().get("dogs", params=params)
 
     # Check if the request was successful
     if response.status_code == requests.codes.ok:
-        # Return the formatted response
-        return eval(response.text)
+        # Save and return the formatted response
+        dogs = response.json()
+        cache.put(params, dogs)
+        return dogs
     else:
         # Raise an exception on why the request was unsuccessful
         error_message = f"API Request Status Code: {response.status_code}. API Request Error: {response.text}."
@@ -134,6 +200,24 @@ def get_user_input(variable: str) -> str:
 
 
 def main():
+    # Ask the API for every search instead of using saved searches when --no-cache is given
+    bypass_cache = "--no-cache" in sys.argv[1:]
+
+    # Search a saved breed index instead of the API when --offline is given with the index file
+    index = None
+    if "--offline" in sys.argv[1:]:
+        # Imported here so the API searches do not need the index
+        from breed_index import BreedIndex
+
+        position = sys.argv.index("--offline")
+        if position + 1 >= len(sys.argv):
+            raise Exception("The --offline option expects a .jsonl file of breeds, see breed_index.py to create one.")
+        index = BreedIndex.from_file(sys.argv[position + 1])
+
+    # Fetch the next page in the background while the current one is read, unless offline or --no-prefetch is given
+    prefetch = index is None and "--no-prefetch" not in sys.argv[1:]
+    pages = PagePrefetcher()
+
     # Display a welcome message
     print("Welcome to Dog Breed Matcher! Please provide criteria and we'll find dogs that match it!\n")
 
@@ -167,19 +251,33 @@ def main():
             protectiveness_value = get_user_input("protectiveness")
             trainability_value = get_user_input("trainability")
 
-        # Call the API with the inputs provided
-        dogs = get_dog_options(
-            min_weight=min_weight_value,
-            max_weight=max_weight_value,
-            min_life_expectancy=min_life_expectancy_value,
-            max_life_expectancy=max_life_expectancy_value,
-            shedding=shedding_value,
-            barking=barking_value,
-            energy=energy_value,
-            protectiveness=protectiveness_value,
-            trainability=trainability_value,
-            offset=offset
-        )
+            # Start a new search, dropping the pages of the last one
+            criteria = {
+                "min_weight": min_weight_value,
+                "max_weight": max_weight_value,
+                "min_life_expectancy": min_life_expectancy_value,
+                "max_life_expectancy": max_life_expectancy_value,
+                "shedding": shedding_value,
+                "barking": barking_value,
+                "energy": energy_value,
+                "protectiveness": protectiveness_value,
+                "trainability": trainability_value,
+            }
+            if index is not None:
+                pages.start(lambda page_offset, criteria=criteria: index.search(**criteria, offset=page_offset))
+            else:
+                pages.start(
+                    lambda page_offset, criteria=criteria: get_dog_options(
+                        **criteria, offset=page_offset, bypass_cache=bypass_cache
+                    )
+                )
+
+        # Call the API with the inputs provided, unless the page was already fetched in the background
+        dogs = pages.get(offset)
+
+        # Fetch the next page while this one is read, in case the user asks for it
+        if prefetch and len(dogs) == 20:
+            pages.prefetch(offset + 20)
 
         # Check if no dogs were returned due to picky criteria or exactly no dogs left after going to the next page
         if len(dogs) == 0:
@@ -290,6 +388,17 @@ def main():
         # Extra line for formatting
         print()
 
+    # Stop fetching pages in the background
+    pages.close()
+
+    # Show how many searches were answered without the API
+    if index is None:
+        stats = get_dog_cache().stats()
+        print(f"\nSaved searches were used {stats['hits']} times and missed {stats['misses']} times.")
+
+        # Saves when each search was last used, so the searches used most are the last ones removed
+        close_dog_cache()
+
     # Print a final message to the user
     print("\nHave a great day!")
 
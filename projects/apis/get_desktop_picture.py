@@ -5,7 +5,8 @@ import shutil
 
 from PIL import Image
 
-from config.secrets import API_NINJAS_KEY, IMAGE_FILE
+from api_ninjas import get_client
+from config.secrets import IMAGE_FILE
 
 
 def get_random_image(*, category: str = "nature", width: str = "3072", height: str = "1920"):
@@ -18,11 +19,13 @@ def get_random_image(*, category: str = "nature", width: str = "3072", height: s
 
     :return: a random image file based on the selected category
     """
-    # Set up the API URL with our set params
-    api_url = 'https://api.api-ninjas.com/v1/randomimage?category={}&width={}&height={}'.format(category, width, height)
-
-    # Send the GET request the defined URL and our personal authorization
-    response = requests.get(api_url, headers={'X-Api-Key': API_NINJAS_KEY, 'Accept': 'image/jpg'}, stream=True)
+    # Send the GET request with our set params through the shared client, which adds our personal authorization
+    response = get_client().get(
+        "randomimage",
+        params={"category": category, "width": width, "height": height},
+        headers={'Accept': 'image/jpg'},
+        stream=True
+    )
 
     # Check if the request was successful
     if response.status_code == requests.codes.ok:
@@ -0,0 +1,64 @@
+# Import the required libraries
+import statistics
+import sys
+import time
+
+import requests
+
+from api_ninjas import ApiNinjasClient
+from mock_api_server import MockApiServer
+
+
+# To compare a new connection for every request with reused connections, execute the following code in the terminal :
+#   python3 projects/apis/keepalive_benchmark.py 200
+
+
+def time_requests(send, count: int) -> list:
+    """
+    Send the same search again and again
+
+    :param send: (function) sends one request and returns the response
+    :param count: (int) how many requests to send
+
+    :return: the seconds each request took
+    """
+    times = []
+    for _ in range(count):
+        start = time.perf_counter()
+        response = send()
+        response.json()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main():
+    # args is a list of the command line arguments, optionally how many requests to send each way
+    args = sys.argv[1:]
+    count = int(args[0]) if args else 200
+
+    server = MockApiServer().start()
+    url = f"{server.url}/dogs"
+    params = {"energy": "3"}
+    try:
+        # What the scripts did before, a new TCP connection for every request
+        fresh = time_requests(lambda: requests.get(url, params=params, headers={"X-Api-Key": "local"}), count)
+
+        # The shared client keeps the connection open, so only its first request pays for the setup
+        with ApiNinjasClient("local", base_url=server.url) as client:
+            pooled = time_requests(lambda: client.get("dogs", params=params), count)
+    finally:
+        server.stop()
+
+    print(f"<---------- {count} Requests Each To A Local Server, Without TLS ---------->")
+    for label, times in (("requests.get:", fresh), ("ApiNinjasClient:", pooled)):
+        print(
+            f"{label:<18}median {statistics.median(times) * 1000:>6.2f} ms, "
+            f"mean {statistics.mean(times) * 1000:>6.2f} ms, total {sum(times):>6.2f} seconds"
+        )
+    print(f"Saved {(statistics.median(fresh) - statistics.median(pooled)) * 1000:.2f} ms per request")
+
+    # Over the internet every new connection also waits for a TCP and a TLS handshake, so the saving is far larger
+
+
+if __name__ == "__main__":
+    main()
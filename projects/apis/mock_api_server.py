@@ -0,0 +1,180 @@
+# Import the required libraries
+import json
+import random
+import sys
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# The most dogs the dogs API returns at once
+PAGE_SIZE = 20
+
+# The 0 to 5 rating fields a search can ask for exactly
+RATING_FIELDS = ("shedding", "barking", "energy", "protectiveness", "trainability")
+
+
+# To run the server, execute the following code in the terminal, then set API_NINJAS_URL=http://127.0.0.1:8000/v1 :
+#   python3 projects/apis/mock_api_server.py 8000 0.2
+
+
+def make_breeds(count: int = 400, *, seed: int = 0) -> list:
+    """
+    Create made up breeds with every field the dogs API returns
+
+    :param count: (int) how many breeds to create
+    :param seed: (int) the same seed always creates the same breeds
+
+    :return: a list of breed dictionaries, sorted by name like the API
+    """
+    generator = random.Random(seed)
+    breeds = []
+    for number in range(count):
+        min_weight = generator.randint(5, 120)
+        min_life = generator.randint(6, 14)
+        breed = {
+            "name": f"Breed {number:04d}",
+            "min_weight_male": min_weight,
+            "max_weight_male": min_weight + generator.randint(0, 40),
+            "min_weight_female": max(1, min_weight - 5),
+            "max_weight_female": min_weight + generator.randint(0, 30),
+            "min_life_expectancy": min_life,
+            "max_life_expectancy": min_life + generator.randint(0, 5),
+        }
+        for field in RATING_FIELDS:
+            breed[field] = generator.randint(1, 5)
+        breeds.append(breed)
+    return breeds
+
+
+def given(breed: dict, *fields) -> list:
+    """ Return the values of the fields the breed has, leaving out missing ones """
+    return [breed[field] for field in fields if breed.get(field) is not None]
+
+
+def matches(breed: dict, params: dict) -> bool:
+    """
+    Check if a breed matches a search
+
+    A weight or life expectancy limit matches when the breed's range overlaps it, ratings must match exactly.
+    A breed missing the field a limit or rating is checked against does not match it.
+
+    :param breed: (dict) a breed from make_breeds
+    :param params: (dict) the query params, each a string
+
+    :return: True if the breed should be returned, otherwise, False
+    """
+    heaviest = max(given(breed, "max_weight_male", "max_weight_female"), default=None)
+    lightest = min(given(breed, "min_weight_male", "min_weight_female"), default=None)
+    longest_life = breed.get("max_life_expectancy")
+    shortest_life = breed.get("min_life_expectancy")
+    if "min_weight" in params and (heaviest is None or heaviest < float(params["min_weight"])):
+        return False
+    if "max_weight" in params and (lightest is None or lightest > float(params["max_weight"])):
+        return False
+    if "min_life_expectancy" in params and (
+            longest_life is None or longest_life < float(params["min_life_expectancy"])
+    ):
+        return False
+    if "max_life_expectancy" in params and (
+            shortest_life is None or shortest_life > float(params["max_life_expectancy"])
+    ):
+        return False
+    return all(breed.get(field) == int(params[field]) for field in RATING_FIELDS if field in params)
+
+
+class MockApiHandler(BaseHTTPRequestHandler):
+    """ Answers /v1/dogs searches like api-ninjas, after waiting for the server's delay """
+
+    # Reuse connections between requests, like the real API
+    protocol_version = "HTTP/1.1"
+
+    # Send the headers and the body without waiting, otherwise a reused connection stalls for the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        time.sleep(self.server.delay)
+
+        with self.server.lock:
+            self.server.requests += 1
+            failure = self.server.failures.pop(0) if self.server.failures else None
+
+        if failure:
+            headers = {"Retry-After": str(self.server.retry_after)} if self.server.retry_after is not None else {}
+            self.reply(failure, {"error": "Injected failure."}, headers=headers)
+        elif not self.headers.get("X-Api-Key"):
+            self.reply(400, {"error": "Missing API key."})
+        elif url.path != "/v1/dogs":
+            self.reply(404, {"error": "Not found."})
+        else:
+            offset = int(params.pop("offset", 0))
+            found = [breed for breed in self.server.breeds if matches(breed, params)]
+            self.reply(200, found[offset:offset + PAGE_SIZE])
+
+    def reply(self, status: int, body, *, headers: dict = None) -> None:
+        """ Send a JSON response, with any extra headers given """
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args) -> None:
+        """ Keep the terminal quiet """
+
+
+class MockApiServer(ThreadingHTTPServer):
+    """ A local stand-in for api-ninjas with an injected delay, used to measure and test the API clients """
+
+    daemon_threads = True
+
+    def __init__(self, port: int = 0, *, delay: float = 0.0, breeds: list = None):
+        """
+        :param port: (int) the port to listen on, 0 picks a free port
+        :param delay: (float) the seconds every request waits before it is answered
+        :param breeds: (list) the breeds searched, defaults to make_breeds()
+        """
+        super().__init__(("127.0.0.1", port), MockApiHandler)
+        self.delay = delay
+        self.breeds = breeds if breeds is not None else make_breeds()
+        self.lock = threading.Lock()
+
+        # How many requests were received, and the status codes the next requests fail with, such as [429, 503]
+        self.requests = 0
+        self.failures = []
+
+        # The seconds every failure asks the client to wait in its Retry-After header, None sends no header
+        self.retry_after = None
+
+    @property
+    def url(self) -> str:
+        """ The base URL to use instead of https://api.api-ninjas.com/v1 """
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+    def start(self) -> "MockApiServer":
+        """ Serve requests in a background thread """
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        """ Stop serving requests """
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    # args is a list of the command line arguments, optionally the port and the delay in seconds
+    args = sys.argv[1:]
+    server = MockApiServer(int(args[0]) if args else 8000, delay=float(args[1]) if len(args) > 1 else 0.0)
+    print(f"Serving {len(server.breeds)} breeds at {server.url} with a {server.delay} second delay")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# Import the required libraries
+import threading
+
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class PagePrefetcher:
+    """ Fetches the next page of a search in the background while the current page is being read """
+
+    def __init__(self, fetch=None, *, page_size: int = 20, max_in_flight: int = 1):
+        """
+        :param fetch: (function) called with an offset, returning the page of results starting there
+        :param page_size: (int) how many results a full page has, the offset moves by this much
+        :param max_in_flight: (int) the most pages fetched in the background at once
+        """
+        self.fetch = fetch
+        self.page_size = page_size
+        self.max_in_flight = max_in_flight
+        self.executor = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="prefetch")
+        self.lock = threading.Lock()
+
+        # Every fetched or fetching page of the current search, by its offset
+        self.pages = {}
+
+        # The offsets of the pages fetched in the background that have not been used yet
+        self.prefetched = set()
+
+        # Increased by every cancel, so pages of an earlier search that arrive late are never kept
+        self.search = 0
+
+        # How many pages fetched in the background were used, and how many had to be fetched while waiting
+        self.prefetch_hits = 0
+        self.prefetch_misses = 0
+
+    def start(self, fetch) -> None:
+        """ Start a new search, dropping every page of the last one """
+        self.cancel()
+        self.fetch = fetch
+
+    def in_flight(self) -> int:
+        """ Return the number of pages still being fetched """
+        return sum(1 for page in self.pages.values() if not page.done())
+
+    def prefetch(self, offset: int) -> bool:
+        """
+        Start fetching a page in the background, unless it was already fetched or too many pages are being fetched
+
+        :param offset: (int) where the page starts
+
+        :return: True if the page started fetching, otherwise, False
+        """
+        with self.lock:
+            if offset in self.pages or self.in_flight() >= self.max_in_flight:
+                return False
+            self.pages[offset] = self.executor.submit(self.fetch, offset)
+            self.prefetched.add(offset)
+            return True
+
+    def get(self, offset: int) -> list:
+        """
+        Return a page, waiting for it if it is being fetched in the background, or fetching it now if it is not
+
+        Only this page and the pages just before and after it are kept afterwards.
+        A page read again from the ones kept counts as neither a prefetch hit nor a miss.
+
+        :param offset: (int) where the page starts
+
+        :return: the page of results
+        """
+        with self.lock:
+            search = self.search
+            page = self.pages.get(offset)
+            prefetched = offset in self.prefetched
+            self.prefetched.discard(offset)
+
+        result = None
+        if page is not None and not page.cancelled():
+            try:
+                result = page.result()
+                if prefetched:
+                    self.prefetch_hits += 1
+            except Exception:
+                # The background fetch failed, so try once more below where the error reaches the caller
+                result = None
+
+        if result is None:
+            self.prefetch_misses += 1
+            result = self.fetch(offset)
+            page = Future()
+            page.set_result(result)
+
+        # A page of a search cancelled while it was being waited for is returned but not kept
+        with self.lock:
+            if search == self.search:
+                self.pages[offset] = page
+                self.forget(keep=(offset - self.page_size, offset, offset + self.page_size))
+        return result
+
+    def forget(self, *, keep=()) -> None:
+        """ Drop every page except the ones kept, cancelling the ones that have not started fetching """
+        for offset in list(self.pages):
+            if offset not in keep:
+                self.pages.pop(offset).cancel()
+        self.prefetched.intersection_update(keep)
+
+    def cancel(self) -> None:
+        """
+        Drop every page, cancelling the ones that have not started fetching
+
+        A fetch that already started can not be interrupted, so it is left to finish on its own worker and its page
+        is thrown away, while the next search gets new workers instead of waiting for it.
+        """
+        with self.lock:
+            self.search += 1
+            running = self.in_flight()
+            self.forget()
+
+            if running:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="prefetch")
+
+    def close(self) -> None:
+        """ Cancel every page and stop the background worker """
+        self.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
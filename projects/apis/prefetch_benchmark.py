@@ -0,0 +1,69 @@
+# Import the required libraries
+import sys
+import time
+
+import dogs
+
+from api_ninjas import ApiNinjasClient, set_client
+from mock_api_server import MockApiServer
+from page_prefetcher import PagePrefetcher
+from query_cache import QueryCache
+
+
+# To compare paging with and without prefetching, execute the following code in the terminal :
+#   python3 projects/apis/prefetch_benchmark.py 0.3 1.0
+
+
+def turn_pages(pages: PagePrefetcher, *, prefetch: bool, reading: float, count: int) -> list:
+    """
+    Read pages one after another, like a user who always asks for the next list
+
+    :param pages: (PagePrefetcher) where the pages come from
+    :param prefetch: (bool) fetch the next page in the background while the current one is read
+    :param reading: (float) the seconds spent reading each page
+    :param count: (int) how many pages to turn
+
+    :return: the seconds spent waiting for each page after asking for it
+    """
+    waits = []
+    pages.start(lambda offset: dogs.get_dog_options(offset=offset, bypass_cache=True))
+    for number in range(count):
+        start = time.perf_counter()
+        found = pages.get(number * 20)
+        waits.append(time.perf_counter() - start)
+
+        if prefetch and len(found) == 20:
+            pages.prefetch((number + 1) * 20)
+        time.sleep(reading)
+    return waits
+
+
+def main():
+    # args is a list of the command line arguments, optionally the server delay and the reading time in seconds
+    args = sys.argv[1:]
+    delay = float(args[0]) if args else 0.3
+    reading = float(args[1]) if len(args) > 1 else 1.0
+
+    # Point the dog searches at a local server and keep the saved searches out of the measurement
+    server = MockApiServer(delay=delay).start()
+    set_client(ApiNinjasClient("local", base_url=server.url))
+    dogs.dog_cache = QueryCache(":memory:")
+
+    pages = PagePrefetcher()
+    try:
+        without = turn_pages(pages, prefetch=False, reading=reading, count=5)
+        with_prefetch = turn_pages(pages, prefetch=True, reading=reading, count=5)
+    finally:
+        pages.close()
+        server.stop()
+
+    print(f"<---------- 5 Pages, {delay} Second Server Delay, {reading} Seconds Reading Each ---------->")
+    for label, waits in (("Without prefetching:", without), ("With prefetching:", with_prefetch)):
+        print(
+            f"{label:<22}first page {waits[0] * 1000:>7.1f} ms, "
+            f"next pages {sum(waits[1:]) / len(waits[1:]) * 1000:>7.1f} ms on average"
+        )
+
+
+if __name__ == "__main__":
+    main()
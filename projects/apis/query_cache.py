@@ -0,0 +1,120 @@
+# Import the required libraries
+import json
+import sqlite3
+import threading
+import time
+
+
+class QueryCache:
+    """ Saves API responses in a SQLite file by their query, so repeated queries skip the API """
+
+    def __init__(self, path: str, *, ttl: float = 7 * 24 * 60 * 60, max_entries: int = 1000, clock=time.time):
+        """
+        :param path: (str) the SQLite file the responses are saved in, ":memory:" keeps them only while running
+        :param ttl: (float) how many seconds a saved response is used before the API is asked again
+        :param max_entries: (int) the most responses saved, the least recently used ones are removed first
+        :param clock: (function) returns the current time in seconds, tests pass one they control
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+
+        # When each query was last used, kept in memory until the next write instead of a write for every hit
+        self.used = {}
+
+        # The connection is shared by every thread, such as background page fetches, so it is used under a lock
+        self.lock = threading.RLock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+
+        # Only wait for the disk at checkpoints instead of every write, a crash can lose the last few responses
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "query TEXT PRIMARY KEY, response TEXT NOT NULL, saved REAL NOT NULL, used REAL NOT NULL)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS responses_used ON responses (used)")
+        self.connection.commit()
+
+    @staticmethod
+    def key(params: dict) -> str:
+        """ Return the same text for the same query params, whatever order they were given in """
+        return json.dumps(params, sort_keys=True, separators=(",", ":"))
+
+    def get(self, params: dict):
+        """
+        Return the saved response for the query params, or None if there is none or it is too old
+
+        :param params: (dict) the query params, including the offset
+
+        :return: the saved response, loaded from JSON
+        """
+        key = self.key(params)
+        now = self.clock()
+        with self.lock:
+            row = self.connection.execute("SELECT response, saved FROM responses WHERE query = ?", (key,)).fetchone()
+
+            if row is None or now - row[1] > self.ttl:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.used[key] = now
+        return json.loads(row[0])
+
+    def save_used(self) -> None:
+        """ Write when each query was last used to the file, as part of the next commit """
+        if self.used:
+            self.connection.executemany(
+                "UPDATE responses SET used = ? WHERE query = ?", [(used, key) for key, used in self.used.items()]
+            )
+            self.used = {}
+
+    def put(self, params: dict, response) -> None:
+        """
+        Save the response for the query params, removing the least recently used responses if there are too many
+
+        :param params: (dict) the query params, including the offset
+        :param response: anything that can be saved as JSON, such as the list of dogs returned by the API
+        """
+        now = self.clock()
+        with self.lock:
+            # The least recently used responses can only be found once every use is in the file
+            self.save_used()
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses (query, response, saved, used) VALUES (?, ?, ?, ?)",
+                (self.key(params), json.dumps(response), now, now)
+            )
+
+            # Expired responses go first, then the least recently used ones beyond the limit
+            self.connection.execute("DELETE FROM responses WHERE saved < ?", (now - self.ttl,))
+            self.connection.execute(
+                "DELETE FROM responses WHERE query IN "
+                "(SELECT query FROM responses ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            self.connection.commit()
+
+    def clear(self) -> None:
+        """ Remove every saved response """
+        with self.lock:
+            self.used = {}
+            self.connection.execute("DELETE FROM responses")
+            self.connection.commit()
+
+    def __len__(self) -> int:
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def stats(self) -> dict:
+        """ Return the number of hits, misses, and saved responses """
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self)}
+
+    def close(self) -> None:
+        """ Save when each query was last used and close the SQLite file """
+        with self.lock:
+            self.save_used()
+            self.connection.commit()
+            self.connection.close()
@@ -0,0 +1,102 @@
+# Import the required libraries
+import socket
+import sys
+import types
+import unittest
+import pytest
+from unittest.mock import patch
+
+import requests
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+import api_ninjas
+from api_ninjas import ApiNinjasClient, get_client, set_client
+from mock_api_server import MockApiServer
+
+
+class TestApiNinjasClient(unittest.TestCase):
+    """ Test the shared API client against a local server that fails on purpose """
+
+    def setUp(self):
+        """ Run this code before every test """
+        self.server = MockApiServer().start()
+        self.client = ApiNinjasClient("local", base_url=self.server.url, retries=2, backoff=0.5, max_retry_after=10)
+
+        # Record every wait of the client instead of sleeping, with no jitter so the waits are exact
+        # Only the client's modules are replaced, the server still uses the real time and random modules
+        self.sleeps = []
+        self.patchers = [
+            patch("api_ninjas.time", types.SimpleNamespace(sleep=self.sleeps.append)),
+            patch("api_ninjas.random", types.SimpleNamespace(uniform=lambda low, high: 1.0)),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self):
+        """ Run this code after every test """
+        for patcher in self.patchers:
+            patcher.stop()
+        self.client.close()
+        self.server.stop()
+
+    def test_retries_busy_and_broken_responses(self):
+        """ Test that 429 and 5xx responses are retried with a doubling wait until one succeeds """
+        self.server.failures = [429, 503]
+
+        response = self.client.get("dogs", params={"energy": "3"})
+        assert response.status_code == 200 and response.json()
+        assert self.server.requests == 3
+        assert self.sleeps == [0.5, 1.0]
+
+    def test_last_error_returned(self):
+        """ Test that the last error response is returned once every retry is used, and other errors are not retried """
+        self.server.failures = [500, 502, 504]
+        assert self.client.get("dogs").status_code == 504
+        assert self.server.requests == 3
+
+        assert self.client.get("cats").status_code == 404
+        assert self.server.requests == 4
+
+    def test_retry_after(self):
+        """ Test that a longer Retry-After is waited for, but never longer than max_retry_after """
+        self.server.failures = [429, 429]
+        self.server.retry_after = 3
+        assert self.client.get("dogs").status_code == 200
+
+        self.server.failures = [503]
+        self.server.retry_after = 3600
+        assert self.client.get("dogs").status_code == 200
+
+        assert self.sleeps == [3, 3, 10]
+
+    def test_connection_errors_retried(self):
+        """ Test that a server that can not be reached is tried again, and the error is raised after the last try """
+        with socket.socket() as closed:
+            closed.bind(("127.0.0.1", 0))
+            port = closed.getsockname()[1]
+
+        with ApiNinjasClient("local", base_url=f"http://127.0.0.1:{port}/v1", retries=2, backoff=0.5) as client:
+            with pytest.raises(requests.ConnectionError):
+                client.get("dogs")
+        assert self.sleeps == [0.5, 1.0]
+
+    def test_get_and_set_client(self):
+        """ Test that the shared client is made once from the secrets file, and can be replaced """
+        secrets = types.ModuleType("config.secrets")
+        secrets.API_NINJAS_KEY = "secret"
+        config = types.ModuleType("config")
+        config.secrets = secrets
+
+        previous = set_client(None)
+        try:
+            with patch.dict(sys.modules, {"config": config, "config.secrets": secrets}):
+                shared = get_client()
+                assert shared.session.headers["X-Api-Key"] == "secret"
+                assert get_client() is shared
+
+            assert set_client(self.client) is shared
+            assert get_client() is self.client and api_ninjas.shared_client is self.client
+            shared.close()
+        finally:
+            set_client(previous)
@@ -0,0 +1,71 @@
+# Import the required libraries
+import random
+import sys
+import unittest
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+from breed_index import PAGE_SIZE, BreedIndex, RangeIndex, drop_lowest
+from mock_api_server import RATING_FIELDS, make_breeds, matches
+
+
+def random_params(generator: random.Random) -> dict:
+    """ Pick a few of the params get_dog_options sends, as strings like the API receives them """
+    choices = {
+        "min_weight": lambda: str(generator.randint(0, 170)),
+        "max_weight": lambda: str(generator.randint(0, 170)),
+        "min_life_expectancy": lambda: str(generator.randint(5, 20)),
+        "max_life_expectancy": lambda: str(generator.randint(5, 20)),
+        **{field: lambda: str(generator.randint(0, 5)) for field in RATING_FIELDS},
+    }
+    return {name: choices[name]() for name in generator.sample(sorted(choices), generator.randint(0, 3))}
+
+
+class TestBreedIndex(unittest.TestCase):
+    """ Test searching saved breeds without the API """
+
+    def setUp(self):
+        """ Run this code before every test """
+        self.breeds = make_breeds()
+        self.index = BreedIndex(self.breeds)
+
+    def test_matches_mock_server(self):
+        """ Test that every search finds the same breeds, in the same pages, as the mock API """
+        generator = random.Random(1)
+        for _ in range(300):
+            params = random_params(generator)
+            expected = [breed for breed in self.breeds if matches(breed, params)]
+
+            assert self.index.search(**params, limit=None) == expected
+            assert self.index.count(**params) == len(expected)
+            offset = generator.randint(0, len(expected))
+            assert self.index.search(**params, offset=offset) == expected[offset:offset + PAGE_SIZE]
+
+    def test_missing_fields(self):
+        """ Test that a breed missing a field never matches a limit on it, the same as the mock API """
+        breeds = make_breeds(50)
+        for number, breed in enumerate(breeds):
+            for field in ("max_weight_male", "max_weight_female", "min_life_expectancy", "energy")[:number % 5]:
+                del breed[field]
+        index = BreedIndex(breeds)
+
+        generator = random.Random(2)
+        for _ in range(100):
+            params = random_params(generator)
+            assert index.search(**params, limit=None) == [breed for breed in breeds if matches(breed, params)]
+
+    def test_range_index(self):
+        """ Test at least and at most limits, including breeds without a value """
+        index = RangeIndex([5, None, 1, 5, 3])
+
+        assert index.at_least(3) == 0b11001
+        assert index.at_most(3) == 0b10100
+        assert index.at_least(6) == 0
+        assert index.at_most(5) == 0b11101
+
+    def test_drop_lowest(self):
+        """ Test skipping the first set bits of a bitmap """
+        assert drop_lowest(0b101101, 0) == 0b101101
+        assert drop_lowest(0b101101, 2) == 0b101000
+        assert drop_lowest(0b101101, 4) == 0
+        assert drop_lowest(1 << 5000 | 1 << 3000 | 1, 2) == 1 << 5000
@@ -0,0 +1,145 @@
+# Import the required libraries
+import json
+import os
+import sys
+import tempfile
+import unittest
+import pytest
+from unittest.mock import patch
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+from dog_crawler import PAGE_SIZE, DogCrawler, RateLimiter
+
+
+class FakeTime:
+    """ Stands in for the time module, only moving forward when something sleeps """
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def perf_counter(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeSearch:
+    """ Answers every partition from its own list of breeds, recording each page asked for """
+
+    def __init__(self, breeds: dict):
+        """
+        :param breeds: (dict) the breed names of every partition, by the partition's energy
+        """
+        self.breeds = breeds
+        self.fetched = []
+
+        # Called before a page is returned, such as to fail it on purpose
+        self.before = None
+
+    def __call__(self, params: dict, offset: int) -> list:
+        self.fetched.append((params["energy"], offset))
+        if self.before:
+            self.before(params, offset)
+        names = self.breeds[params["energy"]][offset:offset + PAGE_SIZE]
+        return [{"name": name, "energy": params["energy"]} for name in names]
+
+
+def breed_names(start: int, count: int) -> list:
+    """ Return count numbered breed names """
+    return [f"Breed {number:04d}" for number in range(start, start + count)]
+
+
+class TestDogCrawler(unittest.TestCase):
+    """ Test crawling every page of several searches with a fake fetch """
+
+    def setUp(self):
+        """ Run this code before every test """
+        self.folder = tempfile.TemporaryDirectory()
+        self.output_path = os.path.join(self.folder.name, "breeds.jsonl")
+        self.search = FakeSearch({"1": breed_names(0, 45), "2": breed_names(100, 20), "3": []})
+        self.partitions = [{"energy": "1"}, {"energy": "2"}, {"energy": "3"}]
+
+    def tearDown(self):
+        """ Run this code after every test """
+        self.folder.cleanup()
+
+    def saved_names(self) -> list:
+        """ Return the name of every breed in the output file, in the order they were saved """
+        with open(self.output_path) as file:
+            return [json.loads(line)["name"] for line in file]
+
+    def test_rate_limiter(self):
+        """ Test that a burst starts at once, and later requests wait for the rate """
+        clock = FakeTime()
+        with patch("dog_crawler.time", clock):
+            # Quarter seconds add up exactly, so the fake clock lands right on every refill
+            limiter = RateLimiter(4, burst=2)
+            for _ in range(4):
+                limiter.wait()
+
+            RateLimiter(None).wait()
+
+        assert clock.sleeps == [0.25, 0.25]
+
+    def test_short_page_ends_partition(self):
+        """ Test that each partition stops at its first page with fewer than PAGE_SIZE breeds """
+        report = DogCrawler(self.search, partitions=self.partitions, workers=2).crawl(self.output_path)
+
+        assert sorted(self.search.fetched) == [("1", 0), ("1", 20), ("1", 40), ("2", 0), ("2", 20), ("3", 0)]
+        assert report["pages"] == 6 and report["breeds"] == 65
+        assert sorted(self.saved_names()) == breed_names(0, 45) + breed_names(100, 20)
+
+    def test_names_saved_once(self):
+        """ Test that a breed found by more than one partition, or by an earlier crawl, is saved once """
+        self.search.breeds["3"] = breed_names(10, 5)
+        DogCrawler(self.search, partitions=self.partitions, workers=1).crawl(self.output_path)
+        assert len(self.saved_names()) == 65
+
+        os.remove(self.output_path + ".checkpoint")
+        report = DogCrawler(self.search, partitions=self.partitions, workers=1).crawl(self.output_path)
+        assert report["breeds"] == 0 and len(self.saved_names()) == 65
+
+    def test_resume_from_checkpoint(self):
+        """ Test that a crawl stopped by an error continues from the pages it had finished """
+        def stop_at_second_page(params: dict, offset: int) -> None:
+            if params["energy"] == "1" and offset == 20:
+                raise Exception("Stopped on purpose.")
+
+        self.search.before = stop_at_second_page
+        with pytest.raises(Exception):
+            DogCrawler(self.search, partitions=self.partitions, workers=1).crawl(self.output_path)
+        with open(self.output_path + ".checkpoint") as file:
+            assert json.load(file)['{"energy": "1"}'] == 20
+
+        self.search.before = None
+        self.search.fetched = []
+        DogCrawler(self.search, partitions=self.partitions, workers=1).crawl(self.output_path)
+
+        assert ("1", 0) not in self.search.fetched
+        assert sorted(self.saved_names()) == breed_names(0, 45) + breed_names(100, 20)
+
+    def test_only_temporary_errors_retried(self):
+        """ Test that connection errors are retried, and any other error stops the crawl without retrying """
+        failures = [ConnectionError("Dropped.")]
+
+        def fail_first(params: dict, offset: int) -> None:
+            if failures:
+                raise failures.pop()
+
+        self.search.before = fail_first
+        crawler = DogCrawler(self.search, partitions=self.partitions[:1], workers=1, retries=2, backoff=0)
+        crawler.crawl(self.output_path)
+        assert crawler.retried == 1 and crawler.requests == 4
+
+        failures.append(Exception("API Request Status Code: 400."))
+        crawler = DogCrawler(self.search, partitions=self.partitions[1:2], workers=1, retries=2, backoff=0)
+        with pytest.raises(Exception, match="400"):
+            crawler.crawl(self.output_path)
+        assert crawler.retried == 0 and crawler.requests == 1
@@ -0,0 +1,96 @@
+# Import the required libraries
+import sys
+import threading
+import unittest
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+from page_prefetcher import PagePrefetcher
+
+
+class FakeSearch:
+    """ Returns pages of numbered results and records every offset fetched, waiting for the offsets told to wait """
+
+    def __init__(self, name: str, *, wait=()):
+        self.name = name
+        self.fetched = []
+
+        # Called at the start of every fetch, such as to cancel the search from somewhere else meanwhile
+        self.during = None
+
+        # Set once a waiting fetch has started, and released by the test to let it finish
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.wait = set(wait)
+
+    def __call__(self, offset: int) -> list:
+        self.fetched.append(offset)
+        if self.during:
+            self.during()
+        if offset in self.wait:
+            self.started.set()
+            self.release.wait(5)
+        return [f"{self.name}{offset + number}" for number in range(2)]
+
+
+class TestPagePrefetcher(unittest.TestCase):
+    """ Test fetching the next page of a search in the background """
+
+    def setUp(self):
+        """ Run this code before every test """
+        self.search = FakeSearch("a")
+        self.pages = PagePrefetcher(self.search, page_size=2)
+
+    def tearDown(self):
+        """ Run this code after every test """
+        self.search.release.set()
+        self.pages.close()
+
+    def test_prefetch_hit(self):
+        """ Test that a page fetched in the background is used instead of fetching it again """
+        assert self.pages.prefetch(2)
+        assert not self.pages.prefetch(2)
+
+        assert self.pages.get(2) == ["a2", "a3"]
+        assert self.search.fetched == [2]
+        assert (self.pages.prefetch_hits, self.pages.prefetch_misses) == (1, 0)
+
+    def test_miss_and_pages_read_again(self):
+        """ Test that a page nobody prefetched is a miss, and reading a kept page again is neither a hit nor a miss """
+        assert self.pages.get(0) == ["a0", "a1"]
+        assert self.pages.get(2) == ["a2", "a3"]
+        assert self.pages.get(0) == ["a0", "a1"]
+
+        assert self.search.fetched == [0, 2]
+        assert (self.pages.prefetch_hits, self.pages.prefetch_misses) == (0, 2)
+
+        # Only the pages next to the last one read are kept
+        self.pages.get(6)
+        assert sorted(self.pages.pages) == [6]
+
+    def test_cancel_running_fetch(self):
+        """ Test that a new search does not wait for a fetch of the last search, and never keeps its page """
+        self.search.wait = {2}
+        self.pages.prefetch(2)
+        assert self.search.started.wait(5)
+
+        new_search = FakeSearch("b")
+        self.pages.start(new_search)
+        assert self.pages.in_flight() == 0
+
+        # The old fetch is still running, but the new search has a worker of its own
+        assert self.pages.prefetch(2)
+        assert self.pages.pages[2].result(timeout=1) == ["b2", "b3"]
+        assert self.pages.get(2) == ["b2", "b3"]
+        assert self.pages.prefetch_hits == 1
+
+        self.search.release.set()
+        assert self.pages.get(2) == ["b2", "b3"]
+        assert new_search.fetched == [2]
+
+    def test_cancel_while_waiting(self):
+        """ Test that a page being waited for when its search is cancelled is returned but not kept """
+        self.search.during = self.pages.cancel
+
+        assert self.pages.get(0) == ["a0", "a1"]
+        assert self.pages.pages == {}
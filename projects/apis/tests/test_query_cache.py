@@ -0,0 +1,131 @@
+# Import the required libraries
+import sys
+import unittest
+from unittest.mock import patch
+
+# These red lines are expected and pytest will work
+sys.path.append(sys.path[0] + '/..')
+import dogs
+from api_ninjas import ApiNinjasClient, set_client
+from mock_api_server import MockApiServer
+from query_cache import QueryCache
+
+
+class FakeClock:
+    """ A clock that only moves when the test moves it """
+
+    def __init__(self, value: float = 1000.0):
+        self.value = value
+
+    def __call__(self) -> float:
+        return self.value
+
+
+class TestQueryCache(unittest.TestCase):
+    """ Test saving API responses by their query """
+
+    def setUp(self):
+        """ Run this code before every test """
+        self.clock = FakeClock()
+        self.cache = QueryCache(":memory:", ttl=60, max_entries=2, clock=self.clock)
+
+    def tearDown(self):
+        """ Run this code after every test """
+        self.cache.close()
+
+    def test_get_and_put(self):
+        """ Test that a saved response is found by its params in any order """
+        assert self.cache.get({"energy": "3", "offset": "20"}) is None
+        self.cache.put({"offset": "20", "energy": "3"}, [{"name": "Beagle"}])
+
+        assert self.cache.get({"energy": "3", "offset": "20"}) == [{"name": "Beagle"}]
+        assert self.cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+    def test_ttl_expiry(self):
+        """ Test that a response older than the ttl is no longer used, and is removed by the next save """
+        self.cache.put({"energy": "1"}, ["old"])
+        self.clock.value += 60
+        assert self.cache.get({"energy": "1"}) == ["old"]
+
+        self.clock.value += 1
+        assert self.cache.get({"energy": "1"}) is None
+
+        self.cache.put({"energy": "2"}, ["new"])
+        assert len(self.cache) == 1
+
+    def test_lru_eviction(self):
+        """ Test that the least recently used response is removed first, counting hits that were not written yet """
+        self.cache.put({"energy": "1"}, ["one"])
+        self.clock.value += 1
+        self.cache.put({"energy": "2"}, ["two"])
+        self.clock.value += 1
+
+        # Using the first response makes the second one the least recently used
+        assert self.cache.get({"energy": "1"}) == ["one"]
+        self.clock.value += 1
+        self.cache.put({"energy": "3"}, ["three"])
+
+        assert len(self.cache) == 2
+        assert self.cache.get({"energy": "1"}) == ["one"]
+        assert self.cache.get({"energy": "2"}) is None
+
+    def test_hits_do_not_write(self):
+        """ Test that a hit only remembers when it was used, which is written with the next save """
+        self.cache.put({"energy": "1"}, ["one"])
+        self.clock.value += 5
+
+        changes = self.cache.connection.total_changes
+        for _ in range(3):
+            self.cache.get({"energy": "1"})
+        assert self.cache.connection.total_changes == changes
+        assert self.cache.used == {QueryCache.key({"energy": "1"}): 1005}
+
+        self.cache.put({"energy": "2"}, ["two"])
+        used = self.cache.connection.execute("SELECT used FROM responses WHERE query = ?", ('{"energy":"1"}',))
+        assert used.fetchone()[0] == 1005
+        assert self.cache.used == {}
+
+
+class TestDogCache(unittest.TestCase):
+    """ Test how get_dog_options uses the cache """
+
+    def setUp(self):
+        """ Run this code before every test """
+        self.server = MockApiServer().start()
+        self.previous = set_client(ApiNinjasClient("local", base_url=self.server.url))
+        self.cache = QueryCache(":memory:")
+        self.patcher = patch("dogs.dog_cache", self.cache)
+        self.patcher.start()
+
+    def tearDown(self):
+        """ Run this code after every test """
+        self.patcher.stop()
+        self.cache.close()
+        set_client(self.previous).close()
+        self.server.stop()
+
+    def test_saved_search_skips_the_api(self):
+        """ Test that repeating a search is answered by the cache """
+        first = dogs.get_dog_options(energy="3")
+        assert dogs.get_dog_options(energy="3") == first
+        assert self.server.requests == 1
+
+    def test_bypass_cache(self):
+        """ Test that bypass_cache always asks the API, and still saves the response for later searches """
+        dogs.get_dog_options(energy="3")
+        second = dogs.get_dog_options(energy="3", bypass_cache=True)
+        assert self.server.requests == 2
+
+        assert dogs.get_dog_options(energy="3") == second
+        assert self.server.requests == 2
+        assert self.cache.stats()["hits"] == 1
+
+    def test_close_dog_cache(self):
+        """ Test that a closed cache is forgotten, so the next search opens a new one instead of using the closed one """
+        with patch("dogs.CACHE_PATH", ":memory:"), patch("dogs.dog_cache", QueryCache(":memory:")):
+            dogs.close_dog_cache()
+            assert dogs.dog_cache is None
+
+            dogs.get_dog_options(energy="3")
+            assert dogs.dog_cache.stats()["entries"] == 1
+            dogs.close_dog_cache()